@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""Benchmark: parse_boxscore_data() over a season's worth of recorded game feeds.
+
+Run from the repository root:
+
+    python benchmarks/bench_boxscore.py [--games N] [--against REV]
+
+The 9, 12 and 15-inning game feeds recorded in
+benchmarks/fixtures/parsers.jsonl.gz are decoded once, then parsed in turn
+until --games boxscores have been built, as both dicts of strings (the
+boxscore_data() output) and compact BatterRow/PitcherRow rows. Decoding is
+left out, so the times are the parsing alone.
+
+--against times the parse_boxscore_data() of an earlier git revision on the
+same feeds and checks that its output matches the current one.
+
+Measured with --games 300 --against c00e04b (the last revision before the
+per-player rewrite):
+
+    c00e04b   about 210 us/game
+    dict      about  76 us/game  (2.7-2.8x)
+    compact   about  61 us/game  (3.4-3.5x)
+
+The dict output is under 3x faster. Most of what remains is the per-player
+dict lookups and row construction that any parse of the feed has to do.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+import types
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+import statsapi  # noqa: E402
+from statsapi import parsers  # noqa: E402
+from statsapi.transport import ReplayTransport  # noqa: E402
+
+FIXTURES = os.path.join(HERE, "fixtures", "parsers.jsonl.gz")
+
+GAMES = [565997, 565998, 565999]
+"""gamePks of the recorded feeds"""
+
+
+def load_feeds():
+    """Return the decoded game responses boxscore_data() requests."""
+    client = statsapi.StatsAPIClient(transport=ReplayTransport(FIXTURES))
+    return [
+        client.get("game", parsers.boxscore_data_params(gamePk)) for gamePk in GAMES
+    ]
+
+
+def load_revision(rev):
+    """Return the parsers module as it was at a git revision."""
+    source = subprocess.check_output(
+        ["git", "show", "%s:statsapi/parsers.py" % rev], cwd=os.path.join(HERE, "..")
+    )
+    module = types.ModuleType("parsers_" + rev)
+    exec(compile(source, "parsers.py@" + rev, "exec"), module.__dict__)
+    return module
+
+
+def timed(fn, feeds, games, repeat):
+    """Return the best seconds taken to parse games boxscores."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(games):
+            fn(feeds[i % len(feeds)])
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--games", type=int, default=2430, help="boxscores per run (default: 2430)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument("--against", help="git revision to compare with")
+    args = parser.parse_args(argv)
+
+    feeds = load_feeds()
+    cases = [
+        ("dict", parsers.parse_boxscore_data),
+        ("compact", lambda r: parsers.parse_boxscore_data(r, compact=True)),
+    ]
+    if args.against:
+        previous = load_revision(args.against)
+        for r in feeds:
+            if previous.parse_boxscore_data(r) != parsers.parse_boxscore_data(r):
+                print("Output differs from %s" % args.against)
+                return 1
+        cases.insert(0, (args.against, previous.parse_boxscore_data))
+
+    print("{:<12} {:>10} {:>12} {:>10}".format("rows", "s", "us/game", "speedup"))
+    reference = None
+    for name, fn in cases:
+        seconds = timed(fn, feeds, args.games, args.repeat)
+        reference = reference or seconds
+        print(
+            "{:<12} {:>10.3f} {:>12.1f} {:>9.1f}x".format(
+                name, seconds, seconds / args.games * 1e6, reference / seconds
+            )
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""Benchmark: decoding game live feeds with each installed JSON decoder.
+
+Run from the repository root:
+
+    python benchmarks/bench_decoding.py [iterations]
+
+Feeds come from benchmarks/feeds.py (synthetic stand-ins for recorded
+/v1.1/game/{gamePk}/feed/live responses). "requests" is the old path,
+Response.json(), which decodes the body to text before parsing it. For each
+decoder, the memory held by 20 decoded feeds is reported with and without
+key interning.
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from statsapi import decoding  # noqa: E402
+
+import feeds  # noqa: E402
+
+GAMES = [565997 + i for i in range(20)]
+
+
+def requests_json(body):
+    r = requests.Response()
+    r._content = body
+    r.status_code = 200
+    return r.json()
+
+
+def retained(loads, bodies):
+    tracemalloc.start()
+    data = [loads(body) for body in bodies]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del data
+    return size
+
+
+def main(iterations=20):
+    bodies = [feeds.live_feed_body(pk, plays_per_half=8) for pk in GAMES]
+    print(
+        "{} feeds, {:.2f} MB each on average\n".format(
+            len(bodies), sum(len(b) for b in bodies) / len(bodies) / 1000000
+        )
+    )
+    decoders = [("requests", requests_json, None)] + [
+        (
+            name,
+            decoding.get_decoder(name),
+            decoding.get_decoder(name, intern_keys=True),
+        )
+        for name in decoding.available()
+    ]
+    expected = requests_json(bodies[0])
+    print(
+        "{:<10} {:>10} {:>12} {:>12} {:>14}".format(
+            "decoder", "ms/feed", "interned", "MB retained", "MB (interned)"
+        )
+    )
+    for name, loads, interning_loads in decoders:
+        assert loads(bodies[0]) == expected
+        best = min(timeit.repeat(lambda: loads(bodies[0]), number=iterations, repeat=3))
+        row = [name, "{:.2f}".format(best / iterations * 1000)]
+        if interning_loads is not None:
+            assert interning_loads(bodies[0]) == expected
+            best = min(
+                timeit.repeat(
+                    lambda: interning_loads(bodies[0]), number=iterations, repeat=3
+                )
+            )
+            row.append("{:.2f}".format(best / iterations * 1000))
+        else:
+            row.append("-")
+
+        row.append("{:.1f}".format(retained(loads, bodies) / 1000000))
+        if interning_loads is not None:
+            row.append("{:.1f}".format(retained(interning_loads, bodies) / 1000000))
+        else:
+            row.append("-")
+
+        print("{:<10} {:>10} {:>12} {:>12} {:>14}".format(*row))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""Benchmark: bytes and time per poll, full live feed vs. diffPatch updates.
+
+Run from the repository root:
+
+    python benchmarks/bench_live.py [polls]
+
+Replays the middle of a game one play per poll. "full" decodes the whole
+feed at each poll, as a poller re-downloading the game endpoint would;
+"diffPatch" decodes a game_diff response holding the changes since the
+previous poll and applies it with statsapi.live.apply_patch(), as
+GameFollower does. Feeds and patches come from benchmarks/feeds.py.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from statsapi import decoding, live  # noqa: E402
+
+import feeds  # noqa: E402
+
+
+def main(polls=20):
+    feed = feeds.live_feed(plays_per_half=8)
+    first = len(feed["liveData"]["plays"]["allPlays"]) // 2
+    states = [feeds.live_feed_at(feed, n) for n in range(first, first + polls + 1)]
+    full_bodies = [feeds.dumps(s).encode() for s in states[1:]]
+    diff_bodies = [
+        feeds.dumps([{"diff": feeds.make_patch(old, new)}]).encode()
+        for old, new in zip(states, states[1:])
+    ]
+
+    start = time.perf_counter()
+    for body in full_bodies:
+        data = decoding.loads(body)
+    full_time = time.perf_counter() - start
+
+    data = decoding.loads(feeds.dumps(states[0]).encode())
+    start = time.perf_counter()
+    for body in diff_bodies:
+        for patch in decoding.loads(body):
+            data = live.apply_patch(data, patch["diff"])
+    diff_time = time.perf_counter() - start
+
+    assert data == decoding.loads(full_bodies[-1]), "patched feed differs"
+    print("{} polls, one play each\n".format(polls))
+    print("{:<10} {:>14} {:>14}".format("mode", "KB per poll", "ms per poll"))
+    for name, bodies, elapsed in [
+        ("full", full_bodies, full_time),
+        ("diffPatch", diff_bodies, diff_time),
+    ]:
+        print(
+            "{:<10} {:>14.1f} {:>14.3f}".format(
+                name,
+                sum(len(b) for b in bodies) / len(bodies) / 1000,
+                elapsed / polls * 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
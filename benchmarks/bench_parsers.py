@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+"""Benchmark: time and peak memory of the parsing functions on recorded payloads.
+
+Run from the repository root:
+
+    python benchmarks/bench_parsers.py [--repeat N] [--tolerance T] [--save-baseline]
+
+Each case calls a public StatsAPIClient function over a ReplayTransport
+serving benchmarks/fixtures/parsers.jsonl.gz (a full-season schedule,
+9, 12 and 15-inning game feeds, a season's sports_players roster and both
+leagues' standings), so the times cover decoding and parsing with no network.
+The archive is written by benchmarks/make_fixtures.py.
+
+Results are compared with benchmarks/baseline.json: a case fails if it is
+more than the tolerance slower or uses more than the tolerance more memory,
+or if its output no longer matches the recorded digest. The script exits
+with status 1 if any case fails. Timings depend on the machine, so save a
+baseline (--save-baseline) on the machine that runs the comparison.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+import statsapi  # noqa: E402
+from statsapi.transport import ReplayTransport  # noqa: E402
+
+FIXTURES = os.path.join(HERE, "fixtures", "parsers.jsonl.gz")
+BASELINE = os.path.join(HERE, "baseline.json")
+
+GAMES = [565997, 565998, 565999]
+"""gamePks of the recorded feeds; make_fixtures.py gives them 9, 12 and 15 innings"""
+
+SEASON = 2023
+
+MIN_SLOWDOWN_MS = 0.5
+"""Slowdowns smaller than this are timer noise, whatever the tolerance"""
+
+
+def _each_game(fn):
+    return lambda client: [fn(client, gamePk) for gamePk in GAMES]
+
+
+CASES = [
+    (
+        "schedule",
+        lambda client: client.schedule(
+            start_date="03/30/%d" % SEASON, end_date="10/01/%d" % SEASON
+        ),
+    ),
+    ("boxscore_data", _each_game(lambda c, gamePk: c.boxscore_data(gamePk))),
+    ("boxscore", _each_game(lambda c, gamePk: c.boxscore(gamePk))),
+    ("linescore", _each_game(lambda c, gamePk: c.linescore(gamePk))),
+    (
+        "game_scoring_play_data",
+        _each_game(lambda c, gamePk: c.game_scoring_play_data(gamePk)),
+    ),
+    ("standings_data", lambda client: client.standings_data(season=SEASON)),
+    (
+        "lookup_player",
+        lambda client: [
+            client.lookup_player(name, season=SEASON)
+            for name in ["smith", "juan soto", "nobody"]
+        ],
+    ),
+]
+
+
+def digest(result):
+    """Return a short hash of a function's output, to detect changes in parsing."""
+    data = json.dumps(result, sort_keys=True, default=repr).encode()
+    return hashlib.sha1(data).hexdigest()[:16]
+
+
+def run(fn, client, repeat):
+    """Return (result, best seconds, peak bytes) for one case."""
+    best = None
+    for _ in range(repeat):
+        client.transport.rewind()
+        start = time.perf_counter()
+        result = fn(client)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Measure memory in a separate run; tracemalloc slows allocation down
+    client.transport.rewind()
+    tracemalloc.start()
+    fn(client)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def compare(current, baseline, tolerance):
+    """Return a list of reasons the current result regressed from the baseline."""
+    reasons = []
+    if current["digest"] != baseline["digest"]:
+        reasons.append("output changed")
+    if current["ms"] > baseline["ms"] * (1 + tolerance) + MIN_SLOWDOWN_MS:
+        reasons.append("{:+.0%} time".format(current["ms"] / baseline["ms"] - 1))
+    if current["peak_mb"] > baseline["peak_mb"] * (1 + tolerance):
+        reasons.append(
+            "{:+.0%} memory".format(current["peak_mb"] / baseline["peak_mb"] - 1)
+        )
+
+    return reasons
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown or memory growth, as a fraction (default: 0.25)",
+    )
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON file")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store these results as baseline"
+    )
+    parser.add_argument("cases", nargs="*", help="case names to run (default: all)")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    client = statsapi.StatsAPIClient(transport=ReplayTransport(FIXTURES))
+    results = {}
+    failed = False
+    print(
+        "{:<24} {:>10} {:>10} {:>10}   {}".format(
+            "function", "ms", "peak MB", "baseline", "status"
+        )
+    )
+    for name, fn in CASES:
+        if args.cases and name not in args.cases:
+            continue
+
+        result, seconds, peak = run(fn, client, args.repeat)
+        current = {
+            "ms": round(seconds * 1000, 3),
+            "peak_mb": round(peak / 1000000, 3),
+            "digest": digest(result),
+        }
+        results[name] = current
+        status = "new"
+        reference = ""
+        if name in baseline:
+            reference = "{:.1f}".format(baseline[name]["ms"])
+            reasons = compare(current, baseline[name], args.tolerance)
+            status = "REGRESSED: " + ", ".join(reasons) if reasons else "ok"
+            failed = failed or bool(reasons)
+
+        print(
+            "{:<24} {:>10.1f} {:>10.2f} {:>10}   {}".format(
+                name, current["ms"], current["peak_mb"], reference, status
+            )
+        )
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print("\nSaved baseline to %s" % args.baseline)
+        return 0
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
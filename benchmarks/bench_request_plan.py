@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+"""Microbenchmark: URL building with compiled RequestPlans vs. the old per-call scan.
+
+Run from the repository root:
+
+    python benchmarks/bench_request_plan.py [iterations]
+
+The legacy builder below is the URL/parameter handling from the old
+statsapi.get(), minus the HTTP call. Both builders are checked for identical
+output before timing.
+"""
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from statsapi import endpoints, plans  # noqa: E402
+
+logger = logging.getLogger("statsapi")
+
+CASES = [
+    ("game", {"gamePk": 565997, "fields": "gameData,liveData"}),
+    ("game", {"gamePk": 565997, "timecode": "20190721_201500"}),
+    (
+        "schedule",
+        {
+            "sportId": 1,
+            "date": "07/04/2023",
+            "hydrate": "decisions,probablePitcher(note),linescore",
+        },
+    ),
+    ("standings", {"leagueId": "103,104", "season": 2023, "hydrate": "team"}),
+    ("person", {"personId": 605151, "hydrate": "stats(group=[hitting])"}),
+    ("awards", {"awardId": "MLBHOF", "recipients": "true"}),
+]
+
+
+def legacy_build_url(endpoint, params, force=False):
+    ep = endpoints.ENDPOINTS.get(endpoint)
+    if not ep:
+        raise ValueError("Invalid endpoint (" + str(endpoint) + ").")
+
+    url = ep["url"]
+    logger.debug("URL: {}".format(url))
+
+    path_params = {}
+    query_params = {}
+
+    for p, pv in params.items():
+        if ep["path_params"].get(p):
+            logger.debug("Found path param: {}".format(p))
+            if ep["path_params"][p].get("type") == "bool":
+                if str(pv).lower() == "false":
+                    path_params.update({p: ep["path_params"][p].get("False", "")})
+                elif str(pv).lower() == "true":
+                    path_params.update({p: ep["path_params"][p].get("True", "")})
+            else:
+                path_params.update({p: str(pv)})
+        elif p in ep["query_params"]:
+            logger.debug("Found query param: {}".format(p))
+            query_params.update({p: str(pv)})
+        else:
+            logger.debug("Found invalid param, ignoring: {}".format(p))
+
+    logger.debug("path_params: {}".format(path_params))
+    logger.debug("query_params: {}".format(query_params))
+
+    for k, v in path_params.items():
+        logger.debug("Replacing {%s}" % k)
+        url = url.replace(
+            "{" + k + "}",
+            ("/" if ep["path_params"][k]["leading_slash"] else "")
+            + v
+            + ("/" if ep["path_params"][k]["trailing_slash"] else ""),
+        )
+        logger.debug("URL: {}".format(url))
+
+    while url.find("{") != -1 and url.find("}") > url.find("{"):
+        param = url[url.find("{") + 1 : url.find("}")]
+        if ep.get("path_params", {}).get(param, {}).get("required"):
+            if (
+                ep["path_params"][param]["default"]
+                and ep["path_params"][param]["default"] != ""
+            ):
+                logger.debug(
+                    "Replacing {%s} with default: %s."
+                    % (param, ep["path_params"][param]["default"])
+                )
+                url = url.replace(
+                    "{" + param + "}",
+                    ("/" if ep["path_params"][param]["leading_slash"] else "")
+                    + ep["path_params"][param]["default"]
+                    + ("/" if ep["path_params"][param]["trailing_slash"] else ""),
+                )
+            else:
+                raise ValueError("Missing required path parameter {%s}" % param)
+        else:
+            logger.debug("Removing optional param {%s}" % param)
+            url = url.replace("{" + param + "}", "")
+
+        logger.debug("URL: {}".format(url))
+
+    if len(query_params) > 0:
+        for k, v in query_params.items():
+            logger.debug("Adding query parameter {}={}".format(k, v))
+            sep = "?" if url.find("?") == -1 else "&"
+            url += sep + k + "=" + v
+            logger.debug("URL: {}".format(url))
+
+    satisfied = False
+    missing_params = []
+    for x in ep.get("required_params", []):
+        if len(x) == 0:
+            satisfied = True
+        else:
+            missing_params.extend([a for a in x if a not in query_params])
+            if len(missing_params) == 0:
+                satisfied = True
+                break
+
+    if not satisfied:
+        raise ValueError("Missing required parameter(s)")
+
+    return url
+
+
+def main(iterations=20000):
+    compiled = {}
+
+    def plan_build_url(endpoint, params):
+        plan = compiled.get(endpoint)
+        if plan is None:
+            plan = compiled[endpoint] = plans.RequestPlan(
+                endpoint, endpoints.ENDPOINTS[endpoint]
+            )
+        return plan.build_url(params, False, logger)[0]
+
+    for endpoint, params in CASES:
+        assert legacy_build_url(endpoint, params) == plan_build_url(endpoint, params)
+
+    def run(builder):
+        for endpoint, params in CASES:
+            builder(endpoint, params)
+
+    calls = iterations * len(CASES)
+    results = {}
+    for name, builder in [("legacy", legacy_build_url), ("plan", plan_build_url)]:
+        best = min(timeit.repeat(lambda: run(builder), number=iterations, repeat=5))
+        results[name] = best
+        print(
+            "{:<8} {:>8.3f} s  {:>8.2f} us/url".format(
+                name, best, best / calls * 1000000
+            )
+        )
+
+    print("speedup  {:>8.1f}x".format(results["legacy"] / results["plan"]))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Benchmark: peak memory and time of streaming plays vs. decoding the whole feed.
+
+Run from the repository root:
+
+    python benchmarks/bench_stream.py [plays_per_half]
+
+Feeds come from benchmarks/feeds.py. The body is fed to the parser in
+64 KB chunks, as Response.iter_content() would deliver it. "full" collects
+the chunks and decodes the whole document; "stream" yields one play at a time.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from statsapi import decoding, stream  # noqa: E402
+
+import feeds  # noqa: E402
+
+
+def chunks(body):
+    size = stream.DEFAULT_CHUNK_SIZE
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+def full(body):
+    data = decoding.loads(b"".join(chunks(body)))
+    return sum(1 for _ in data["liveData"]["plays"]["allPlays"])
+
+
+def streamed(body):
+    return sum(1 for _ in stream.iter_array(chunks(body), stream.PLAYS_PATH))
+
+
+def main(plays_per_half=8):
+    body = feeds.live_feed_body(plays_per_half=plays_per_half)
+    print("feed: {:.2f} MB\n".format(len(body) / 1000000))
+    print("{:<8} {:>8} {:>10} {:>14}".format("mode", "plays", "ms", "peak MB"))
+    for name, fn in [("full", full), ("stream", streamed)]:
+        start = time.perf_counter()
+        plays = fn(body)
+        elapsed = time.perf_counter() - start
+        # Measure memory in a second run; tracemalloc slows allocation down
+        tracemalloc.start()
+        fn(body)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(
+            "{:<8} {:>8} {:>10.1f} {:>14.2f}".format(
+                name, plays, elapsed * 1000, peak / 1000000
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
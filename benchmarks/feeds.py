@@ -0,0 +1,902 @@
+"""Synthetic MLB StatsAPI responses for benchmarks.
+
+The benchmarks cannot download real responses, so this module builds
+deterministic stand-ins with the same structure, key names and approximate
+nesting as the real ones, complete enough for every statsapi parser:
+
+* live_feed() - /v1.1/game/{gamePk}/feed/live for a completed game, with
+  plays, scoring plays, linescore and a full boxscore; it is smaller than a
+  real feed (about 0.6 MB at the default size), so raise plays_per_half to
+  scale it up and innings for extra-inning games
+* season_schedule() - /v1/schedule for a full regular season with the
+  hydrations statsapi.schedule() requests
+* sports_players() - /v1/sports/{sportId}/players for a season
+* standings() - /v1/standings for both leagues
+
+make_fixtures.py records these into the archive the benchmarks replay.
+"""
+import datetime
+import json
+import random
+
+TEAMS = [
+    (147, "New York Yankees", "Yankees", "NYY", 201),
+    (111, "Boston Red Sox", "Red Sox", "BOS", 201),
+    (141, "Toronto Blue Jays", "Blue Jays", "TOR", 201),
+    (139, "Tampa Bay Rays", "Rays", "TB", 201),
+    (110, "Baltimore Orioles", "Orioles", "BAL", 201),
+    (145, "Chicago White Sox", "White Sox", "CWS", 202),
+    (114, "Cleveland Guardians", "Guardians", "CLE", 202),
+    (116, "Detroit Tigers", "Tigers", "DET", 202),
+    (118, "Kansas City Royals", "Royals", "KC", 202),
+    (142, "Minnesota Twins", "Twins", "MIN", 202),
+    (117, "Houston Astros", "Astros", "HOU", 200),
+    (108, "Los Angeles Angels", "Angels", "LAA", 200),
+    (133, "Oakland Athletics", "Athletics", "OAK", 200),
+    (136, "Seattle Mariners", "Mariners", "SEA", 200),
+    (140, "Texas Rangers", "Rangers", "TEX", 200),
+    (144, "Atlanta Braves", "Braves", "ATL", 204),
+    (146, "Miami Marlins", "Marlins", "MIA", 204),
+    (121, "New York Mets", "Mets", "NYM", 204),
+    (143, "Philadelphia Phillies", "Phillies", "PHI", 204),
+    (120, "Washington Nationals", "Nationals", "WSH", 204),
+    (112, "Chicago Cubs", "Cubs", "CHC", 205),
+    (113, "Cincinnati Reds", "Reds", "CIN", 205),
+    (158, "Milwaukee Brewers", "Brewers", "MIL", 205),
+    (134, "Pittsburgh Pirates", "Pirates", "PIT", 205),
+    (138, "St. Louis Cardinals", "Cardinals", "STL", 205),
+    (109, "Arizona Diamondbacks", "D-backs", "AZ", 203),
+    (115, "Colorado Rockies", "Rockies", "COL", 203),
+    (119, "Los Angeles Dodgers", "Dodgers", "LAD", 203),
+    (135, "San Diego Padres", "Padres", "SD", 203),
+    (137, "San Francisco Giants", "Giants", "SF", 203),
+]
+
+DIVISIONS = {
+    200: ("American League West", "ALW", 103),
+    201: ("American League East", "ALE", 103),
+    202: ("American League Central", "ALC", 103),
+    203: ("National League West", "NLW", 104),
+    204: ("National League East", "NLE", 104),
+    205: ("National League Central", "NLC", 104),
+}
+
+POSITIONS = ["C", "1B", "2B", "3B", "SS", "LF", "CF", "RF", "DH"]
+
+FIRST_NAMES = [
+    "Aaron",
+    "Mookie",
+    "Shohei",
+    "Juan",
+    "Freddie",
+    "Pete",
+    "Jose",
+    "Corey",
+    "Francisco",
+    "Julio",
+    "Bobby",
+    "Ronald",
+    "Luis",
+    "Carlos",
+]
+LAST_NAMES = [
+    "Judge",
+    "Betts",
+    "Ohtani",
+    "Soto",
+    "Freeman",
+    "Alonso",
+    "Ramirez",
+    "Seager",
+    "Lindor",
+    "Rodriguez",
+    "Witt",
+    "Acuna",
+    "Smith",
+    "Garcia",
+    "Martinez",
+    "Johnson",
+    "Williams",
+    "Brown",
+    "Jones",
+    "Miller",
+]
+
+
+def _name(pid):
+    return (
+        FIRST_NAMES[pid % len(FIRST_NAMES)],
+        LAST_NAMES[(pid // len(FIRST_NAMES)) % len(LAST_NAMES)],
+    )
+
+
+def _person(pid):
+    first, last = _name(pid)
+    return {
+        "id": pid,
+        "fullName": "%s %s" % (first, last),
+        "link": "/api/v1/people/%d" % pid,
+    }
+
+
+def _team(team):
+    return {"id": team[0], "name": team[1], "link": "/api/v1/teams/%d" % team[0]}
+
+
+def _pitch(rng, index, balls, strikes, start):
+    code = rng.choice(["B", "C", "S", "F", "X"])
+    return {
+        "details": {
+            "call": {"code": code, "description": "Pitch result %s" % code},
+            "description": "Pitch result %s" % code,
+            "code": code,
+            "ballColor": "rgba(39, 161, 39, 1.0)",
+            "trailColor": "rgba(188, 0, 33, 1.0)",
+            "isInPlay": code == "X",
+            "isStrike": code in "CSF",
+            "isBall": code == "B",
+            "type": {"code": "FF", "description": "Four-Seam Fastball"},
+            "hasReview": False,
+        },
+        "count": {"balls": balls, "strikes": strikes, "outs": 0},
+        "pitchData": {
+            "startSpeed": round(rng.uniform(80, 100), 1),
+            "endSpeed": round(rng.uniform(75, 92), 1),
+            "strikeZoneTop": 3.49,
+            "strikeZoneBottom": 1.6,
+            "coordinates": {
+                "aY": round(rng.uniform(20, 35), 2),
+                "aZ": round(rng.uniform(-20, -10), 2),
+                "pfxX": round(rng.uniform(-10, 10), 2),
+                "pfxZ": round(rng.uniform(0, 12), 2),
+                "pX": round(rng.uniform(-1.5, 1.5), 3),
+                "pZ": round(rng.uniform(1, 4), 3),
+                "vX0": round(rng.uniform(-10, 10), 2),
+                "vY0": round(rng.uniform(-140, -120), 2),
+                "vZ0": round(rng.uniform(-8, 0), 2),
+                "x": round(rng.uniform(80, 140), 2),
+                "y": round(rng.uniform(150, 200), 2),
+                "x0": round(rng.uniform(-3, 3), 2),
+                "y0": 50.0,
+                "z0": round(rng.uniform(5, 6.5), 2),
+                "aX": round(rng.uniform(-20, 5), 2),
+            },
+            "breaks": {
+                "breakAngle": round(rng.uniform(0, 40), 1),
+                "breakLength": round(rng.uniform(2, 12), 1),
+                "breakY": 24.0,
+                "spinRate": rng.randint(1800, 2600),
+                "spinDirection": rng.randint(100, 250),
+            },
+            "zone": rng.randint(1, 14),
+            "typeConfidence": 0.92,
+            "plateTime": 0.4,
+            "extension": 6.3,
+        },
+        "index": index,
+        "playId": "%08x-0000-0000-0000-%012x" % (rng.getrandbits(32), index),
+        "pitchNumber": index + 1,
+        "startTime": start,
+        "endTime": start,
+        "isPitch": True,
+        "type": "pitch",
+    }
+
+
+def _play(rng, index, inning, half, batter, pitcher, timestamp, score):
+    pitches = [
+        _pitch(rng, i, min(i, 3), min(i, 2), timestamp)
+        for i in range(rng.randint(1, 7))
+    ]
+    event = rng.choice(
+        ["Strikeout", "Groundout", "Flyout", "Single", "Walk", "Double", "Home Run"]
+    )
+    event_type = event.lower().replace(" ", "_")
+    scoring = event == "Home Run"
+    if scoring:
+        score[half == "bottom"] += 1
+
+    return {
+        "result": {
+            "type": "atBat",
+            "event": event,
+            "eventType": event_type,
+            "description": "%s %s." % (_person(batter)["fullName"], event.lower()),
+            "rbi": 1 if scoring else 0,
+            "awayScore": score[0],
+            "homeScore": score[1],
+            "isOut": event.endswith("out"),
+        },
+        "about": {
+            "atBatIndex": index,
+            "halfInning": half,
+            "isTopInning": half == "top",
+            "inning": inning,
+            "startTime": timestamp,
+            "endTime": timestamp,
+            "isComplete": True,
+            "isScoringPlay": scoring,
+            "hasReview": False,
+            "hasOut": event.endswith("out"),
+            "captivatingIndex": 0,
+        },
+        "count": {"balls": 1, "strikes": 2, "outs": index % 3 + 1},
+        "matchup": {
+            "batter": _person(batter),
+            "batSide": {"code": "R", "description": "Right"},
+            "pitcher": _person(pitcher),
+            "pitchHand": {"code": "R", "description": "Right"},
+            "batterHotColdZones": [],
+            "pitcherHotColdZones": [],
+            "splits": {
+                "batter": "vs_RHP",
+                "pitcher": "vs_RHB",
+                "menOnBase": "Empty",
+            },
+        },
+        "pitchIndex": list(range(len(pitches))),
+        "actionIndex": [],
+        "runnerIndex": [0],
+        "runners": [
+            {
+                "movement": {
+                    "originBase": None,
+                    "start": None,
+                    "end": "score" if scoring else None,
+                    "outBase": None if scoring else "1B",
+                    "isOut": not scoring,
+                    "outNumber": index % 3 + 1,
+                },
+                "details": {
+                    "event": event,
+                    "eventType": event_type,
+                    "movementReason": None,
+                    "runner": _person(batter),
+                    "responsiblePitcher": None,
+                    "isScoringEvent": scoring,
+                    "rbi": scoring,
+                    "earned": scoring,
+                    "teamUnearned": False,
+                    "playIndex": 0,
+                },
+                "credits": [],
+            }
+        ],
+        "playEvents": pitches,
+        "playEndTime": timestamp,
+        "atBatIndex": index,
+    }
+
+
+def _batting_stats(rng):
+    return {
+        "gamesPlayed": 1,
+        "flyOuts": rng.randint(0, 2),
+        "groundOuts": rng.randint(0, 2),
+        "runs": rng.randint(0, 2),
+        "doubles": rng.randint(0, 1),
+        "triples": 0,
+        "homeRuns": rng.randint(0, 1),
+        "strikeOuts": rng.randint(0, 3),
+        "baseOnBalls": rng.randint(0, 2),
+        "hits": rng.randint(0, 3),
+        "atBats": rng.randint(3, 6),
+        "stolenBases": rng.randint(0, 1),
+        "rbi": rng.randint(0, 3),
+        "leftOnBase": rng.randint(0, 4),
+    }
+
+
+def _pitching_stats(rng, note=None):
+    stats = {
+        "gamesPlayed": 1,
+        "inningsPitched": "%d.%d" % (rng.randint(0, 6), rng.randint(0, 2)),
+        "hits": rng.randint(0, 8),
+        "runs": rng.randint(0, 4),
+        "earnedRuns": rng.randint(0, 4),
+        "baseOnBalls": rng.randint(0, 4),
+        "strikeOuts": rng.randint(0, 9),
+        "homeRuns": rng.randint(0, 2),
+        "pitchesThrown": rng.randint(10, 110),
+        "numberOfPitches": rng.randint(10, 110),
+        "strikes": rng.randint(5, 70),
+    }
+    if note:
+        stats["note"] = note
+
+    return stats
+
+
+def _season_batting(avg, obp, slg, ops):
+    return {"avg": avg, "obp": obp, "slg": slg, "ops": ops}
+
+
+def _boxscore_team(rng, team, batters, subs, pitchers):
+    players = {}
+    for i, pid in enumerate(batters):
+        players["ID%d" % pid] = {
+            "person": _person(pid),
+            "jerseyNumber": str(pid % 100),
+            "position": {"abbreviation": POSITIONS[i % 9]},
+            "battingOrder": "%d00" % (i + 1),
+            "stats": {"batting": _batting_stats(rng), "pitching": {}},
+            "seasonStats": {
+                "batting": _season_batting(
+                    ".%03d" % rng.randint(180, 330),
+                    ".%03d" % rng.randint(250, 420),
+                    ".%03d" % rng.randint(300, 600),
+                    ".%03d" % rng.randint(550, 999),
+                ),
+                "pitching": {"era": "-.--"},
+            },
+        }
+
+    for i, pid in enumerate(subs):
+        batting = _batting_stats(rng)
+        batting["note"] = "%s-" % "abcdefgh"[i]
+        players["ID%d" % pid] = {
+            "person": _person(pid),
+            "jerseyNumber": str(pid % 100),
+            "position": {"abbreviation": "PH"},
+            "battingOrder": "%d01" % (i * 3 % 9 + 1),
+            "stats": {"batting": batting, "pitching": {}},
+            "seasonStats": {
+                "batting": _season_batting(".240", ".310", ".390", ".700"),
+                "pitching": {"era": "-.--"},
+            },
+        }
+
+    for i, pid in enumerate(pitchers):
+        players["ID%d" % pid] = {
+            "person": _person(pid),
+            "jerseyNumber": str(pid % 100),
+            "position": {"abbreviation": "P"},
+            "stats": {
+                "batting": {},
+                "pitching": _pitching_stats(
+                    rng, ["(W, 9-4)", "(H, 12)"][i] if i < 2 else None
+                ),
+            },
+            "seasonStats": {
+                "batting": _season_batting(".000", ".000", ".000", ".000"),
+                "pitching": {
+                    "era": "%d.%02d" % (rng.randint(1, 6), rng.randint(0, 99))
+                },
+            },
+        }
+
+    names = ", ".join(_person(pid)["fullName"] for pid in batters[:3])
+    return {
+        "team": _team(team),
+        "teamStats": {
+            "batting": _batting_stats(rng),
+            "pitching": _pitching_stats(rng),
+        },
+        "players": players,
+        "batters": batters[:1] + subs + batters[1:] + pitchers[:1],
+        "pitchers": pitchers,
+        "bench": [],
+        "bullpen": [],
+        "battingOrder": batters,
+        "info": [
+            {
+                "title": "BATTING",
+                "fieldList": [
+                    {"label": "2B", "value": "%s (12, off Cole)." % names},
+                    {"label": "TB", "value": "; ".join([names] * 4) + "."},
+                    {"label": "RBI", "value": names + "."},
+                    {"label": "Team RISP", "value": "3-for-11."},
+                    {"label": "Team LOB", "value": "7."},
+                ],
+            },
+            {
+                "title": "FIELDING",
+                "fieldList": [{"label": "DP", "value": "2 (%s)." % names}],
+            },
+        ],
+        "note": [
+            {
+                "label": "abcdefgh"[i],
+                "value": "Singled for %s in the %dth."
+                % (_person(batters[i * 3 % 9])["fullName"], i + 6),
+            }
+            for i in range(len(subs))
+        ],
+    }
+
+
+def live_feed(gamePk=565997, innings=9, plays_per_half=6, seed=0):
+    """Return a dict shaped like a completed game's live feed."""
+    rng = random.Random(seed + gamePk)
+    away, home = TEAMS[gamePk % 15], TEAMS[15 + gamePk % 15]
+    roster = [[team[0] * 1000 + i for i in range(26)] for team in (away, home)]
+    batters = [r[:9] for r in roster]
+    subs = [r[9:11] for r in roster]
+    pitchers = [r[11 : 14 + innings // 3] for r in roster]
+    plays = []
+    score = [0, 0]
+    linescore = []
+    start = datetime.datetime(2019, 7, 21, 17, 5)
+    for inning in range(1, innings + 1):
+        line = {"num": inning, "ordinalNum": "%d" % inning}
+        for half, side in [("top", 0), ("bottom", 1)]:
+            runs = score[side]
+            for _ in range(plays_per_half):
+                index = len(plays)
+                timestamp = (start + datetime.timedelta(minutes=3 * index)).strftime(
+                    "%Y-%m-%dT%H:%M:%S.000Z"
+                )
+                plays.append(
+                    _play(
+                        rng,
+                        index,
+                        inning,
+                        half,
+                        batters[side][index % 9],
+                        pitchers[1 - side][min(inning // 3, len(pitchers[0]) - 1)],
+                        timestamp,
+                        score,
+                    )
+                )
+
+            line["away" if side == 0 else "home"] = {
+                "runs": score[side] - runs,
+                "hits": rng.randint(0, 3),
+                "errors": 0,
+                "leftOnBase": rng.randint(0, 2),
+            }
+
+        linescore.append(line)
+
+    if score[0] == score[1]:
+        # No ties: the home team walks off in the last inning
+        score[1] += 1
+        linescore[-1]["home"]["runs"] += 1
+
+    teams = {}
+    for side, team in [("away", away), ("home", home)]:
+        teams[side] = {
+            "id": team[0],
+            "name": team[1],
+            "teamName": team[2],
+            "shortName": team[2],
+            "abbreviation": team[3],
+            "teamCode": team[3].lower(),
+            "fileCode": team[3].lower(),
+            "locationName": team[1].rsplit(" ", 1)[0],
+        }
+
+    players = {}
+    for pid in (pid for side in roster for pid in side):
+        first, last = _name(pid)
+        players["ID%d" % pid] = dict(
+            _person(pid),
+            firstName=first,
+            lastName=last,
+            boxscoreName="%s, %s" % (last, first[0]),
+            primaryNumber=str(pid % 100),
+        )
+
+    return {
+        "copyright": "Copyright 2019 MLB Advanced Media, L.P.",
+        "gamePk": gamePk,
+        "link": "/api/v1.1/game/%d/feed/live" % gamePk,
+        "metaData": {
+            "wait": 10,
+            "timeStamp": "20190721_201500",
+            "gameEvents": ["game_finished"],
+            "logicalEvents": [],
+        },
+        "gameData": {
+            "game": {
+                "pk": gamePk,
+                "type": "R",
+                "season": "2019",
+                "id": "2019/07/21/%smlb-%smlb-1" % (away[3].lower(), home[3].lower()),
+            },
+            "datetime": {"dateTime": "2019-07-21T17:05:00Z"},
+            "status": {
+                "abstractGameState": "Final",
+                "codedGameState": "F",
+                "detailedState": "Final",
+                "statusCode": "F",
+            },
+            "teams": teams,
+            "players": players,
+        },
+        "liveData": {
+            "plays": {
+                "allPlays": plays,
+                "currentPlay": plays[-1],
+                "scoringPlays": [
+                    p["atBatIndex"] for p in plays if p["about"]["isScoringPlay"]
+                ],
+                "playsByInning": [
+                    {
+                        "startIndex": i,
+                        "endIndex": i + plays_per_half * 2 - 1,
+                        "top": list(range(i, i + plays_per_half)),
+                        "bottom": list(
+                            range(i + plays_per_half, i + plays_per_half * 2)
+                        ),
+                    }
+                    for i in range(0, len(plays), plays_per_half * 2)
+                ],
+            },
+            "linescore": {
+                "currentInning": innings,
+                "currentInningOrdinal": "%dth" % innings,
+                "inningState": "Bottom",
+                "scheduledInnings": 9,
+                "innings": linescore,
+                "teams": {
+                    side: {
+                        "runs": score[i],
+                        "hits": sum(line[side]["hits"] for line in linescore),
+                        "errors": rng.randint(0, 2),
+                    }
+                    for i, side in enumerate(["away", "home"])
+                },
+            },
+            "boxscore": {
+                "teams": {
+                    side: _boxscore_team(rng, team, batters[i], subs[i], pitchers[i])
+                    for i, (side, team) in enumerate([("away", away), ("home", home)])
+                },
+                "officials": [],
+                "info": [
+                    {"label": "WP", "value": "Smith."},
+                    {"label": "HBP", "value": "Judge (by Garcia)."},
+                    {
+                        "label": "Pitches-strikes",
+                        "value": ", ".join(
+                            "%s 90-60" % _person(pid)["fullName"]
+                            for side in pitchers
+                            for pid in side
+                        )
+                        + ".",
+                    },
+                    {"label": "Umpires", "value": "HP: Angel Hernandez. 1B: Joe West."},
+                    {"label": "Weather", "value": "84 degrees, Partly Cloudy."},
+                    {"label": "Wind", "value": "7 mph, Out To CF."},
+                    {"label": "First pitch", "value": "1:05 PM."},
+                    {"label": "T", "value": "%d:12." % (3 + innings // 9)},
+                    {"label": "Att", "value": "46,143."},
+                    {"label": "Venue", "value": "%s Park." % home[2]},
+                    {"label": "July 21, 2019"},
+                ],
+                "pitchingNotes": [],
+            },
+            "decisions": {
+                "winner": _person(pitchers[1][0]),
+                "loser": _person(pitchers[0][0]),
+            },
+        },
+    }
+
+
+def _schedule_game(rng, gamePk, day, index, series, away, home):
+    postponed = rng.random() < 0.01
+    scores = [rng.randint(0, 10), rng.randint(0, 10)]
+    if scores[0] == scores[1]:
+        scores[1] += 1
+
+    game = {
+        "gamePk": gamePk,
+        "link": "/api/v1.1/game/%d/feed/live" % gamePk,
+        "gameType": "R",
+        "season": str(day.year),
+        "gameDate": "%sT%02d:05:00Z" % (day.isoformat(), rng.choice([17, 23])),
+        "officialDate": day.isoformat(),
+        "status": {
+            "abstractGameState": "Preview" if postponed else "Final",
+            "codedGameState": "D" if postponed else "F",
+            "detailedState": "Postponed" if postponed else "Final",
+            "statusCode": "DR" if postponed else "F",
+            "startTimeTBD": False,
+            "abstractGameCode": "P" if postponed else "F",
+        },
+        "teams": {},
+        "decisions": {
+            "winner": _person(home[0] * 1000 + 11),
+            "loser": _person(away[0] * 1000 + 11),
+            "save": _person(home[0] * 1000 + 15),
+        },
+        "venue": {"id": 3300 + home[0] % 50, "name": "%s Park" % home[2]},
+        "linescore": {
+            "currentInning": 9,
+            "currentInningOrdinal": "9th",
+            "inningState": "Bottom",
+            "inningHalf": "Bottom",
+            "isTopInning": False,
+            "scheduledInnings": 9,
+            "innings": [
+                {
+                    "num": i,
+                    "ordinalNum": "%d" % i,
+                    "away": {"runs": rng.randint(0, 1), "hits": rng.randint(0, 2)},
+                    "home": {"runs": rng.randint(0, 1), "hits": rng.randint(0, 2)},
+                }
+                for i in range(1, 10)
+            ],
+            "teams": {
+                "away": {"runs": scores[0], "hits": 8, "errors": 0},
+                "home": {"runs": scores[1], "hits": 9, "errors": 1},
+            },
+        },
+        "broadcasts": [
+            {
+                "id": 4000 + home[0],
+                "name": "%s TV" % home[2],
+                "type": "TV",
+                "language": "en",
+                "isNational": False,
+                "callSign": home[3] + "TV",
+            },
+            {
+                "id": 12,
+                "name": "ESPN",
+                "type": "TV",
+                "language": "en",
+                "isNational": index == 0,
+                "callSign": "ESPN",
+            },
+        ],
+        "content": {
+            "link": "/api/v1/game/%d/content" % gamePk,
+            "media": {
+                "epg": [
+                    {
+                        "title": "MLBTV",
+                        "items": [
+                            {
+                                "id": gamePk * 10 + i,
+                                "contentId": "%08x" % (gamePk * 10 + i),
+                                "mediaState": "MEDIA_ARCHIVE",
+                                "mediaFeedType": feed,
+                                "callLetters": team[3] + "TV",
+                            }
+                            for i, (feed, team) in enumerate(
+                                [("AWAY", away), ("HOME", home)]
+                            )
+                        ],
+                    }
+                ],
+                "freeGame": index == 1,
+                "enhancedGame": False,
+            },
+        },
+        "seriesStatus": {
+            "gameNumber": series % 3 + 1,
+            "totalGames": 3,
+            "isTied": False,
+            "wins": 1,
+            "losses": 0,
+            "result": "%s lead 2-1" % home[3],
+            "description": "Regular Season",
+        },
+        "isTie": False,
+        "gameNumber": 1,
+        "doubleHeader": "N",
+        "dayNight": "night",
+        "scheduledInnings": 9,
+        "seriesDescription": "Regular Season",
+    }
+    for side, team, score, other in [
+        ("away", away, scores[0], scores[1]),
+        ("home", home, scores[1], scores[0]),
+    ]:
+        game["teams"][side] = {
+            "leagueRecord": {
+                "wins": rng.randint(0, 100),
+                "losses": rng.randint(0, 100),
+                "pct": ".%03d" % rng.randint(300, 700),
+            },
+            "team": _team(team),
+            "probablePitcher": dict(
+                _person(team[0] * 1000 + 11 + rng.randint(0, 4)),
+                note="Has allowed 2 runs in his last 12 innings.",
+            ),
+            "splitSquad": False,
+            "seriesNumber": series,
+        }
+        if not postponed:
+            game["teams"][side].update(score=score, isWinner=score > other)
+
+    return game
+
+
+def season_schedule(season=2023, days=186, seed=0):
+    """Return a dict shaped like a schedule response covering a full regular season."""
+    rng = random.Random(seed + season)
+    day = datetime.date(season, 3, 30)
+    teams = list(TEAMS)
+    gamePk = 716000
+    dates = []
+    for d in range(days):
+        rng.shuffle(teams)
+        games = []
+        for i in range(12 if d % 7 == 0 else 13):
+            gamePk += 1
+            games.append(
+                _schedule_game(
+                    rng, gamePk, day, i, d // 3, teams[i * 2], teams[i * 2 + 1]
+                )
+            )
+
+        dates.append(
+            {
+                "date": day.isoformat(),
+                "totalItems": len(games),
+                "totalGames": len(games),
+                "games": games,
+                "events": [],
+            }
+        )
+        day += datetime.timedelta(days=1)
+
+    total = sum(len(d["games"]) for d in dates)
+    return {
+        "copyright": "Copyright 2023 MLB Advanced Media, L.P.",
+        "totalItems": total,
+        "totalEvents": 0,
+        "totalGames": total,
+        "totalGamesInProgress": 0,
+        "dates": dates,
+    }
+
+
+def sports_players(season=2023, count=1500, seed=0):
+    """Return a dict shaped like a sports_players response."""
+    rng = random.Random(seed + season)
+    people = []
+    for i in range(count):
+        pid = 600000 + i * 7
+        first, last = _name(pid)
+        position = rng.choice(POSITIONS[:8] + ["P", "P", "P"])
+        person = {
+            "id": pid,
+            "fullName": "%s %s" % (first, last),
+            "firstName": first,
+            "lastName": last,
+            "primaryNumber": str(rng.randint(1, 99)),
+            "currentTeam": {"id": TEAMS[i % len(TEAMS)][0]},
+            "primaryPosition": {"code": position, "abbreviation": position},
+            "useName": first,
+            "boxscoreName": "%s, %s" % (last, first[0]),
+            "mlbDebutDate": "%d-%02d-%02d"
+            % (rng.randint(2005, season), rng.randint(4, 9), rng.randint(1, 28)),
+            "nameFirstLast": "%s %s" % (first, last),
+            "firstLastName": "%s %s" % (first, last),
+            "lastFirstName": "%s, %s" % (last, first),
+            "lastInitName": "%s, %s" % (last, first[0]),
+            "initLastName": "%s %s" % (first[0], last),
+            "fullFMLName": "%s %s" % (first, last),
+            "fullLFMName": "%s, %s" % (last, first),
+            "nameSlug": "%s-%s-%d" % (first.lower(), last.lower(), pid),
+        }
+        if i % 10 == 0:
+            person["nickName"] = "Big %s" % first
+
+        people.append(person)
+
+    return {"copyright": "Copyright 2023 MLB Advanced Media, L.P.", "people": people}
+
+
+def standings(season=2023, seed=0):
+    """Return a dict shaped like a regular season standings response for both leagues."""
+    rng = random.Random(seed + season)
+    records = []
+    for division_id, (name, abbreviation, league) in sorted(DIVISIONS.items()):
+        teams = [t for t in TEAMS if t[4] == division_id]
+        wins = sorted((rng.randint(60, 100) for _ in teams), reverse=True)
+        division = {
+            "id": division_id,
+            "name": name,
+            "nameShort": abbreviation,
+            "abbreviation": abbreviation,
+        }
+        team_records = []
+        for rank, (team, w) in enumerate(zip(teams, wins), 1):
+            games_back = "-" if rank == 1 else "%.1f" % (wins[0] - w)
+            team_records.append(
+                {
+                    "team": dict(_team(team), division=division),
+                    "divisionRank": str(rank),
+                    "leagueRank": str(rng.randint(1, 15)),
+                    "sportRank": str(rng.randint(1, 30)),
+                    "wins": w,
+                    "losses": 162 - w,
+                    "winningPercentage": ".%03d" % (w * 1000 // 162),
+                    "gamesBack": games_back,
+                    "wildCardRank": str(rank + 2),
+                    "wildCardGamesBack": "+%d.0" % rng.randint(0, 9),
+                    "wildCardEliminationNumber": "E",
+                    "eliminationNumber": "E" if rank > 1 else "-",
+                    "divisionGamesBack": games_back,
+                    "clinched": rank == 1,
+                }
+            )
+
+        records.append(
+            {
+                "standingsType": "regularSeason",
+                "league": {"id": league},
+                "division": {"id": division_id},
+                "teamRecords": team_records,
+            }
+        )
+
+    return {"copyright": "Copyright 2023 MLB Advanced Media, L.P.", "records": records}
+
+
+def dumps(data):
+    """Serialize a payload compactly, as the StatsAPI sends it."""
+    return json.dumps(data, separators=(",", ":"))
+
+
+def live_feed_body(gamePk=565997, **kwargs):
+    """Return live_feed() serialized to bytes, as the StatsAPI sends it."""
+    return dumps(live_feed(gamePk, **kwargs)).encode()
+
+
+def live_feed_at(feed, plays):
+    """Return the state of a live_feed() after its first plays plays, sharing
+    unchanged parts with feed."""
+    all_plays = feed["liveData"]["plays"]["allPlays"][:plays]
+    state = dict(feed)
+    state["metaData"] = dict(
+        feed["metaData"],
+        timeStamp="20190721_%06d" % (170500 + plays * 30),
+        gameEvents=["pitch"],
+    )
+    state["gameData"] = dict(
+        feed["gameData"],
+        status=dict(
+            feed["gameData"]["status"],
+            abstractGameState="Live",
+            codedGameState="I",
+            detailedState="In Progress",
+            statusCode="I",
+        ),
+    )
+    state["liveData"] = dict(feed["liveData"])
+    state["liveData"]["plays"] = dict(
+        feed["liveData"]["plays"],
+        allPlays=all_plays,
+        currentPlay=all_plays[-1],
+        scoringPlays=[
+            p["atBatIndex"] for p in all_plays if p["about"]["isScoringPlay"]
+        ],
+    )
+    return state
+
+
+def make_patch(old, new, path=""):
+    """Return JSON patch operations turning old into new, like a diffPatch response."""
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+    if isinstance(old, dict):
+        ops = []
+        for key, value in new.items():
+            p = path + "/" + str(key).replace("~", "~0").replace("/", "~1")
+            if key not in old:
+                ops.append({"op": "add", "path": p, "value": value})
+            elif old[key] is not value:
+                ops.extend(make_patch(old[key], value, p))
+        for key in old:
+            if key not in new:
+                p = path + "/" + str(key).replace("~", "~0").replace("/", "~1")
+                ops.append({"op": "remove", "path": p})
+        return ops
+    if isinstance(old, list) and len(new) >= len(old):
+        ops = []
+        for i, value in enumerate(new):
+            if i >= len(old):
+                ops.append({"op": "add", "path": path + "/-", "value": value})
+            elif old[i] is not value:
+                ops.extend(make_patch(old[i], value, "%s/%d" % (path, i)))
+        return ops
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
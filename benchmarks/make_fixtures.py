@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""Record the payloads replayed by bench_parsers.py.
+
+Run from the repository root:
+
+    python benchmarks/make_fixtures.py
+
+Runs every bench_parsers case through a RecordingTransport, so the archive
+holds exactly the requests the client makes, with the URLs and parameters
+it builds. The responses are the synthetic payloads from feeds.py, served
+in place of the StatsAPI; replace SyntheticTransport with
+statsapi.transport.RequestsTransport() to record real responses instead.
+The archive is overwritten.
+"""
+import os
+import re
+import sys
+from urllib.parse import urlsplit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+import statsapi  # noqa: E402
+from statsapi import transport  # noqa: E402
+
+import bench_parsers  # noqa: E402
+import feeds  # noqa: E402
+
+INNINGS = dict(zip(bench_parsers.GAMES, [9, 12, 15]))
+
+
+class SyntheticTransport(transport.Transport):
+    """Serves the payloads from feeds.py for the StatsAPI URLs the cases request."""
+
+    def __init__(self):
+        self._bodies = {}
+
+    def payload(self, path):
+        game = re.search(r"/game/(\d+)/feed/live$", path)
+        if game:
+            gamePk = int(game.group(1))
+            return feeds.live_feed(gamePk, innings=INNINGS.get(gamePk, 9))
+        if path.endswith("/schedule"):
+            return feeds.season_schedule(bench_parsers.SEASON)
+        if re.search(r"/sports/\d+/players$", path):
+            return feeds.sports_players(bench_parsers.SEASON)
+        if path.endswith("/standings"):
+            return feeds.standings(bench_parsers.SEASON)
+
+        raise LookupError("No synthetic payload for %s" % path)
+
+    def get(self, url, **request_kwargs):
+        path = urlsplit(url).path
+        if path not in self._bodies:
+            self._bodies[path] = feeds.dumps(self.payload(path))
+
+        return transport._response(
+            url,
+            {
+                "status": 200,
+                "headers": {"Content-Type": "application/json;charset=UTF-8"},
+                "text": self._bodies[path],
+            },
+        )
+
+
+def main():
+    os.makedirs(os.path.dirname(bench_parsers.FIXTURES), exist_ok=True)
+    if os.path.exists(bench_parsers.FIXTURES):
+        os.remove(bench_parsers.FIXTURES)
+
+    recorder = transport.RecordingTransport(
+        bench_parsers.FIXTURES, SyntheticTransport()
+    )
+    with statsapi.StatsAPIClient(transport=recorder) as client:
+        for name, fn in bench_parsers.CASES:
+            fn(client)
+            print("recorded", name)
+
+    print(
+        "\n%s: %.2f MB"
+        % (bench_parsers.FIXTURES, os.path.getsize(bench_parsers.FIXTURES) / 1000000)
+    )
+
+
+if __name__ == "__main__":
+    main()
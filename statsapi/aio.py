@@ -0,0 +1,305 @@
+# encoding=utf-8
+"""asyncio interface to the MLB StatsAPI.
+
+AsyncStatsAPIClient runs requests through a StatsAPIClient on a bounded pool
+of worker threads, so coroutines never block the event loop, at most
+max_concurrency requests are in flight at once, and every request reuses
+the worker thread's pooled keep-alive session. With coalesce=True, concurrent
+identical requests are coalesced into one. The client's rate limiter is awaited on the event
+loop rather than in a worker thread. Request parameters and response parsing come from
+statsapi.parsers, the same code the synchronous functions use.
+
+    import asyncio
+    import statsapi
+
+    async def main():
+        games = await statsapi.aschedule(date="07/04/2023")
+        return await asyncio.gather(
+            *(statsapi.alinescore(g["game_id"]) for g in games)
+        )
+
+    asyncio.run(main())
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from . import parsers
+from . import singleflight
+from .cache import make_key
+from .client import default_client
+
+DEFAULT_CONCURRENCY = 10
+"""Default maximum number of concurrent requests per async client"""
+
+
+def _traced(method):
+    """Open a "call" span around the coroutine method when the client has a tracer."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        tracer = self.client.tracer
+        if tracer is None:
+            return await method(self, *args, **kwargs)
+
+        with tracer.span(name, "call", args=args, kwargs=kwargs):
+            return await method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncStatsAPIClient(object):
+    """asyncio wrapper around a StatsAPIClient.
+
+    * client - StatsAPIClient to send requests with (default: statsapi.default_client())
+    * max_concurrency - maximum number of requests in flight at once
+    * coalesce - share one request among concurrent identical get() calls; the
+        callers then receive the same objects, so treat results as read-only
+    """
+
+    def __init__(
+        self, client=None, max_concurrency=DEFAULT_CONCURRENCY, coalesce=False
+    ):
+        self._client = client
+        self.max_concurrency = max_concurrency
+        self.singleflight = singleflight.AsyncSingleFlight() if coalesce else None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="statsapi-aio"
+        )
+
+    @property
+    def client(self):
+        """StatsAPIClient used for requests."""
+        return self._client if self._client is not None else default_client()
+
+    async def get(self, endpoint, params={}, force=False, *, request_kwargs={}):
+        """Call MLB StatsAPI and return JSON data. Async version of statsapi.get()."""
+        if self.singleflight is not None:
+            return await self.singleflight.do(
+                make_key(endpoint, params, force),
+                self._get,
+                endpoint,
+                params,
+                force,
+                request_kwargs,
+            )
+
+        return await self._get(endpoint, params, force, request_kwargs)
+
+    async def _get(self, endpoint, params, force, request_kwargs):
+        client = self.client
+        kwargs = {"request_kwargs": request_kwargs}
+        if client.rate_limiter is not None:
+            # Wait for a request slot here so throttled requests don't hold worker threads
+            await client.rate_limiter.acquire_async(endpoint)
+            kwargs["_acquired"] = True
+
+        # Run in a copy of this task's context so the worker's spans nest in ours
+        call = functools.partial(
+            contextvars.copy_context().run,
+            client.get,
+            endpoint,
+            params,
+            force,
+            **kwargs
+        )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, call)
+
+    @_traced
+    async def schedule(
+        self,
+        date=None,
+        start_date=None,
+        end_date=None,
+        team="",
+        opponent="",
+        sportId=1,
+        game_id=None,
+        leagueId=None,
+        season=None,
+        include_series_status=True,
+    ):
+        """Get list of games for a given date/range and/or team/opponent."""
+        r = await self.get(
+            "schedule",
+            parsers.schedule_params(
+                date,
+                start_date,
+                end_date,
+                team,
+                opponent,
+                sportId,
+                game_id,
+                leagueId,
+                season,
+                include_series_status,
+                logger=self.client.logger,
+            ),
+        )
+        with self.client._span("transform"):
+            return parsers.parse_schedule(r)
+
+    @_traced
+    async def boxscore_data(self, gamePk, timecode=None, compact=False):
+        """Returns a python dict containing boxscore data for a given game."""
+        r = await self.get("game", parsers.boxscore_data_params(gamePk, timecode))
+        with self.client._span("transform"):
+            return parsers.parse_boxscore_data(r, compact)
+
+    @_traced
+    async def linescore(self, gamePk, timecode=None):
+        """Get formatted linescore for a given game."""
+        r = await self.get("game", parsers.linescore_params(gamePk, timecode))
+        with self.client._span("render"):
+            return parsers.parse_linescore(r)
+
+    @_traced
+    async def game_scoring_play_data(self, gamePk):
+        """Returns a python dict of scoring plays for a given game."""
+        r = await self.get("game", parsers.game_scoring_play_data_params(gamePk))
+        with self.client._span("transform"):
+            return parsers.parse_game_scoring_play_data(r)
+
+    @_traced
+    async def player_stat_data(
+        self,
+        personId,
+        group="[hitting,pitching,fielding]",
+        type="season",
+        sportId=1,
+        season=None,
+    ):
+        """Returns a list of current season or career stat data for a given player."""
+        r = await self.get(
+            "person",
+            parsers.player_stat_data_params(personId, group, type, sportId, season),
+        )
+        with self.client._span("transform"):
+            return parsers.parse_player_stat_data(r)
+
+    @_traced
+    async def standings_data(
+        self,
+        leagueId="103,104",
+        division="all",
+        include_wildcard=True,
+        season=None,
+        standingsTypes=None,
+        date=None,
+    ):
+        """Returns a dict of standings data for a given league/division and season."""
+        r = await self.get(
+            "standings",
+            parsers.standings_data_params(
+                leagueId, division, include_wildcard, season, standingsTypes, date
+            ),
+        )
+        with self.client._span("transform"):
+            return parsers.parse_standings_data(r, division)
+
+    def close(self):
+        """Shut down the worker threads. Pending requests are allowed to finish."""
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+_default_async_client = None
+_default_async_client_lock = threading.Lock()
+
+
+def default_async_client():
+    """Return the async client used by the module-level async functions."""
+    global _default_async_client
+    if _default_async_client is None:
+        with _default_async_client_lock:
+            if _default_async_client is None:
+                _default_async_client = AsyncStatsAPIClient()
+
+    return _default_async_client
+
+
+def set_default_async_client(client):
+    """Replace the async client used by the module-level async functions. Pass None to reset."""
+    global _default_async_client
+    _default_async_client = client
+
+
+async def aget(endpoint, params={}, force=False, *, request_kwargs={}):
+    """Call MLB StatsAPI and return JSON data. Async version of statsapi.get()."""
+    return await default_async_client().get(
+        endpoint, params, force, request_kwargs=request_kwargs
+    )
+
+
+async def aschedule(
+    date=None,
+    start_date=None,
+    end_date=None,
+    team="",
+    opponent="",
+    sportId=1,
+    game_id=None,
+    leagueId=None,
+    season=None,
+    include_series_status=True,
+):
+    """Get list of games for a given date/range and/or team/opponent."""
+    return await default_async_client().schedule(
+        date,
+        start_date,
+        end_date,
+        team,
+        opponent,
+        sportId,
+        game_id,
+        leagueId,
+        season,
+        include_series_status,
+    )
+
+
+async def aboxscore_data(gamePk, timecode=None, compact=False):
+    """Returns a python dict containing boxscore data for a given game."""
+    return await default_async_client().boxscore_data(gamePk, timecode, compact)
+
+
+async def alinescore(gamePk, timecode=None):
+    """Get formatted linescore for a given game."""
+    return await default_async_client().linescore(gamePk, timecode)
+
+
+async def agame_scoring_play_data(gamePk):
+    """Returns a python dict of scoring plays for a given game."""
+    return await default_async_client().game_scoring_play_data(gamePk)
+
+
+async def aplayer_stat_data(
+    personId, group="[hitting,pitching,fielding]", type="season", sportId=1, season=None
+):
+    """Returns a list of current season or career stat data for a given player."""
+    return await default_async_client().player_stat_data(
+        personId, group, type, sportId, season
+    )
+
+
+async def astandings_data(
+    leagueId="103,104",
+    division="all",
+    include_wildcard=True,
+    season=None,
+    standingsTypes=None,
+    date=None,
+):
+    """Returns a dict of standings data for a given league/division and season."""
+    return await default_async_client().standings_data(
+        leagueId, division, include_wildcard, season, standingsTypes, date
+    )
@@ -0,0 +1,697 @@
+# encoding=utf-8
+"""Response caching for MLB StatsAPI requests.
+
+A cache is attached to a client and consulted by get() before any request is
+made:
+
+    client = statsapi.StatsAPIClient(cache=statsapi.cache.MemoryCache())
+    statsapi.set_default_client(client)
+
+Entries are keyed on the endpoint name and the sorted request parameters, and
+expire after a per-endpoint TTL. Responses that can never change (requests
+pinned to a timecode, and feeds of games whose detailedState is Final) are
+kept without expiry, subject only to the cache's size limits. MemoryCache
+responses are shared between callers, so treat the returned data as read-only.
+
+SQLiteCache keeps responses on disk, where every process on the host using
+the same file shares them. Run prune() periodically to drop expired entries:
+
+    statsapi.StatsAPIClient(cache=statsapi.cache.SQLiteCache("/var/cache/statsapi.db"))
+    statsapi.cache.prune()
+"""
+import collections
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from . import decoding
+
+DEFAULT_TTL = 60
+"""Seconds to cache responses from endpoints without a TTL of their own"""
+
+DEFAULT_TTLS = {
+    "meta": 6 * 60 * 60,
+    "season": 60 * 60,
+    "seasons": 60 * 60,
+    "sports": 60 * 60,
+    "sports_players": 60 * 60,
+    "teams": 60 * 60,
+    "team": 10 * 60,
+    "person": 10 * 60,
+    "people": 10 * 60,
+    "standings": 5 * 60,
+    "schedule": 60,
+    "game": 10,
+    "game_diff": 5,
+    "game_timestamps": 10,
+    "game_changes": 5,
+}
+"""Seconds to cache responses from each endpoint"""
+
+DEFAULT_MAX_ENTRIES = 1024
+"""Default maximum number of entries held by a MemoryCache"""
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+"""Default maximum total response size held by a MemoryCache"""
+DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+"""Default maximum total compressed size held by a SQLiteCache"""
+ACCESS_BATCH_SIZE = 256
+"""Cache hits a SQLiteCache records in memory before writing their access times"""
+
+
+DEFAULT_STALE_TTL = 60 * 60
+"""Seconds an expired response with validators is kept for conditional requests"""
+
+
+def make_key(endpoint, params, force=False):
+    """Return the canonical cache key for a request."""
+    return (
+        endpoint,
+        tuple(sorted((str(k), str(v)) for k, v in params.items())),
+        bool(force),
+    )
+
+
+class CacheEntry(object):
+    """A cached response.
+
+    * data - the decoded response
+    * size - size of the response body in bytes
+    * expires - time.time() after which the entry is stale, or None to never expire
+    * etag - ETag header of the response, if any
+    * last_modified - Last-Modified header of the response, if any
+    * load - callable returning the decoded response, to decode it only when
+        data is first used (data is ignored when load is given)
+    """
+
+    __slots__ = ("_data", "_load", "size", "expires", "etag", "last_modified")
+
+    def __init__(
+        self, data, size, expires=None, etag=None, last_modified=None, load=None
+    ):
+        self._data = data
+        self._load = load
+        self.size = size
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def data(self):
+        if self._load is not None:
+            self._data = self._load()
+            self._load = None
+
+        return self._data
+
+    def is_fresh(self, now=None):
+        return self.expires is None or (now or time.time()) < self.expires
+
+    def can_revalidate(self):
+        """Return True if the entry has validators for a conditional request."""
+        return bool(self.etag or self.last_modified)
+
+
+SETTLED_STATES = ("Final",)
+"""detailedStates of games whose feed will not change again"""
+
+
+def is_immutable(params, data):
+    """Return True if a response can never change and may be cached without expiry.
+
+    That is the case for requests pinned to a timecode and for game feeds
+    whose detailedState is Final. Other Final games are not settled: "Game
+    Over" feeds still get decisions and scoring changes, and postponed,
+    suspended and cancelled games will be played or changed later.
+    params should only hold parameters the endpoint accepts.
+    """
+    if params.get("timecode"):
+        return True
+
+    if isinstance(data, dict):
+        status = data.get("gameData", {}).get("status", {})
+        return (
+            status.get("abstractGameState") == "Final"
+            and status.get("detailedState") in SETTLED_STATES
+        )
+
+    return False
+
+
+class BaseCache(object):
+    """Expiry policy and statistics shared by the response caches.
+
+    * ttl - seconds to cache endpoints not found in ttls
+    * ttls - dict of endpoint name: seconds, merged over DEFAULT_TTLS
+    * permanent - cache immutable responses (see is_immutable()) without expiry
+    * stale_ttl - seconds to keep expired responses that have an ETag or
+        Last-Modified header, so they can be revalidated with a conditional request
+    """
+
+    def __init__(
+        self, ttl=DEFAULT_TTL, ttls=None, permanent=True, stale_ttl=DEFAULT_STALE_TTL
+    ):
+        self.ttl = ttl
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.permanent = permanent
+        self.stale_ttl = stale_ttl
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "not_modified": 0,
+            "bytes_saved": 0,
+        }
+
+    def ttl_for(self, endpoint, params=None, data=None):
+        """Return the number of seconds to cache a response, or None to never expire it.
+
+        Without params and data, returns the TTL configured for the endpoint.
+        """
+        if self.permanent and params is not None and is_immutable(params, data):
+            return None
+
+        return self.ttls.get(endpoint, self.ttl)
+
+    def revalidated(self, key, entry, ttl):
+        """Record a 304 Not Modified response for a stale entry and renew it for ttl seconds."""
+        entry.expires = None if ttl is None else time.time() + ttl
+        self._renew(key, entry.expires)
+        with self._stats_lock:
+            self._stats["not_modified"] += 1
+            self._stats["bytes_saved"] += entry.size
+
+    def stats(self):
+        """Return a dict of cache statistics.
+
+        * hits, misses - lookups answered / not answered by a fresh entry
+        * stale - misses that found an expired entry which could be revalidated
+        * evictions, expirations - entries removed for space / age
+        * not_modified - 304 responses to conditional requests
+        * bytes_saved - response bytes not downloaded thanks to 304 responses
+        * entries, bytes - current number and size of cached responses
+        """
+        entries, total = self._usage()
+        with self._stats_lock:
+            stats = dict(self._stats, entries=entries, bytes=total)
+
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def _count(self, stat, n=1):
+        with self._stats_lock:
+            self._stats[stat] += n
+
+    def _discard_at(self, expires, revalidatable):
+        """Return the time.time() after which an entry is useless, or None."""
+        if expires is None:
+            return None
+
+        return expires + self.stale_ttl if revalidatable else expires
+
+    def _renew(self, key, expires):
+        raise NotImplementedError
+
+    def _usage(self):
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """In-process response cache with per-endpoint TTLs and LRU eviction.
+
+    * ttl, ttls, permanent, stale_ttl - expiry policy, see BaseCache
+    * max_entries - maximum number of cached responses
+    * max_bytes - maximum total size of cached response bodies
+
+    The least recently used entries are evicted when either limit is exceeded.
+    """
+
+    def __init__(
+        self,
+        ttl=DEFAULT_TTL,
+        ttls=None,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        max_bytes=DEFAULT_MAX_BYTES,
+        permanent=True,
+        stale_ttl=DEFAULT_STALE_TTL,
+    ):
+        super(MemoryCache, self).__init__(ttl, ttls, permanent, stale_ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, allow_stale=False):
+        """Return the fresh CacheEntry for key, or None.
+
+        With allow_stale, an expired entry that can be revalidated is returned
+        instead of None; check it with entry.is_fresh().
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.is_fresh(now):
+                if now >= self._discard_at(entry.expires, entry.can_revalidate()):
+                    self._remove(key)
+                    self._count("expirations")
+                    entry = None
+                elif allow_stale:
+                    self._entries.move_to_end(key)
+                    self._count("misses")
+                    self._count("stale")
+                    return entry
+                else:
+                    entry = None
+
+            if entry is None:
+                self._count("misses")
+                return None
+
+            self._entries.move_to_end(key)
+            self._count("hits")
+            return entry
+
+    def set(
+        self, key, data, size=0, ttl=None, body=None, etag=None, last_modified=None
+    ):
+        """Cache data under key for ttl seconds. A ttl of None never expires.
+
+        body is the raw response body; it is not used by MemoryCache.
+        etag and last_modified are the response's validators, if any.
+        """
+        if size > self.max_bytes or (ttl == 0 and not (etag or last_modified)):
+            return
+
+        entry = CacheEntry(
+            data,
+            size,
+            None if ttl is None else time.time() + ttl,
+            etag,
+            last_modified,
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = entry
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._count("evictions")
+
+    def delete(self, key):
+        """Remove key from the cache, if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def prune(self):
+        """Remove expired entries. Returns the number of entries removed.
+
+        Expired entries that can be revalidated are kept for stale_ttl seconds.
+        """
+        now = time.time()
+        with self._lock:
+            expired = [
+                k
+                for k, e in self._entries.items()
+                if e.expires is not None
+                and now >= self._discard_at(e.expires, e.can_revalidate())
+            ]
+            for k in expired:
+                self._remove(k)
+
+        self._count("expirations", len(expired))
+        return len(expired)
+
+    def _renew(self, key, expires):
+        # The entry object is shared with the caller and was updated in place
+        pass
+
+    def _usage(self):
+        with self._lock:
+            return len(self._entries), self._bytes
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+class SQLiteCache(BaseCache):
+    """Disk-backed response cache in a SQLite database, shared across processes.
+
+    * path - database file; created if it does not exist
+    * ttl, ttls, permanent, stale_ttl - expiry policy, see BaseCache
+    * max_bytes - maximum total compressed size of the responses on disk
+    * compress_level - zlib compression level for stored responses
+    * decoder - callable turning a stored response body into data (default: statsapi.decoding.loads)
+    * timeout - seconds to wait for another process's write lock
+
+    The database runs in WAL mode so readers in other processes are not blocked
+    by a writer. Each thread uses its own connection. Responses are stored as
+    zlib-compressed JSON and the least recently used are evicted past max_bytes.
+    Hits stay read-only: their access times are written in one batch with the
+    next set(), or after ACCESS_BATCH_SIZE hits. Triggers keep the total stored
+    size in a one-row table so set() does not sum the whole table.
+
+    As with MemoryCache, the bytes and bytes_saved statistics count response
+    bodies as downloaded. Only max_bytes applies to the compressed size.
+    """
+
+    def __init__(
+        self,
+        path,
+        ttl=DEFAULT_TTL,
+        ttls=None,
+        max_bytes=DEFAULT_MAX_DISK_BYTES,
+        compress_level=6,
+        decoder=None,
+        timeout=30,
+        permanent=True,
+        stale_ttl=DEFAULT_STALE_TTL,
+    ):
+        super(SQLiteCache, self).__init__(ttl, ttls, permanent, stale_ttl)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.decoder = decoder or decoding.loads
+        self.timeout = timeout
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._accessed = {}
+        self._accessed_lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self):
+        if self._pid != os.getpid():
+            # Connections must not be shared with a forked child
+            self._local = threading.local()
+            self._pid = os.getpid()
+            self._accessed = {}
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Rows removed by INSERT OR REPLACE fire the usage DELETE trigger
+            conn.execute("PRAGMA recursive_triggers=ON")
+            self._local.conn = conn
+
+        return conn
+
+    def _init_db(self):
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "endpoint TEXT, "
+            "body BLOB, "
+            "size INTEGER, "
+            "stored_size INTEGER, "
+            "expires REAL, "
+            "accessed REAL, "
+            "etag TEXT, "
+            "last_modified TEXT, "
+            "discard_at REAL)"
+        )
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(responses)")]
+        for column, column_type in [
+            ("etag", "TEXT"),
+            ("last_modified", "TEXT"),
+            ("discard_at", "REAL"),
+            ("stored_size", "INTEGER"),
+        ]:
+            if column not in columns:
+                # Upgrade a database created by an earlier version
+                conn.execute(
+                    "ALTER TABLE responses ADD COLUMN %s %s" % (column, column_type)
+                )
+                if column == "discard_at":
+                    conn.execute("UPDATE responses SET discard_at = expires")
+                elif column == "stored_size":
+                    self._upgrade_sizes(conn)
+
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS usage "
+            "(id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER)"
+        )
+        with self._transaction(conn):
+            conn.execute(
+                "INSERT OR IGNORE INTO usage (id, bytes) "
+                "SELECT 0, COALESCE(SUM(stored_size), 0) FROM responses"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses "
+                "BEGIN UPDATE usage SET bytes = bytes + NEW.stored_size WHERE id = 0; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses "
+                "BEGIN UPDATE usage SET bytes = bytes - OLD.stored_size WHERE id = 0; END"
+            )
+
+    def _upgrade_sizes(self, conn):
+        """Move the compressed lengths earlier versions kept in size to
+        stored_size, and store each body's own length in size."""
+        with self._transaction(conn):
+            conn.execute("UPDATE responses SET stored_size = size")
+            conn.executemany(
+                "UPDATE responses SET size = ? WHERE key = ?",
+                [
+                    (len(zlib.decompress(body)), key)
+                    for key, body in conn.execute("SELECT key, body FROM responses")
+                ],
+            )
+            # The usage total and its triggers are rebuilt on stored_size
+            conn.execute("DROP TRIGGER IF EXISTS responses_insert")
+            conn.execute("DROP TRIGGER IF EXISTS responses_delete")
+            conn.execute("DROP TABLE IF EXISTS usage")
+
+    @contextlib.contextmanager
+    def _transaction(self, conn):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def get(self, key, allow_stale=False):
+        """Return the fresh CacheEntry for key, or None.
+
+        With allow_stale, an expired entry that can be revalidated is returned
+        instead of None; check it with entry.is_fresh().
+        """
+        conn = self._connect()
+        db_key = _db_key(key)
+        now = time.time()
+        row = conn.execute(
+            "SELECT body, size, expires, etag, last_modified, discard_at "
+            "FROM responses WHERE key = ?",
+            (db_key,),
+        ).fetchone()
+        if row is not None and row[5] is not None and row[5] <= now:
+            conn.execute(
+                "DELETE FROM responses WHERE key = ? AND discard_at <= ?",
+                (db_key, now),
+            )
+            self._count("expirations")
+            row = None
+
+        stale = row is not None and row[2] is not None and row[2] <= now
+        if row is None or (stale and not allow_stale):
+            self._count("misses")
+            return None
+
+        with self._accessed_lock:
+            self._accessed[db_key] = now
+            flush = len(self._accessed) >= ACCESS_BATCH_SIZE
+        if flush:
+            with self._transaction(conn):
+                self._write_accessed(conn)
+
+        if stale:
+            self._count("misses")
+            self._count("stale")
+        else:
+            self._count("hits")
+
+        # Decoded on first use: a stale entry revalidated with a 200 never is
+        blob = row[0]
+        return CacheEntry(
+            None,
+            row[1],
+            row[2],
+            row[3],
+            row[4],
+            load=lambda: self.decoder(zlib.decompress(blob)),
+        )
+
+    def set(
+        self, key, data, size=0, ttl=None, body=None, etag=None, last_modified=None
+    ):
+        """Cache data under key for ttl seconds. A ttl of None never expires.
+
+        body is the raw response body; data is re-encoded as JSON if it is not given.
+        etag and last_modified are the response's validators, if any.
+        """
+        if ttl == 0 and not (etag or last_modified):
+            return
+
+        if body is None:
+            body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        elif isinstance(body, str):
+            body = body.encode("utf-8")
+
+        blob = zlib.compress(body, self.compress_level)
+        if len(blob) > self.max_bytes:
+            return
+
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        conn = self._connect()
+        with self._transaction(conn):
+            self._write_accessed(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, endpoint, body, size, stored_size, expires, accessed, etag, "
+                "last_modified, discard_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    _db_key(key),
+                    key[0] if isinstance(key, tuple) else None,
+                    sqlite3.Binary(blob),
+                    len(body),
+                    len(blob),
+                    expires,
+                    now,
+                    etag,
+                    last_modified,
+                    self._discard_at(expires, bool(etag or last_modified)),
+                ),
+            )
+            self._evict(conn)
+
+    def delete(self, key):
+        """Remove key from the cache, if present."""
+        self._connect().execute("DELETE FROM responses WHERE key = ?", (_db_key(key),))
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._accessed_lock:
+            self._accessed.clear()
+        self._connect().execute("DELETE FROM responses")
+
+    def prune(self, vacuum=False):
+        """Remove expired entries and enforce max_bytes. Returns the number of entries removed.
+
+        Expired entries that can be revalidated are kept for stale_ttl seconds.
+        Pass vacuum=True to also return the freed space to the filesystem.
+        """
+        conn = self._connect()
+        with self._transaction(conn):
+            self._write_accessed(conn)
+            cur = conn.execute(
+                "DELETE FROM responses WHERE discard_at IS NOT NULL AND discard_at <= ?",
+                (time.time(),),
+            )
+            removed = cur.rowcount
+            self._count("expirations", removed)
+            # Correct the running total if anything bypassed the triggers
+            conn.execute(
+                "UPDATE usage SET bytes = "
+                "(SELECT COALESCE(SUM(stored_size), 0) FROM responses) WHERE id = 0"
+            )
+            removed += self._evict(conn)
+        if vacuum:
+            conn.execute("VACUUM")
+
+        return removed
+
+    def close(self):
+        """Write pending access times and close the calling thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            with self._transaction(conn):
+                self._write_accessed(conn)
+            conn.close()
+            self._local.conn = None
+
+    def _renew(self, key, expires):
+        self._connect().execute(
+            "UPDATE responses SET expires = ?, discard_at = ? WHERE key = ?",
+            (expires, self._discard_at(expires, True), _db_key(key)),
+        )
+
+    def _usage(self):
+        return (
+            self._connect()
+            .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses")
+            .fetchone()
+        )
+
+    def _write_accessed(self, conn):
+        with self._accessed_lock:
+            accessed, self._accessed = self._accessed, {}
+        conn.executemany(
+            "UPDATE responses SET accessed = MAX(accessed, ?) WHERE key = ?",
+            [(t, k) for k, t in accessed.items()],
+        )
+
+    def _evict(self, conn):
+        (total,) = conn.execute("SELECT bytes FROM usage WHERE id = 0").fetchone()
+        if total <= self.max_bytes:
+            return 0
+
+        excess = total - self.max_bytes
+        keys = []
+        for k, stored_size in conn.execute(
+            "SELECT key, stored_size FROM responses ORDER BY accessed ASC"
+        ):
+            keys.append((k,))
+            excess -= stored_size
+            if excess <= 0:
+                break
+
+        conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+        self._count("evictions", len(keys))
+        return len(keys)
+
+
+def _db_key(key):
+    return json.dumps(key, separators=(",", ":"))
+
+
+def prune(cache=None, **kwargs):
+    """Remove expired entries from the given cache, or the default client's cache.
+
+    Returns the number of entries removed.
+    """
+    if cache is None:
+        from .client import default_client
+
+        cache = default_client().cache
+        if cache is None:
+            return 0
+
+    return cache.prune(**kwargs)
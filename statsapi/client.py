@@ -0,0 +1,1212 @@
+# encoding=utf-8
+"""StatsAPIClient - a self-contained, configurable MLB StatsAPI client.
+
+The module-level functions in `statsapi` are thin wrappers over a default
+client, so applications that need several differently configured pipelines
+in one process can create their own clients instead of changing globals:
+
+    live = statsapi.StatsAPIClient(request_kwargs={"timeout": 5})
+    backfill = statsapi.StatsAPIClient(request_kwargs={"timeout": 60})
+    live.schedule(date="07/04/2023")
+"""
+import collections
+import contextlib
+import contextvars
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+import requests
+
+from . import cache as _cache
+from . import decoding
+from . import endpoints as _endpoints
+from . import parsers
+from . import plans
+from . import ratelimit
+from . import render
+from . import sessions
+from . import singleflight
+from . import stream
+from . import transport as _transport
+
+DEFAULT_BATCH_WORKERS = 8
+"""Default number of worker threads used by get_many()"""
+
+BatchResult = collections.namedtuple("BatchResult", ["params", "data", "error"])
+"""Result of one request made by get_many(). Exactly one of data or error is set."""
+
+_NO_SPAN = contextlib.nullcontext()
+
+
+def _traced(method):
+    """Open a "call" span around the method when the client has a tracer."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.tracer is None:
+            return method(self, *args, **kwargs)
+
+        with self.tracer.span(name, "call", args=args, kwargs=kwargs):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class StatsAPIClient(object):
+    """MLB StatsAPI client holding its own transport and configuration.
+
+    * base_url - StatsAPI base URL, replaces statsapi.BASE_URL in endpoint URLs
+    * endpoints - endpoint configuration dict, defaults to statsapi.ENDPOINTS
+    * session - a requests.Session to use for every request
+    * pool - a statsapi.sessions.SessionPool to draw per-thread sessions from
+        (default: the shared pool in statsapi.sessions)
+    * request_kwargs - default keyword arguments for every request, e.g. {"timeout": 10}
+    * logger - logger to use instead of the "statsapi" logger
+    * cache - response cache consulted by get(), e.g. statsapi.cache.MemoryCache()
+    * coalesce - share one request among concurrent identical get() calls
+        (the request_kwargs of the first caller are used). Off by default:
+        the callers then receive the same objects, so treat results as read-only
+    * rate_limiter - statsapi.ratelimit.RateLimiter to pace requests with
+    * retry - statsapi.ratelimit.RetryPolicy for throttled and failed requests
+        (default: RetryPolicy()), or False to never retry
+    * decoder - callable decoding a response body, e.g.
+        statsapi.decoding.get_decoder(intern_keys=True)
+        (default: statsapi.decoding.loads, the fastest installed JSON decoder)
+    * transport - statsapi.transport.Transport that sends requests, e.g. a
+        ReplayTransport to work offline (default: RequestsTransport over the pool)
+    * metrics - statsapi.metrics.Metrics to record per-endpoint request metrics in
+    * tracer - statsapi.tracing.Tracer to receive spans for each call and phase
+    """
+
+    def __init__(
+        self,
+        base_url=None,
+        endpoints=None,
+        session=None,
+        pool=None,
+        request_kwargs=None,
+        logger=None,
+        cache=None,
+        coalesce=False,
+        rate_limiter=None,
+        retry=None,
+        decoder=None,
+        transport=None,
+        metrics=None,
+        tracer=None,
+    ):
+        self.base_url = base_url or _endpoints.BASE_URL
+        self.endpoints = endpoints if endpoints is not None else _endpoints.ENDPOINTS
+        if session is not None and pool is None:
+            pool = sessions.SessionPool(session=session)
+        self.pool = pool
+        self.request_kwargs = dict(request_kwargs or {})
+        self.logger = logger or logging.getLogger("statsapi")
+        self.cache = cache
+        self.singleflight = singleflight.SingleFlight() if coalesce else None
+        self.rate_limiter = rate_limiter
+        self.retry = ratelimit.RetryPolicy() if retry is None else (retry or None)
+        self.decoder = decoder or decoding.loads
+        self.transport = transport or _transport.RequestsTransport(pool)
+        self.metrics = metrics
+        self.tracer = tracer
+        self._plans = {}
+        self._batch_executor = None
+        self._batch_workers = 0
+        self._batch_users = {}
+        self._batch_lock = threading.Lock()
+
+    def get_session(self):
+        """Return the session the calling thread should use for requests."""
+        if self.pool is not None:
+            return self.pool.get_session()
+
+        return sessions.get_session()
+
+    def close(self):
+        """Close the transport and the sessions in this client's pool
+        (the shared default pool is left open)."""
+        self.transport.close()
+        with self._batch_lock:
+            executor = self._batch_executor
+            self._batch_executor = None
+            self._batch_workers = 0
+            if executor is not None and not self._batch_users.get(executor):
+                executor.shutdown(wait=False)
+
+        if self.pool is not None:
+            self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _span(self, phase, name=None, **attributes):
+        """Return a context manager tracing a phase of the current call."""
+        if self.tracer is None:
+            return _NO_SPAN
+
+        return self.tracer.span(name, phase, **attributes)
+
+    @_traced
+    def schedule(
+        self,
+        date=None,
+        start_date=None,
+        end_date=None,
+        team="",
+        opponent="",
+        sportId=1,
+        game_id=None,
+        leagueId=None,
+        season=None,
+        include_series_status=True,
+    ):
+        """Get list of games for a given date/range and/or team/opponent."""
+        r = self.get(
+            "schedule",
+            parsers.schedule_params(
+                date,
+                start_date,
+                end_date,
+                team,
+                opponent,
+                sportId,
+                game_id,
+                leagueId,
+                season,
+                include_series_status,
+                logger=self.logger,
+            ),
+        )
+        with self._span("transform"):
+            return parsers.parse_schedule(r)
+
+    @_traced
+    def boxscore(
+        self,
+        gamePk,
+        battingBox=True,
+        battingInfo=True,
+        fieldingInfo=True,
+        pitchingBox=True,
+        gameInfo=True,
+        timecode=None,
+        format="text",
+    ):
+        """Get a formatted boxscore for a given game.
+
+        * format - "text", "markdown", "html" or "json" (see statsapi.render)
+        """
+        boxData = self.boxscore_data(gamePk, timecode)
+
+        with self._span("render"):
+            return render.boxscore(
+                boxData,
+                format,
+                battingBox,
+                battingInfo,
+                fieldingInfo,
+                pitchingBox,
+                gameInfo,
+            )
+
+    @_traced
+    def boxscore_data(self, gamePk, timecode=None, compact=False):
+        """Returns a python dict containing boxscore data for a given game.
+
+        With compact=True, the batter and pitcher rows are BatterRow and
+        PitcherRow namedtuples of the StatsAPI values instead of dicts of strings.
+        """
+        r = self.get("game", parsers.boxscore_data_params(gamePk, timecode))
+        with self._span("transform"):
+            return parsers.parse_boxscore_data(r, compact)
+
+    @_traced
+    def linescore(self, gamePk, timecode=None, format="text"):
+        """Get formatted linescore for a given game.
+
+        * format - "text", "markdown", "html" or "json" (see statsapi.render)
+        """
+        r = self.get("game", parsers.linescore_params(gamePk, timecode))
+        with self._span("render"):
+            return render.linescore(r, format)
+
+    @_traced
+    def last_game(self, teamId):
+        """Get the gamePk for the given team's most recent completed game."""
+        previousSchedule = self.get(
+            "team",
+            {
+                "teamId": teamId,
+                "hydrate": "previousSchedule",
+                "fields": "teams,team,id,previousGameSchedule,dates,date,games,gamePk,gameDate,status,abstractGameCode",
+            },
+        )
+        with self._span("transform"):
+            games = []
+            for d in previousSchedule["teams"][0]["previousGameSchedule"]["dates"]:
+                games.extend(
+                    [x for x in d["games"] if x["status"]["abstractGameCode"] == "F"]
+                )
+
+            if not len(games):
+                return None
+
+            return games[-1]["gamePk"]
+
+    @_traced
+    def next_game(self, teamId):
+        """Get the gamePk for the given team's next unstarted game."""
+        nextSchedule = self.get(
+            "team",
+            {
+                "teamId": teamId,
+                "hydrate": "nextSchedule",
+                "fields": "teams,team,id,nextGameSchedule,dates,date,games,gamePk,gameDate,status,abstractGameCode",
+            },
+        )
+        with self._span("transform"):
+            games = []
+            for d in nextSchedule["teams"][0]["nextGameSchedule"]["dates"]:
+                games.extend(
+                    [x for x in d["games"] if x["status"]["abstractGameCode"] == "P"]
+                )
+
+            if not len(games):
+                return None
+
+            return games[0]["gamePk"]
+
+    @_traced
+    def game_scoring_plays(self, gamePk):
+        """Get a text-formatted list of scoring plays for a given game."""
+        sortedPlays = self.game_scoring_play_data(gamePk)
+        with self._span("render"):
+            scoring_plays = ""
+            for a in sortedPlays["plays"]:
+                scoring_plays += "{}\n{} {} - {}: {}, {}: {}\n\n".format(
+                    a["result"]["description"],
+                    a["about"]["halfInning"][0:1].upper()
+                    + a["about"]["halfInning"][1:],
+                    a["about"]["inning"],
+                    sortedPlays["away"]["name"],
+                    a["result"]["awayScore"],
+                    sortedPlays["home"]["name"],
+                    a["result"]["homeScore"],
+                )
+
+            if len(scoring_plays) > 1:
+                scoring_plays = scoring_plays[:-2]  # strip the extra line break
+
+            return scoring_plays
+
+    @_traced
+    def game_scoring_play_data(self, gamePk):
+        """Returns a python dict of scoring plays for a given game containing 3 keys:
+
+        * home - home team data
+        * away - away team data
+        * plays - sorted list of scoring play data
+        """
+        r = self.get("game", parsers.game_scoring_play_data_params(gamePk))
+        with self._span("transform"):
+            return parsers.parse_game_scoring_play_data(r)
+
+    @_traced
+    def game_highlights(self, gamePk):
+        """Get the highlight video links for a given game."""
+        sortedHighlights = self.game_highlight_data(gamePk)
+
+        with self._span("render"):
+            highlights = ""
+            for a in sortedHighlights:
+                # if sum(1 for t in a['keywordsAll'] if t['type']=='team_id') == 1:
+                #    highlights += next(t['displayName'] for t in a['keywordsAll'] if t['type']=='team_id') + '\n'
+                highlights += "{} ({})\n{}\n{}\n\n".format(
+                    a.get("title", a.get("headline", "")),
+                    a["duration"],
+                    a.get("description", ""),
+                    next(
+                        (s["url"] for s in a["playbacks"] if s["name"] == "mp4Avc"),
+                        next(
+                            (
+                                s["url"]
+                                for s in a["playbacks"]
+                                if s["name"] == "FLASH_2500K_1280X720"
+                            ),
+                            "Link not found",
+                        ),
+                    ),
+                )
+
+            return highlights
+
+    @_traced
+    def game_highlight_data(self, gamePk):
+        """Returns a list of highlight data for a given game."""
+        r = self.get("schedule", parsers.game_highlight_data_params(gamePk))
+        with self._span("transform"):
+            return parsers.parse_game_highlight_data(r)
+
+    @_traced
+    def game_pace(self, season=datetime.now().year, sportId=1):
+        """Get a text-formatted list about pace of game for a given season (back to 1999)."""
+        r = self.game_pace_data(season, sportId)
+
+        with self._span("render"):
+            pace = ""
+
+            pace += "{} Game Pace Stats\n".format(season)
+            for s in r["sports"]:
+                for k in s.keys():
+                    if k in ["season", "sport"]:
+                        continue
+
+                    if k == "prPortalCalculatedFields":
+                        for x in s[k].keys():
+                            pace += "{}: {}\n".format(x, s[k][x])
+                    else:
+                        pace += "{}: {}\n".format(k, s[k])
+
+            return pace
+
+    @_traced
+    def game_pace_data(self, season=datetime.now().year, sportId=1):
+        """Returns data about pace of game for a given season (back to 1999)."""
+        params = {}
+        if season:
+            params.update({"season": season})
+
+        if sportId:
+            params.update({"sportId": sportId})
+
+        r = self.get("gamePace", params)
+
+        if not len(r["sports"]):
+            raise ValueError(
+                "No game pace info found for the {} season. Game pace data appears to begin in 1999.".format(
+                    season
+                )
+            )
+
+        return r
+
+    @_traced
+    def player_stats(
+        self, personId, group="[hitting,pitching,fielding]", type="season", season=None
+    ):
+        """Get current season or career stats for a given player."""
+        player = self.player_stat_data(personId, group, type, season)
+
+        with self._span("render"):
+            stats = ""
+            stats += player["first_name"]
+            if player["nickname"]:
+                stats += ' "{nickname}"'.format(**player)
+
+            stats += " {last_name}, {position} ({mlb_debut:.4}-".format(**player)
+            if not player["active"]:
+                stats += "{last_played:.4}".format(**player)
+
+            stats += ")\n\n"
+
+            for x in player["stats"]:
+                stats += (
+                    x["type"][0:1].upper()
+                    + x["type"][1:]
+                    + " "
+                    + x["group"][0:1].upper()
+                    + x["group"][1:]
+                )
+                if x["stats"].get("position"):
+                    stats += " ({})".format(x["stats"]["position"]["abbreviation"])
+
+                stats += "\n"
+                for y in x["stats"].keys():
+                    if y == "position":
+                        continue
+                    stats += "{}: {}\n".format(y, x["stats"][y])
+
+                stats += "\n"
+
+            return stats
+
+    @_traced
+    def player_stat_data(
+        self,
+        personId,
+        group="[hitting,pitching,fielding]",
+        type="season",
+        sportId=1,
+        season=None,
+    ):
+        """Returns a list of current season or career stat data for a given player."""
+        r = self.get(
+            "person",
+            parsers.player_stat_data_params(personId, group, type, sportId, season),
+        )
+        with self._span("transform"):
+            return parsers.parse_player_stat_data(r)
+
+    @_traced
+    def latest_season(self, sportId=1):
+        """Get the latest season for a given sportId. Returns a dict containing seasonId and various dates."""
+        params = {
+            "sportId": sportId,
+            "seasonId": "all",
+        }
+        all_seasons = self.get("season", params)
+        with self._span("transform"):
+            return next(
+                (
+                    s
+                    for s in all_seasons.get("seasons", [])
+                    if (
+                        datetime.today().strftime("%Y-%m-%d")
+                        < s.get("seasonEndDate", "")
+                    )
+                ),
+                all_seasons["seasons"][-1],
+            )
+
+    @_traced
+    def lookup_player(self, lookup_value, gameType=None, season=None, sportId=1):
+        """Get data about players based on first, last, or full name."""
+        params = {
+            "sportId": sportId,
+            "fields": "people,id,fullName,firstName,lastName,primaryNumber,currentTeam,id,primaryPosition,code,abbreviation,useName,boxscoreName,nickName,mlbDebutDate,nameFirstLast,firstLastName,lastFirstName,lastInitName,initLastName,fullFMLName,fullLFMName,nameSlug",
+        }
+        if gameType:
+            params.update(
+                {
+                    "gameType": gameType,
+                }
+            )
+        if not season:
+            season_data = self.latest_season(sportId=sportId)
+            season = season_data.get("seasonId", datetime.now().year)
+        params.update(
+            {
+                "season": season,
+            }
+        )
+        r = self.get("sports_players", params)
+
+        with self._span("transform"):
+            players = []
+            lookup_values = str(lookup_value).lower().split()
+            for player in r["people"]:
+                for l in lookup_values:
+                    for v in player.values():
+                        if l in str(v).lower():
+                            break
+                    else:
+                        break
+                else:
+                    players.append(player)
+
+            return players
+
+    @_traced
+    def lookup_team(self, lookup_value, activeStatus="Y", season=None, sportIds=1):
+        """Get a info about a team or teams based on the team name, city, abbreviation, or file code."""
+        params = {
+            "activeStatus": activeStatus,
+            "sportIds": sportIds,
+            "fields": "teams,id,name,teamCode,fileCode,teamName,locationName,shortName",
+        }
+        if not season:
+            season_data = self.latest_season(sportId=str(sportIds).split(",")[0])
+            season = season_data.get("seasonId", datetime.now().year)
+        params.update(
+            {
+                "season": season,
+            }
+        )
+        r = self.get("teams", params)
+
+        with self._span("transform"):
+            teams = []
+            for team in r["teams"]:
+                for v in team.values():
+                    if str(lookup_value).lower() in str(v).lower():
+                        teams.append(team)
+                        break
+
+            return teams
+
+    @_traced
+    def team_leaders(
+        self,
+        teamId,
+        leaderCategories,
+        season=datetime.now().year,
+        leaderGameTypes="R",
+        limit=10,
+        format="text",
+    ):
+        """Get stat leaders for a given team.
+
+        * format - "text", "markdown", "html" or "json" (see statsapi.render)
+        """
+        lines = self.team_leader_data(
+            teamId, leaderCategories, season, leaderGameTypes, limit
+        )
+
+        with self._span("render"):
+            return render.team_leaders(lines, format)
+
+    @_traced
+    def team_leader_data(
+        self,
+        teamId,
+        leaderCategories,
+        season=datetime.now().year,
+        leaderGameTypes="R",
+        limit=10,
+    ):
+        """Returns a python list of stat leader data for a given team."""
+        params = {
+            "leaderCategories": leaderCategories,
+            "season": season,
+            "teamId": teamId,
+            "leaderGameTypes": leaderGameTypes,
+            "limit": limit,
+        }
+        params.update({"fields": "teamLeaders,leaders,rank,value,person,fullName"})
+
+        r = self.get("team_leaders", params)
+
+        with self._span("transform"):
+            lines = []
+            for player in [x for x in r["teamLeaders"][0]["leaders"]]:
+                lines.append(
+                    [player["rank"], player["person"]["fullName"], player["value"]]
+                )
+
+            return lines
+
+    @_traced
+    def league_leaders(
+        self,
+        leaderCategories,
+        season=None,
+        limit=10,
+        statGroup=None,
+        leagueId=None,
+        gameTypes=None,
+        playerPool=None,
+        sportId=1,
+        statType=None,
+        format="text",
+    ):
+        """Get stat leaders overall or for a given league (103=AL, 104=NL).
+
+        * format - "text", "markdown", "html" or "json" (see statsapi.render)
+        """
+        lines = self.league_leader_data(
+            leaderCategories,
+            season,
+            limit,
+            statGroup,
+            leagueId,
+            gameTypes,
+            playerPool,
+            sportId,
+            statType,
+        )
+
+        with self._span("render"):
+            return render.league_leaders(lines, format)
+
+    @_traced
+    def league_leader_data(
+        self,
+        leaderCategories,
+        season=None,
+        limit=10,
+        statGroup=None,
+        leagueId=None,
+        gameTypes=None,
+        playerPool=None,
+        sportId=1,
+        statType=None,
+    ):
+        """Returns a python list of stat leaders overall or for a given league (103=AL, 104=NL)."""
+        params = {
+            "leaderCategories": leaderCategories,
+            "sportId": sportId,
+            "limit": limit,
+        }
+        if season:
+            params.update({"season": season})
+
+        if statType:
+            params.update({"statType": statType})
+
+        if not season and not statType:
+            params.update(
+                {"season": datetime.now().year}
+            )  # default season to current year if no season or statType provided
+
+        if statGroup:
+            if statGroup == "batting":
+                statGroup = "hitting"
+
+            params.update({"statGroup": statGroup})
+
+        if gameTypes:
+            params.update({"leaderGameTypes": gameTypes})
+
+        if leagueId:
+            params.update({"leagueId": leagueId})
+
+        if playerPool:
+            params.update({"playerPool": playerPool})
+
+        params.update(
+            {
+                "fields": "leagueLeaders,leaders,rank,value,team,name,league,name,person,fullName"
+            }
+        )
+
+        r = self.get("stats_leaders", params)
+
+        with self._span("transform"):
+            lines = []
+            for player in [x for x in r["leagueLeaders"][0]["leaders"]]:
+                lines.append(
+                    [
+                        player["rank"],
+                        player["person"]["fullName"],
+                        player["team"].get("name", ""),
+                        player["value"],
+                    ]
+                )
+
+            return lines
+
+    @_traced
+    def standings(
+        self,
+        leagueId="103,104",
+        division="all",
+        include_wildcard=True,
+        season=None,
+        standingsTypes=None,
+        date=None,
+        format="text",
+    ):
+        """Get formatted standings for a given league/division and season.
+
+        * format - "text", "markdown", "html" or "json" (see statsapi.render)
+        """
+        divisions = self.standings_data(
+            leagueId, division, include_wildcard, season, standingsTypes, date
+        )
+
+        with self._span("render"):
+            return render.standings(divisions, format, include_wildcard)
+
+    @_traced
+    def standings_data(
+        self,
+        leagueId="103,104",
+        division="all",
+        include_wildcard=True,
+        season=None,
+        standingsTypes=None,
+        date=None,
+    ):
+        """Returns a dict of standings data for a given league/division and season."""
+        r = self.get(
+            "standings",
+            parsers.standings_data_params(
+                leagueId, division, include_wildcard, season, standingsTypes, date
+            ),
+        )
+        with self._span("transform"):
+            return parsers.parse_standings_data(r, division)
+
+    @_traced
+    def roster(
+        self,
+        teamId,
+        rosterType=None,
+        season=datetime.now().year,
+        date=None,
+        format="text",
+    ):
+        """Get the roster for a given team.
+
+        * format - "text", "markdown", "html" or "json" (see statsapi.render)
+        """
+        if not rosterType:
+            rosterType = "active"
+
+        params = {"rosterType": rosterType, "season": season, "teamId": teamId}
+        if date:
+            params.update({"date": date})
+
+        r = self.get("team_roster", params)
+
+        with self._span("transform"):
+            players = []
+            for x in r["roster"]:
+                players.append(
+                    [
+                        x["jerseyNumber"],
+                        x["position"]["abbreviation"],
+                        x["person"]["fullName"],
+                    ]
+                )
+
+        with self._span("render"):
+            return render.roster(players, format)
+
+    @_traced
+    def meta(self, type, fields=None):
+        """Get available values from StatsAPI for use in other queries,
+        or look up descriptions for values found in API results.
+
+        For example, to get a list of leader categories to use when calling team_leaders():
+        statsapi.meta('leagueLeaderTypes')
+        """
+        types = [
+            "awards",
+            "baseballStats",
+            "eventTypes",
+            "freeGameTypes",
+            "gameStatus",
+            "gameTypes",
+            "hitTrajectories",
+            "jobTypes",
+            "languages",
+            "leagueLeaderTypes",
+            "logicalEvents",
+            "metrics",
+            "pitchCodes",
+            "pitchTypes",
+            "platforms",
+            "positions",
+            "reviewReasons",
+            "rosterTypes",
+            "runnerDetailTypes",
+            "scheduleTypes",
+            "scheduleEventTypes",
+            "situationCodes",
+            "sky",
+            "standingsTypes",
+            "statGroups",
+            "statTypes",
+            "violationTypes",
+            "windDirection",
+        ]
+        if type not in types:
+            raise ValueError("Invalid meta type. Available meta types: %s." % types)
+
+        return self.get("meta", {"type": type})
+
+    def notes(self, endpoint):
+        """Get notes for a given endpoint."""
+        msg = ""
+        if not endpoint:
+            msg = "No endpoint specified."
+        else:
+            if not self.endpoints.get(endpoint):
+                msg = "Invalid endpoint specified."
+            else:
+                msg += "Endpoint: " + endpoint + " \n"
+                path_params = [
+                    k for k, v in self.endpoints[endpoint]["path_params"].items()
+                ]
+                required_path_params = [
+                    k
+                    for k, v in self.endpoints[endpoint]["path_params"].items()
+                    if v["required"]
+                ]
+                if required_path_params == []:
+                    required_path_params = "None"
+
+                query_params = self.endpoints[endpoint]["query_params"]
+                required_query_params = self.endpoints[endpoint]["required_params"]
+                if required_query_params == [[]]:
+                    required_query_params = "None"
+                msg += "All path parameters: %s. \n" % path_params
+                msg += (
+                    "Required path parameters (note: ver will be included by default): %s. \n"
+                    % required_path_params
+                )
+                msg += "All query parameters: %s. \n" % query_params
+                msg += "Required query parameters: %s. \n" % required_query_params
+                if "hydrate" in query_params:
+                    msg += "The hydrate function is supported by this endpoint. Call the endpoint with {'hydrate':'hydrations'} in the parameters to return a list of available hydrations. For example, statsapi.get('schedule',{'sportId':1,'hydrate':'hydrations','fields':'hydrations'})\n"
+                if self.endpoints[endpoint].get("note"):
+                    msg += "Developer notes: %s" % self.endpoints[endpoint].get("note")
+
+        return msg
+
+    def plan(self, endpoint):
+        """Return the compiled RequestPlan for the given endpoint name.
+
+        Plans are compiled on first use and recompiled if the endpoint's
+        configuration dict is replaced.
+        """
+        ep = self.endpoints.get(endpoint)
+        if not ep:
+            raise ValueError("Invalid endpoint (" + str(endpoint) + ").")
+
+        plan = self._plans.get(endpoint)
+        if plan is None or plan.source is not ep:
+            plan = plans.RequestPlan(endpoint, ep, self.base_url, _endpoints.BASE_URL)
+            self._plans[endpoint] = plan
+
+        return plan
+
+    @_traced
+    def get(
+        self, endpoint, params={}, force=False, *, request_kwargs={}, _acquired=False
+    ):
+        """Call MLB StatsAPI and return JSON data.
+
+        This function is for advanced querying of the MLB StatsAPI,
+        and is used by the functions in this library.
+        """
+        return self._get(endpoint, params, force, request_kwargs, _acquired)
+
+    def _get(self, endpoint, params, force, request_kwargs, acquired=False):
+        """get(), skipping the rate limiter for the first attempt if acquired is True."""
+        url, query_params = self.plan(endpoint).build_url(params, force, self.logger)
+
+        cache = self.cache
+        key = None
+        stale = None
+        if cache is not None:
+            key = _cache.make_key(endpoint, params, force)
+            entry = cache.get(key, allow_stale=True)
+            fresh = entry is not None and entry.is_fresh()
+            if self.metrics is not None:
+                self.metrics.cache(endpoint, "hit" if fresh else "miss")
+            if fresh:
+                return entry.data
+
+            stale = entry
+
+        if self.singleflight is not None:
+            if key is None:
+                key = _cache.make_key(endpoint, params, force)
+
+            return self.singleflight.do(
+                key,
+                self._fetch,
+                endpoint,
+                url,
+                query_params,
+                key,
+                stale,
+                request_kwargs,
+                acquired,
+            )
+
+        return self._fetch(
+            endpoint, url, query_params, key, stale, request_kwargs, acquired
+        )
+
+    def _get_unshared(self, endpoint, params, request_kwargs={}):
+        """get(), bypassing the cache and request coalescing, so the caller
+        receives its own copy of the response and may modify it."""
+        url, query_params = self.plan(endpoint).build_url(params, False, self.logger)
+        return self._fetch(endpoint, url, query_params, None, None, request_kwargs)
+
+    def _fetch(
+        self, endpoint, url, query_params, key, stale, request_kwargs, acquired=False
+    ):
+        """Request url, update the cache, and return the decoded response."""
+        cache = self.cache
+        if len(self.request_kwargs):
+            request_kwargs = dict(self.request_kwargs, **request_kwargs)
+
+        if stale is not None:
+            # Ask the server to skip the body if our cached copy is still current
+            headers = dict(request_kwargs.get("headers") or {})
+            if stale.etag:
+                headers["If-None-Match"] = stale.etag
+            if stale.last_modified:
+                headers["If-Modified-Since"] = stale.last_modified
+            request_kwargs = dict(request_kwargs, headers=headers)
+
+        if len(request_kwargs) and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Including request_kwargs in session.get call: %s", request_kwargs
+            )
+
+        with self._span("network", endpoint, url=url):
+            r = self._send(endpoint, url, request_kwargs, acquired)
+        if r.status_code == 304 and stale is not None:
+            if self.metrics is not None:
+                self.metrics.cache(endpoint, "revalidated")
+            cache.revalidated(
+                key, stale, cache.ttl_for(endpoint, query_params, stale.data)
+            )
+            return stale.data
+        elif r.status_code not in [200, 201]:
+            r.raise_for_status()
+        else:
+            with self._span("decode", endpoint, bytes=len(r.content)):
+                if self.metrics is not None:
+                    start = time.perf_counter()
+                    data = self.decoder(r.content)
+                    self.metrics.response(
+                        endpoint, len(r.content), time.perf_counter() - start
+                    )
+                else:
+                    data = self.decoder(r.content)
+
+            if key is not None and cache is not None:
+                cache.set(
+                    key,
+                    data,
+                    len(r.content),
+                    cache.ttl_for(endpoint, query_params, data),
+                    r.content,
+                    r.headers.get("ETag"),
+                    r.headers.get("Last-Modified"),
+                )
+
+            return data
+
+        return None
+
+    def _send(self, endpoint, url, request_kwargs, acquired=False):
+        """Make the request with the client's transport, pacing it with the
+        rate limiter and retrying per the retry policy."""
+        limiter = self.rate_limiter
+        retry = self.retry
+        metrics = self.metrics
+        attempt = 0
+        while True:
+            if limiter is not None and not acquired:
+                limiter.acquire(endpoint)
+            acquired = False
+
+            if metrics is not None:
+                start = time.perf_counter()
+            try:
+                r = self.transport.get(url, **request_kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if metrics is not None:
+                    metrics.request(endpoint, time.perf_counter() - start, None)
+                if limiter is not None:
+                    limiter.record(endpoint, None)
+                if retry is None or not retry.connection_errors:
+                    raise
+
+                delay = retry.delay(attempt)
+                if delay is None:
+                    raise
+
+                self.logger.warning(
+                    "%s request failed (%s), retrying in %.1fs...", endpoint, e, delay
+                )
+            else:
+                if metrics is not None:
+                    metrics.request(
+                        endpoint, time.perf_counter() - start, r.status_code
+                    )
+                if limiter is not None:
+                    limiter.record(endpoint, r.status_code)
+                if retry is None or not retry.retry_status(r.status_code):
+                    return r
+
+                delay = retry.delay(attempt, r)
+                if delay is None:
+                    return r
+
+                r.close()
+
+                self.logger.warning(
+                    "%s request returned %s, retrying in %.1fs...",
+                    endpoint,
+                    r.status_code,
+                    delay,
+                )
+
+            time.sleep(delay)
+            attempt += 1
+            if metrics is not None:
+                metrics.retry(endpoint, attempt)
+
+    def get_many(
+        self,
+        endpoint,
+        params_list,
+        max_workers=DEFAULT_BATCH_WORKERS,
+        force=False,
+        *,
+        request_kwargs={},
+    ):
+        """Call the same endpoint once for each dict in params_list, in parallel.
+
+        Requests run on a bounded pool of worker threads that is kept by the
+        client, so the workers' pooled sessions are reused across batches.
+        Yields a BatchResult(params, data, error) for each request as it
+        completes (not in input order). An exception raised by one request is
+        returned in its BatchResult.error and does not stop the batch.
+
+        For example, to fetch the live feed for a list of games:
+        for result in statsapi.get_many("game", [{"gamePk": pk} for pk in gamePks]):
+        """
+        executor = self._acquire_batch_executor(max_workers)
+        try:
+            yield from self._run_batch(
+                executor, endpoint, params_list, max_workers, force, request_kwargs
+            )
+        finally:
+            self._release_batch_executor(executor)
+
+    def _run_batch(
+        self, executor, endpoint, params_list, max_workers, force, request_kwargs
+    ):
+        params_iter = iter(params_list)
+        pending = {}
+
+        def submit_next():
+            for params in params_iter:
+                # Run in a copy of the caller's context so spans nest under its span
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    self.get,
+                    endpoint,
+                    params,
+                    force,
+                    request_kwargs=request_kwargs,
+                )
+                pending[future] = params
+                return True
+
+            return False
+
+        # Keep at most max_workers requests queued so params_list can be a
+        # long-running generator and an abandoned iteration leaves little work behind
+        while len(pending) < max_workers and submit_next():
+            pass
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                params = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    yield BatchResult(params, None, error)
+                else:
+                    yield BatchResult(params, future.result(), None)
+
+                submit_next()
+
+    def iter_plays(
+        self,
+        gamePk,
+        timecode=None,
+        chunk_size=stream.DEFAULT_CHUNK_SIZE,
+        *,
+        request_kwargs={},
+    ):
+        """Yield the plays of a game one at a time, parsing the live feed as it downloads.
+
+        Only one play is decoded and held in memory at a time, however long
+        the game is. Responses are not cached or coalesced.
+        """
+        params = {"gamePk": gamePk}
+        if timecode:
+            params["timecode"] = timecode
+
+        url, _ = self.plan("game").build_url(params, False, self.logger)
+        request_kwargs = dict(self.request_kwargs, **request_kwargs)
+        request_kwargs["stream"] = True
+        r = self._send("game", url, request_kwargs)
+        try:
+            if r.status_code != 200:
+                r.raise_for_status()
+                # A body-less success such as 204 has no plays to stream
+                raise requests.HTTPError(
+                    "Unexpected %s response for %s" % (r.status_code, url), response=r
+                )
+
+            yield from stream.iter_array(
+                r.iter_content(chunk_size), stream.PLAYS_PATH, self.decoder
+            )
+        finally:
+            r.close()
+
+    def iter_pitches(
+        self,
+        gamePk,
+        timecode=None,
+        chunk_size=stream.DEFAULT_CHUNK_SIZE,
+        *,
+        request_kwargs={},
+    ):
+        """Yield the pitches of a game one at a time, parsing the live feed as it downloads.
+
+        Each pitch is a play event from the play's playEvents list, with the
+        play's atBatIndex added.
+        """
+        return stream.iter_pitches(
+            self.iter_plays(gamePk, timecode, chunk_size, request_kwargs=request_kwargs)
+        )
+
+    def _acquire_batch_executor(self, max_workers):
+        """Return an executor with at least max_workers threads, marked in use
+        until _release_batch_executor()."""
+        with self._batch_lock:
+            if self._batch_executor is None or self._batch_workers < max_workers:
+                retired = self._batch_executor
+                self._batch_executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="statsapi-batch"
+                )
+                self._batch_workers = max_workers
+                # A smaller pool still serving another get_many() is shut down
+                # when that call releases it
+                if retired is not None and not self._batch_users.get(retired):
+                    retired.shutdown(wait=False)
+
+            executor = self._batch_executor
+            self._batch_users[executor] = self._batch_users.get(executor, 0) + 1
+            return executor
+
+    def _release_batch_executor(self, executor):
+        with self._batch_lock:
+            users = self._batch_users.pop(executor) - 1
+            if users:
+                self._batch_users[executor] = users
+            elif executor is not self._batch_executor:
+                executor.shutdown(wait=False)
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def default_client():
+    """Return the client used by the module-level statsapi functions."""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = StatsAPIClient()
+
+    return _default_client
+
+
+def set_default_client(client):
+    """Replace the client used by the module-level statsapi functions. Pass None to reset."""
+    global _default_client
+    _default_client = client
@@ -0,0 +1,109 @@
+# encoding=utf-8
+"""JSON decoders for StatsAPI responses.
+
+get() decodes response bodies with the fastest decoder installed: orjson,
+then ujson, then the standard library json module. Neither orjson nor ujson
+is required; install one to speed up decoding of large responses such as the
+game live feed.
+
+With intern_keys=True, object keys are interned so the keys repeated
+throughout every feed ("about", "result", "playEvents", ...) share one string
+object across all decoded responses instead of one copy per response. It
+makes decoding slower, so use it only when many decoded feeds are held at
+once, e.g. in a large MemoryCache.
+
+    client = statsapi.StatsAPIClient(decoder=statsapi.decoding.get_decoder(intern_keys=True))
+"""
+import json
+import sys
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+_intern = sys.intern
+
+
+def _stdlib_loads(body):
+    return json.loads(body)
+
+
+def _interned_object(pairs):
+    return {_intern(k): v for k, v in pairs}
+
+
+_stdlib_interning_decoder = json.JSONDecoder(object_pairs_hook=_interned_object)
+
+
+def _stdlib_interning_loads(body):
+    if isinstance(body, (bytes, bytearray)):
+        body = body.decode("utf-8")
+
+    return _stdlib_interning_decoder.decode(body)
+
+
+DECODERS = {"json": _stdlib_loads}
+"""Installed decoders by name, each a callable taking a bytes or str body"""
+
+if ujson is not None:
+    DECODERS["ujson"] = ujson.loads
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+
+PREFERENCE = ("orjson", "ujson", "json")
+"""Decoder names in the order get_decoder() picks them by default"""
+
+
+def available():
+    """Return the names of the installed decoders, fastest first."""
+    return [name for name in PREFERENCE if name in DECODERS]
+
+
+def interned(obj):
+    """Return a copy of decoded JSON data with every object key interned."""
+    if isinstance(obj, dict):
+        return {_intern(k): interned(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [interned(v) for v in obj]
+
+    return obj
+
+
+def get_decoder(name=None, intern_keys=False):
+    """Return a callable decoding a JSON response body (bytes or str).
+
+    * name - "orjson", "ujson" or "json" (default: the fastest installed)
+    * intern_keys - intern object keys so they are shared across responses
+
+    Raises ValueError if the named decoder is not installed.
+    """
+    if name is None:
+        name = available()[0]
+    elif name not in DECODERS:
+        raise ValueError(
+            "JSON decoder %s is not installed. Available decoders: %s"
+            % (name, ", ".join(available()))
+        )
+
+    if not intern_keys:
+        return DECODERS[name]
+    elif name == "json":
+        # Intern while decoding instead of walking the result afterwards
+        return _stdlib_interning_loads
+
+    loads = DECODERS[name]
+
+    def interning_loads(body):
+        return interned(loads(body))
+
+    return interning_loads
+
+
+loads = get_decoder()
+"""Default decoder used by StatsAPIClient and SQLiteCache"""
@@ -0,0 +1,116 @@
+# encoding=utf-8
+"""One game's live feed, downloaded once and viewed many ways.
+
+boxscore_data(), linescore() and game_scoring_play_data() each request the
+same game with a different fields list. Game makes one request with the
+union of those fields (see parsers.game_params()) and builds each view from
+that document the first time it is used:
+
+    game = statsapi.Game(565997)
+    print(game.linescore)
+    for play in game.scoring_plays["plays"]:
+        print(play["result"]["description"])
+    print(game.decisions.get("winner", {}).get("fullName"))
+
+Views are memoized; refresh() downloads the game again and clears them.
+render() formats the boxscore or linescore from the same document:
+
+    print(game.render("boxscore", format="markdown"))
+"""
+from . import parsers
+from . import render
+from .client import default_client
+
+
+class Game(object):
+    """Lazily computed views of one game's live feed.
+
+    * gamePk - game to load
+    * timecode - YYYYMMDD_HHMMSS timecode of the game's state to load (default: current)
+    * client - StatsAPIClient to make requests with (default: statsapi.default_client())
+
+    The views return the same values as the matching StatsAPIClient methods,
+    except that the dicts taken directly from the feed may hold the extra keys
+    requested for the other views.
+    """
+
+    def __init__(self, gamePk, timecode=None, client=None):
+        self.gamePk = gamePk
+        self.timecode = timecode
+        self.client = client or default_client()
+        self._data = None
+        self._views = {}
+
+    @property
+    def data(self):
+        """The game endpoint response every view is built from."""
+        if self._data is None:
+            self._data = self.client.get(
+                "game", parsers.game_params(self.gamePk, self.timecode)
+            )
+
+        return self._data
+
+    def refresh(self):
+        """Download the game again and forget the views built so far."""
+        self._data = None
+        self._views.clear()
+        return self.data
+
+    def _view(self, name, build):
+        if name not in self._views:
+            data = self.data
+            with self.client._span("transform", name, gamePk=self.gamePk):
+                self._views[name] = build(data)
+
+        return self._views[name]
+
+    @property
+    def boxscore_data(self):
+        """Boxscore data dict, as returned by boxscore_data()."""
+        return self._view("boxscore_data", parsers.parse_boxscore_data)
+
+    @property
+    def linescore(self):
+        """Formatted linescore, as returned by linescore()."""
+        return self._view("linescore", parsers.parse_linescore)
+
+    @property
+    def scoring_plays(self):
+        """Scoring play dict, as returned by game_scoring_play_data()."""
+        return self._view("scoring_plays", parsers.parse_game_scoring_play_data)
+
+    @property
+    def decisions(self):
+        """Dict of the winner, loser and save pitchers, once decided."""
+        return self._view("decisions", parsers.parse_decisions)
+
+    @property
+    def highlights(self):
+        """List of highlights, as returned by game_highlight_data().
+
+        Highlights are not part of the live feed, so the first use makes one
+        schedule request of its own.
+        """
+        if "highlights" not in self._views:
+            r = self.client.get(
+                "schedule", parsers.game_highlight_data_params(self.gamePk)
+            )
+            with self.client._span("transform", "highlights", gamePk=self.gamePk):
+                self._views["highlights"] = parsers.parse_game_highlight_data(r)
+
+        return self._views["highlights"]
+
+    def render(self, view="boxscore", format="text", **options):
+        """Return the game's boxscore or linescore formatted by statsapi.render.
+
+        * view - "boxscore" or "linescore"
+        * format - "text", "markdown", "html" or "json"
+        * options - boxscore sections to include, e.g. gameInfo=False
+        """
+        if view == "boxscore":
+            return render.boxscore(self.boxscore_data, format, **options)
+        elif view == "linescore":
+            return render.linescore(self.data, format)
+
+        raise ValueError("Cannot render %s; use boxscore or linescore" % view)
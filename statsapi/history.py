@@ -0,0 +1,241 @@
+# encoding=utf-8
+"""Local time-travel store for a game's live feed.
+
+GameHistory fetches a game's list of timecodes (game_timestamps) once, then
+keeps a full feed (a keyframe) every keyframe_interval timecodes and the
+diffPatch (game_diff) operations between them. The state of the game at any
+time is rebuilt from the nearest earlier keyframe by replaying patches, found
+by binary search over the timecodes, so no further requests are needed:
+
+    history = statsapi.history.GameHistory(565997)
+    history.load()
+    feed = history.state_at("20190721_183000")
+    for timecode, feed in history.iter_states(history.timecodes[::10]):
+        evaluate(timecode, feed)
+    history.save("565997.history.gz")
+
+Keyframes and patches are kept JSON-encoded, so every state_at() returns a
+new document the caller may modify.
+"""
+import bisect
+import gzip
+import json
+
+from . import decoding
+from .client import default_client
+from .live import apply_patch
+
+DEFAULT_KEYFRAME_INTERVAL = 50
+"""Number of timecodes between stored full feeds"""
+
+_TIMESTAMP_POINTER = "/metaData/timeStamp"
+
+
+class GameHistory(object):
+    """Keyframes and patches covering every timecode of one game.
+
+    * gamePk - game to store
+    * client - StatsAPIClient to make requests with (default: statsapi.default_client())
+    * keyframe_interval - number of timecodes between full feeds; smaller uses
+        more memory and requests, larger replays more patches per lookup
+
+    Parts of the game not loaded yet with load() are downloaded on first use.
+    """
+
+    def __init__(
+        self, gamePk, client=None, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL
+    ):
+        self.gamePk = gamePk
+        self.client = client or default_client()
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.timecodes = None
+        self._keyframes = {}
+        self._keyframe_indexes = []
+        self._patches = {}
+        self._loaded = set()
+        self._requests = 0
+
+    def load(self):
+        """Download the timecodes and every keyframe and patch, and return self."""
+        self._load_timecodes()
+        for start in range(0, len(self.timecodes), self.keyframe_interval):
+            self._load_segment(start)
+
+        return self
+
+    def _load_timecodes(self):
+        if self.timecodes is None:
+            self._requests += 1
+            self.timecodes = sorted(
+                self.client.get("game_timestamps", {"gamePk": self.gamePk})
+            )
+
+    def _add_keyframe(self, index, feed):
+        self._keyframes[index] = json.dumps(feed, separators=(",", ":")).encode()
+        bisect.insort(self._keyframe_indexes, index)
+
+    def _load_segment(self, start):
+        if start in self._loaded:
+            return
+
+        timecodes = self.timecodes
+        end = min(start + self.keyframe_interval, len(timecodes)) - 1
+        self._requests += 1
+        self._add_keyframe(
+            start,
+            self.client._get_unshared(
+                "game", {"gamePk": self.gamePk, "timecode": timecodes[start]}
+            ),
+        )
+        if end > start:
+            self._requests += 1
+            diff = self.client._get_unshared(
+                "game_diff",
+                {
+                    "gamePk": self.gamePk,
+                    "startTimecode": timecodes[start],
+                    "endTimecode": timecodes[end],
+                },
+            )
+            if isinstance(diff, dict):
+                # Too much changed for one diff; ask for each step separately
+                for i in range(start + 1, end + 1):
+                    self._requests += 1
+                    step = self.client._get_unshared(
+                        "game_diff",
+                        {
+                            "gamePk": self.gamePk,
+                            "startTimecode": timecodes[i - 1],
+                            "endTimecode": timecodes[i],
+                        },
+                    )
+                    if isinstance(step, dict):
+                        self._add_keyframe(i, step)
+                    else:
+                        self._add_patches(step, i, i)
+            else:
+                self._add_patches(diff, start + 1, end)
+
+        self._loaded.add(start)
+
+    def _add_patches(self, diff, first, last):
+        """File each patch under the timecode its metaData.timeStamp operation sets."""
+        patches = {}
+        index = first
+        for patch in diff or []:
+            operations = patch.get("diff", [])
+            for op in operations:
+                if op.get("path") == _TIMESTAMP_POINTER and "value" in op:
+                    at = bisect.bisect_right(self.timecodes, op["value"]) - 1
+                    index = min(max(index, at), last)
+                    break
+
+            patches.setdefault(index, []).extend(operations)
+
+        for index, operations in patches.items():
+            if index in self._patches:
+                operations = self._operations(index) + operations
+            # Encoded like keyframes, so replays never share values with the store
+            self._patches[index] = json.dumps(
+                operations, separators=(",", ":")
+            ).encode()
+
+    def _operations(self, index):
+        patch = self._patches.get(index)
+        return [] if patch is None else decoding.loads(patch)
+
+    def _index(self, timecode):
+        self._load_timecodes()
+        return bisect.bisect_right(self.timecodes, timecode) - 1
+
+    def _keyframe_for(self, index):
+        self._load_segment(index - index % self.keyframe_interval)
+        return self._keyframe_indexes[
+            bisect.bisect_right(self._keyframe_indexes, index) - 1
+        ]
+
+    def state_at(self, timecode):
+        """Return the live feed as it was at timecode (YYYYMMDD_HHMMSS), or
+        None if timecode is before the game's first timecode."""
+        index = self._index(timecode)
+        if index < 0:
+            return None
+
+        keyframe = self._keyframe_for(index)
+        doc = decoding.loads(self._keyframes[keyframe])
+        for i in range(keyframe + 1, index + 1):
+            doc = apply_patch(doc, self._operations(i))
+
+        return doc
+
+    def iter_states(self, timecodes):
+        """Yield (timecode, feed) for each of the given timecodes, in time order.
+
+        Consecutive timecodes are reached by applying only the patches between
+        them, which is much faster than calling state_at() for each. The same
+        document is updated and yielded each time, so copy anything that must
+        outlive the iteration step. Timecodes before the first are skipped.
+        """
+        doc = None
+        keyframe = index = None
+        for timecode in sorted(timecodes):
+            target = self._index(timecode)
+            if target < 0:
+                continue
+
+            nearest = self._keyframe_for(target)
+            if doc is None or nearest != keyframe:
+                keyframe = index = nearest
+                doc = decoding.loads(self._keyframes[keyframe])
+
+            for i in range(index + 1, target + 1):
+                doc = apply_patch(doc, self._operations(i))
+            index = target
+            yield timecode, doc
+
+    def stats(self):
+        """Return a dict with the number of timecodes, keyframes, keyframe bytes,
+        patch operations and requests made."""
+        return {
+            "timecodes": len(self.timecodes or []),
+            "keyframes": len(self._keyframes),
+            "keyframe_bytes": sum(len(k) for k in self._keyframes.values()),
+            "operations": sum(len(self._operations(i)) for i in self._patches),
+            "requests": self._requests,
+        }
+
+    def save(self, path):
+        """Write everything loaded so far to a gzip-compressed JSON file."""
+        data = {
+            "gamePk": self.gamePk,
+            "keyframe_interval": self.keyframe_interval,
+            "timecodes": self.timecodes,
+            "loaded": sorted(self._loaded),
+            "keyframes": {
+                str(i): k.decode("utf-8") for i, k in self._keyframes.items()
+            },
+            "patches": {str(i): p.decode("utf-8") for i, p in self._patches.items()},
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def open(cls, path, client=None):
+        """Return a GameHistory read from a file written by save().
+
+        The client is only used for parts of the game that were not loaded
+        when the file was saved.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+
+        history = cls(data["gamePk"], client, data["keyframe_interval"])
+        history.timecodes = data["timecodes"]
+        history._loaded = set(data["loaded"])
+        for i, k in data["keyframes"].items():
+            history._keyframes[int(i)] = k.encode("utf-8")
+        history._keyframe_indexes = sorted(history._keyframes)
+        history._patches = {
+            int(i): p.encode("utf-8") for i, p in data["patches"].items()
+        }
+        return history
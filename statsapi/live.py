@@ -0,0 +1,426 @@
+# encoding=utf-8
+"""Follow a game in progress with incremental updates.
+
+GameFollower downloads a game's live feed once, then asks the diffPatch
+endpoint (game_diff) for the changes since the feed's timestamp and applies
+them as JSON patches (RFC 6902) to its copy of the feed. A poll usually
+transfers and decodes a few kilobytes instead of the whole feed. If a patch
+does not apply, or the StatsAPI answers with a full feed instead of patches,
+the follower replaces its copy with a full one.
+
+    follower = statsapi.live.GameFollower(565997)
+    for update in follower.follow():
+        print(follower.data["liveData"]["linescore"].get("currentInningOrdinal"))
+"""
+import collections
+import copy
+import time
+
+from .client import default_client
+
+DEFAULT_INTERVAL = 10
+"""Seconds between polls when the feed does not suggest a wait (metaData.wait)"""
+
+Update = collections.namedtuple("Update", ["timecode", "operations", "full"])
+"""Result of one GameFollower poll.
+
+* timecode - the feed's metaData.timeStamp after the update
+* operations - list of the JSON patch operations applied, in order
+* full - True if the feed was replaced with a full download instead
+"""
+
+
+class PatchError(ValueError):
+    """A JSON patch operation could not be applied."""
+
+
+def _unescape(token):
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _resolve(doc, path):
+    """Return (container, key) for the last token of a JSON pointer."""
+    if not path.startswith("/"):
+        raise PatchError("Invalid JSON pointer: %r" % path)
+
+    tokens = path[1:].split("/")
+    parent = doc
+    try:
+        for token in tokens[:-1]:
+            token = _unescape(token)
+            parent = parent[int(token) if isinstance(parent, list) else token]
+    except (KeyError, IndexError, ValueError, TypeError):
+        raise PatchError("Path not found: %s" % path) from None
+
+    key = _unescape(tokens[-1])
+    if isinstance(parent, list):
+        if key == "-":
+            key = len(parent)
+        else:
+            try:
+                key = int(key)
+            except ValueError:
+                raise PatchError("Invalid list index in %s" % path) from None
+    elif not isinstance(parent, dict):
+        raise PatchError("Path not found: %s" % path)
+
+    return parent, key
+
+
+def _get(doc, path):
+    if path == "":
+        return doc
+
+    parent, key = _resolve(doc, path)
+    try:
+        return parent[key]
+    except (KeyError, IndexError):
+        raise PatchError("Path not found: %s" % path) from None
+
+
+def _add(doc, path, value):
+    parent, key = _resolve(doc, path)
+    if isinstance(parent, list):
+        if not 0 <= key <= len(parent):
+            raise PatchError("List index out of range: %s" % path)
+        parent.insert(key, value)
+    else:
+        parent[key] = value
+
+
+def _remove(doc, path):
+    parent, key = _resolve(doc, path)
+    try:
+        return parent.pop(key)
+    except (KeyError, IndexError):
+        raise PatchError("Path not found: %s" % path) from None
+
+
+def apply_patch(doc, operations):
+    """Apply JSON patch operations to doc in place and return the patched document.
+
+    * doc - decoded JSON document (dicts and lists)
+    * operations - list of RFC 6902 operation dicts ("op", "path", "value", "from")
+
+    Raises PatchError if an operation fails; operations before it remain
+    applied, so discard the document in that case. Operation values are
+    inserted without copying; "copy" inserts a deep copy of its source.
+    """
+    for op in operations:
+        try:
+            kind = op["op"]
+            path = op["path"]
+            if path == "":
+                # Operations on the root replace the whole document
+                if kind in ("add", "replace"):
+                    doc = op["value"]
+                    continue
+                if kind == "test":
+                    if doc != op["value"]:
+                        raise PatchError("Test failed at the document root")
+                    continue
+                raise PatchError(
+                    "Unsupported operation on the document root: %s" % kind
+                )
+
+            if kind == "replace":
+                parent, key = _resolve(doc, path)
+                if isinstance(parent, list) and not 0 <= key < len(parent):
+                    raise PatchError("List index out of range: %s" % path)
+                if isinstance(parent, dict) and key not in parent:
+                    raise PatchError("Path not found: %s" % path)
+                parent[key] = op["value"]
+            elif kind == "add":
+                _add(doc, path, op["value"])
+            elif kind == "remove":
+                _remove(doc, path)
+            elif kind == "move":
+                _add(doc, path, _remove(doc, op["from"]))
+            elif kind == "copy":
+                _add(doc, path, copy.deepcopy(_get(doc, op["from"])))
+            elif kind == "test":
+                if _get(doc, path) != op["value"]:
+                    raise PatchError("Test failed at %s" % path)
+            else:
+                raise PatchError("Unknown operation: %r" % kind)
+        except KeyError as e:
+            raise PatchError("Operation is missing %s: %r" % (e, op)) from None
+
+    return doc
+
+
+class GameFollower(object):
+    """Keeps an up-to-date copy of a game's live feed using diffPatch updates.
+
+    * gamePk - game to follow
+    * client - StatsAPIClient to make requests with (default: statsapi.default_client())
+    * logger - logger to use instead of the client's logger
+
+    The current feed is in the data attribute, None until the first poll.
+    Treat it as read-only: patches are applied to it in place.
+    """
+
+    def __init__(self, gamePk, client=None, logger=None):
+        self.gamePk = gamePk
+        self.client = client or default_client()
+        self.logger = logger or self.client.logger
+        self.data = None
+        self._stats = {"polls": 0, "full_refreshes": 0, "patches": 0, "failures": 0}
+
+    @property
+    def timecode(self):
+        """metaData.timeStamp of the current feed, or None before the first poll."""
+        if self.data is None:
+            return None
+
+        return self.data.get("metaData", {}).get("timeStamp")
+
+    @property
+    def is_final(self):
+        """True once the game's abstractGameState is Final."""
+        if self.data is None:
+            return False
+
+        status = self.data.get("gameData", {}).get("status", {})
+        return status.get("abstractGameState") == "Final"
+
+    def refresh(self):
+        """Download the full live feed, replacing the current copy. Returns an Update."""
+        self.data = self.client._get_unshared("game", {"gamePk": self.gamePk})
+        self._stats["full_refreshes"] += 1
+        return Update(self.timecode, [], True)
+
+    def poll(self):
+        """Bring the feed up to date and return an Update.
+
+        The first poll downloads the full feed; later polls request and
+        apply the changes since the current feed's timestamp.
+        """
+        self._stats["polls"] += 1
+        timecode = self.timecode
+        if timecode is None:
+            return self.refresh()
+
+        diff = self.client._get_unshared(
+            "game_diff", {"gamePk": self.gamePk, "startTimecode": timecode}
+        )
+        if isinstance(diff, dict):
+            # Too much has changed for patches; the StatsAPI sent the whole feed
+            self.data = diff
+            self._stats["full_refreshes"] += 1
+            return Update(self.timecode, [], True)
+
+        applied = []
+        try:
+            for patch in diff or []:
+                operations = patch.get("diff", [])
+                self.data = apply_patch(self.data, operations)
+                applied.extend(operations)
+        except (PatchError, AttributeError, TypeError) as e:
+            self._stats["failures"] += 1
+            self.logger.warning(
+                "Could not apply diffPatch update to game %s (%s), reloading the full feed",
+                self.gamePk,
+                e,
+            )
+            return self.refresh()
+
+        self._stats["patches"] += len(applied)
+        return Update(self.timecode, applied, False)
+
+    def follow(self, interval=None, until_final=True):
+        """Poll repeatedly, yielding each Update that changed the feed.
+
+        * interval - seconds between polls (default: the feed's metaData.wait,
+            or DEFAULT_INTERVAL)
+        * until_final - stop after the update in which the game becomes final
+        """
+        while True:
+            update = self.poll()
+            if update.full or update.operations:
+                yield update
+            if until_final and self.is_final:
+                return
+
+            wait = interval
+            if wait is None:
+                wait = self.data.get("metaData", {}).get("wait") or DEFAULT_INTERVAL
+            time.sleep(wait)
+
+    def stats(self):
+        """Return a dict with the number of polls, full refreshes, patch
+        operations applied, and patches that failed to apply."""
+        return dict(self._stats)
+
+
+GameEvent = collections.namedtuple("GameEvent", ["kind", "gamePk", "play", "detail"])
+"""A change in a followed game, produced by GameEventStream.
+
+* kind - one of EVENT_KINDS
+* gamePk - the game's gamePk
+* play - the play (plate appearance) dict the event belongs to, None for status_change
+* detail - "pitch" and "pitching_change": the play event dict;
+    "plate_appearance" and "scoring_play": the play's result dict;
+    "inning_change": {"inning": ..., "halfInning": ...};
+    "status_change": the gameData.status dict
+"""
+
+EVENT_KINDS = (
+    "status_change",
+    "inning_change",
+    "pitch",
+    "pitching_change",
+    "plate_appearance",
+    "scoring_play",
+)
+"""Kinds of GameEvent, in the order they are produced for one update"""
+
+_PLAYS_POINTER = "/liveData/plays/allPlays"
+_STATUS_POINTER = "/gameData/status"
+
+
+def _covers(path, pointer):
+    """True if changing path may change the value at pointer."""
+    return path == pointer or pointer.startswith(path + "/") or path == ""
+
+
+class GameEventStream(object):
+    """Typed events derived from a GameFollower's updates.
+
+    * follower - GameFollower whose feed is inspected
+    * replay - produce events for what already happened when the feed is
+        first loaded (default: start from the current state without events)
+
+    Each update is inspected through the paths its patch operations touch,
+    so only the plays that changed are examined. Full reloads are compared
+    with what was seen before, so events are not repeated.
+
+        stream = statsapi.live.GameEventStream(statsapi.live.GameFollower(565997))
+        stream.add_callback(lambda e: print(e.kind, e.detail))
+        for event in stream.follow():
+            pass
+    """
+
+    def __init__(self, follower, replay=False):
+        self.follower = follower
+        self.replay = replay
+        self._callbacks = []
+        self._plays = {}
+        self._play_count = 0
+        self._status = None
+        self._synced = False
+
+    def add_callback(self, callback, kinds=None):
+        """Call callback(event) for each GameEvent, or only for the given kinds."""
+        kinds = frozenset(kinds) if kinds is not None else None
+        self._callbacks.append((callback, kinds))
+
+    def process(self, update):
+        """Return the list of GameEvents for an Update the follower returned."""
+        data = self.follower.data
+        if data is None:
+            return []
+
+        emit = self._synced or self.replay
+        self._synced = True
+        plays = data.get("liveData", {}).get("plays", {}).get("allPlays", [])
+
+        check_status = update.full
+        rescan = update.full
+        indices = set()
+        for op in update.operations:
+            for path in (op.get("path"), op.get("from")):
+                if path is None:
+                    continue
+                if path.startswith(_PLAYS_POINTER + "/"):
+                    token = path[len(_PLAYS_POINTER) + 1 :].split("/", 1)[0]
+                    if token.isdigit():
+                        indices.add(int(token))
+                elif _covers(path, _PLAYS_POINTER):
+                    rescan = True
+                if _covers(path, _STATUS_POINTER) or path.startswith(
+                    _STATUS_POINTER + "/"
+                ):
+                    check_status = True
+
+        if rescan:
+            indices = range(len(plays))
+        else:
+            # Plays appended with "-" or beyond the count seen so far
+            indices = sorted(indices.union(range(self._play_count, len(plays))))
+
+        events = []
+        gamePk = self.follower.gamePk
+        if check_status:
+            status = data.get("gameData", {}).get("status", {})
+            state = (status.get("abstractGameState"), status.get("detailedState"))
+            if state != self._status:
+                self._status = state
+                events.append(GameEvent("status_change", gamePk, None, status))
+
+        for i in indices:
+            if i >= len(plays):
+                continue
+
+            play = plays[i]
+            about = play.get("about", {})
+            seen, complete = self._plays.get(i, (None, False))
+            if seen is None:
+                seen = 0
+                previous = plays[i - 1].get("about", {}) if i else {}
+                if (about.get("inning"), about.get("halfInning")) != (
+                    previous.get("inning"),
+                    previous.get("halfInning"),
+                ):
+                    events.append(
+                        GameEvent(
+                            "inning_change",
+                            gamePk,
+                            play,
+                            {
+                                "inning": about.get("inning"),
+                                "halfInning": about.get("halfInning"),
+                            },
+                        )
+                    )
+
+            play_events = play.get("playEvents", [])
+            for event in play_events[seen:]:
+                if event.get("isPitch"):
+                    events.append(GameEvent("pitch", gamePk, play, event))
+                elif (
+                    event.get("details", {}).get("eventType") == "pitching_substitution"
+                ):
+                    events.append(GameEvent("pitching_change", gamePk, play, event))
+
+            is_complete = bool(about.get("isComplete"))
+            if is_complete and not complete:
+                result = play.get("result", {})
+                events.append(GameEvent("plate_appearance", gamePk, play, result))
+                if about.get("isScoringPlay"):
+                    events.append(GameEvent("scoring_play", gamePk, play, result))
+
+            self._plays[i] = (len(play_events), is_complete)
+
+        if rescan:
+            for i in [i for i in self._plays if i >= len(plays)]:
+                del self._plays[i]
+        self._play_count = len(plays)
+
+        if not emit:
+            return []
+
+        for event in events:
+            for callback, kinds in self._callbacks:
+                if kinds is None or event.kind in kinds:
+                    callback(event)
+
+        return events
+
+    def follow(self, interval=None, until_final=True):
+        """Poll the follower and yield GameEvents as they happen.
+
+        Takes the same arguments as GameFollower.follow().
+        """
+        for update in self.follower.follow(interval, until_final):
+            yield from self.process(update)
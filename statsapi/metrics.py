@@ -0,0 +1,274 @@
+# encoding=utf-8
+"""Per-endpoint request metrics for StatsAPIClient.
+
+Metrics counts, for each endpoint name, the requests sent and their status
+codes, request latency (as a histogram), response bytes, decode time,
+retries and cache hits and misses. Give one to a client to start recording;
+clients without one skip instrumentation entirely:
+
+    metrics = statsapi.metrics.Metrics()
+    client = statsapi.StatsAPIClient(metrics=metrics)
+    client.schedule(date="07/04/2023")
+    print(metrics.snapshot()["schedule"]["requests"])
+    print(statsapi.metrics.prometheus_text(metrics))
+
+Callbacks added with Metrics.add_callback() receive every measurement as an
+Event, so they can be forwarded to StatsD, OpenTelemetry and the like.
+"""
+import bisect
+import collections
+import threading
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds, in seconds, of the latency histogram buckets"""
+
+Event = collections.namedtuple("Event", ["kind", "endpoint", "value", "status"])
+"""A measurement passed to Metrics callbacks.
+
+* kind - "request" (value: seconds, status: HTTP status or None for a
+    connection error), "response" (value: body bytes), "decode" (value:
+    seconds), "retry" (value: attempt number, from 1), or "cache" (value:
+    "hit", "miss" or "revalidated")
+* endpoint - endpoint name, e.g. "game"
+* value - see kind
+* status - HTTP status code for "request" events, otherwise None
+"""
+
+
+class Histogram(object):
+    """Counts of observed values falling into fixed buckets, with their sum.
+
+    * buckets - sorted upper bounds; larger values go in a final +Inf bucket
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Return a list of (upper bound, number of values <= bound) pairs,
+        ending with (float("inf"), count)."""
+        total = 0
+        pairs = []
+        for bound, n in zip(self.buckets + (float("inf"),), self.counts):
+            total += n
+            pairs.append((bound, total))
+
+        return pairs
+
+
+class EndpointMetrics(object):
+    """Measurements for one endpoint."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.requests = 0
+        self.statuses = collections.Counter()
+        self.latency = Histogram(buckets)
+        self.bytes = 0
+        self.decoded = 0
+        self.decode_seconds = 0.0
+        self.retries = 0
+        self.cache = collections.Counter()
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "errors": self.statuses.get(None, 0),
+            "latency": {
+                "count": self.latency.count,
+                "sum": self.latency.sum,
+                "buckets": self.latency.cumulative(),
+            },
+            "bytes": self.bytes,
+            "decoded": self.decoded,
+            "decode_seconds": self.decode_seconds,
+            "retries": self.retries,
+            "cache_hits": self.cache["hit"],
+            "cache_misses": self.cache["miss"],
+            "cache_revalidated": self.cache["revalidated"],
+        }
+
+
+class Metrics(object):
+    """Thread-safe registry of per-endpoint request metrics.
+
+    * buckets - upper bounds, in seconds, of the latency histogram buckets
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints = {}
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback):
+        """Call callback(event) with an Event for every measurement recorded.
+
+        Callbacks run on the thread making the request, so they should be quick.
+        """
+        with self._lock:
+            self._callbacks = self._callbacks + [callback]
+
+    def remove_callback(self, callback):
+        with self._lock:
+            self._callbacks = [c for c in self._callbacks if c is not callback]
+
+    def _endpoint(self, endpoint):
+        m = self._endpoints.get(endpoint)
+        if m is None:
+            m = self._endpoints[endpoint] = EndpointMetrics(self.buckets)
+
+        return m
+
+    def _emit(self, kind, endpoint, value, status=None):
+        callbacks = self._callbacks
+        if callbacks:
+            event = Event(kind, endpoint, value, status)
+            for callback in callbacks:
+                callback(event)
+
+    def request(self, endpoint, seconds, status):
+        """Record one request attempt; status is None for a connection error."""
+        with self._lock:
+            m = self._endpoint(endpoint)
+            m.requests += 1
+            m.statuses[status] += 1
+            m.latency.observe(seconds)
+
+        self._emit("request", endpoint, seconds, status)
+
+    def response(self, endpoint, nbytes, decode_seconds):
+        """Record a response body that was read and decoded."""
+        with self._lock:
+            m = self._endpoint(endpoint)
+            m.bytes += nbytes
+            m.decoded += 1
+            m.decode_seconds += decode_seconds
+
+        self._emit("response", endpoint, nbytes)
+        self._emit("decode", endpoint, decode_seconds)
+
+    def retry(self, endpoint, attempt):
+        """Record a retry; attempt counts from 1."""
+        with self._lock:
+            self._endpoint(endpoint).retries += 1
+
+        self._emit("retry", endpoint, attempt)
+
+    def cache(self, endpoint, result):
+        """Record a cache lookup; result is "hit", "miss" or "revalidated"."""
+        with self._lock:
+            self._endpoint(endpoint).cache[result] += 1
+
+        self._emit("cache", endpoint, result)
+
+    def snapshot(self):
+        """Return a dict of endpoint name: dict of that endpoint's metrics."""
+        with self._lock:
+            return {name: m.as_dict() for name, m in self._endpoints.items()}
+
+    def reset(self):
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._endpoints = {}
+
+
+def _labels(**labels):
+    return ",".join(
+        '%s="%s"'
+        % (
+            k,
+            str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for k, v in labels.items()
+    )
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def prometheus_text(metrics, prefix="statsapi"):
+    """Return the metrics in the Prometheus text exposition format.
+
+    * metrics - Metrics instance
+    * prefix - prefix for the metric names
+    """
+    snapshot = metrics.snapshot()
+    families = [
+        (
+            "requests_total",
+            "counter",
+            "Requests sent, by endpoint and HTTP status (error: connection failed).",
+        ),
+        ("request_duration_seconds", "histogram", "Request latency."),
+        ("response_bytes_total", "counter", "Bytes of response bodies decoded."),
+        ("decode_duration_seconds", "summary", "Time spent decoding responses."),
+        ("retries_total", "counter", "Requests retried."),
+        (
+            "cache_lookups_total",
+            "counter",
+            "Response cache lookups, by result (hit, miss or revalidated).",
+        ),
+    ]
+    lines = []
+    for name, kind, help_text in families:
+        metric = "%s_%s" % (prefix, name)
+        lines.append("# HELP %s %s" % (metric, help_text))
+        lines.append("# TYPE %s %s" % (metric, kind))
+        for endpoint, m in sorted(snapshot.items()):
+            if name == "requests_total":
+                for status, n in sorted(
+                    m["statuses"].items(), key=lambda item: str(item[0])
+                ):
+                    labels = _labels(
+                        endpoint=endpoint,
+                        status="error" if status is None else status,
+                    )
+                    lines.append("%s{%s} %d" % (metric, labels, n))
+            elif name == "request_duration_seconds":
+                for bound, n in m["latency"]["buckets"]:
+                    labels = _labels(endpoint=endpoint, le=_number(bound))
+                    lines.append("%s_bucket{%s} %d" % (metric, labels, n))
+                labels = _labels(endpoint=endpoint)
+                lines.append(
+                    "%s_sum{%s} %s" % (metric, labels, _number(m["latency"]["sum"]))
+                )
+                lines.append(
+                    "%s_count{%s} %d" % (metric, labels, m["latency"]["count"])
+                )
+            elif name == "response_bytes_total":
+                lines.append(
+                    "%s{%s} %d" % (metric, _labels(endpoint=endpoint), m["bytes"])
+                )
+            elif name == "decode_duration_seconds":
+                labels = _labels(endpoint=endpoint)
+                lines.append(
+                    "%s_sum{%s} %s" % (metric, labels, _number(m["decode_seconds"]))
+                )
+                lines.append("%s_count{%s} %d" % (metric, labels, m["decoded"]))
+            elif name == "retries_total":
+                lines.append(
+                    "%s{%s} %d" % (metric, _labels(endpoint=endpoint), m["retries"])
+                )
+            else:
+                for result, key in [
+                    ("hit", "cache_hits"),
+                    ("miss", "cache_misses"),
+                    ("revalidated", "cache_revalidated"),
+                ]:
+                    labels = _labels(endpoint=endpoint, result=result)
+                    lines.append("%s{%s} %d" % (metric, labels, m[key]))
+
+    return "\n".join(lines) + "\n"
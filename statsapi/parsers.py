@@ -0,0 +1,858 @@
+# encoding=utf-8
+"""Request parameters and response parsing for the high-level StatsAPI functions.
+
+The functions in this module do no I/O. Each `*_params()` function returns the
+parameters for the StatsAPI request and each `parse_*()` function turns the
+decoded response into the value returned by the high-level function, so the
+sync StatsAPIClient and the asyncio client share the same logic.
+"""
+import collections
+import logging
+from datetime import datetime
+
+from . import render
+
+logger = logging.getLogger("statsapi")
+
+
+def schedule_params(
+    date=None,
+    start_date=None,
+    end_date=None,
+    team="",
+    opponent="",
+    sportId=1,
+    game_id=None,
+    leagueId=None,
+    season=None,
+    include_series_status=True,
+    logger=logger,
+):
+    """Returns the schedule endpoint parameters for schedule()."""
+    if end_date and not start_date:
+        date = end_date
+        end_date = None
+
+    if start_date and not end_date:
+        date = start_date
+        start_date = None
+
+    params = {}
+
+    if date:
+        params.update({"date": date})
+    elif start_date and end_date:
+        params.update({"startDate": start_date, "endDate": end_date})
+
+    if team != "":
+        params.update({"teamId": str(team)})
+
+    if opponent != "":
+        params.update({"opponentId": str(opponent)})
+
+    if game_id:
+        params.update({"gamePks": game_id})
+
+    if leagueId:
+        params.update({"leagueId": leagueId})
+
+    if season:
+        params.update({"season": season})
+
+    hydrate = (
+        "decisions,probablePitcher(note),linescore,broadcasts,game(content(media(epg)))"
+    )
+    if include_series_status:
+        if date == "2014-03-11" or (str(start_date) <= "2014-03-11" <= str(end_date)):
+            # For some reason the seriesStatus hydration throws a server error on 2014-03-11 only (checked back to 2000)
+            logger.warning(
+                "Excluding seriesStatus hydration because the MLB API throws an error for 2014-03-11 which is included in the requested date range."
+            )
+        else:
+            hydrate += ",seriesStatus"
+    params.update(
+        {
+            "sportId": str(sportId),
+            "hydrate": hydrate,
+        }
+    )
+
+    return params
+
+
+def parse_schedule(r):
+    """Returns the list of games built by schedule() from a schedule response."""
+    games = []
+    if r.get("totalItems") == 0:
+        return games  # TODO: ValueError('No games to parse from schedule object.') instead?
+    else:
+        for date in r.get("dates"):
+            for game in date.get("games"):
+                game_info = {
+                    "game_id": game["gamePk"],
+                    "game_datetime": game["gameDate"],
+                    "game_date": date["date"],
+                    "game_type": game["gameType"],
+                    "status": game["status"]["detailedState"],
+                    "away_name": game["teams"]["away"]["team"].get("name", "???"),
+                    "home_name": game["teams"]["home"]["team"].get("name", "???"),
+                    "away_id": game["teams"]["away"]["team"]["id"],
+                    "home_id": game["teams"]["home"]["team"]["id"],
+                    "doubleheader": game["doubleHeader"],
+                    "game_num": game["gameNumber"],
+                    "home_probable_pitcher": game["teams"]["home"]
+                    .get("probablePitcher", {})
+                    .get("fullName", ""),
+                    "away_probable_pitcher": game["teams"]["away"]
+                    .get("probablePitcher", {})
+                    .get("fullName", ""),
+                    "home_pitcher_note": game["teams"]["home"]
+                    .get("probablePitcher", {})
+                    .get("note", ""),
+                    "away_pitcher_note": game["teams"]["away"]
+                    .get("probablePitcher", {})
+                    .get("note", ""),
+                    "away_score": game["teams"]["away"].get("score", "0"),
+                    "home_score": game["teams"]["home"].get("score", "0"),
+                    "current_inning": game.get("linescore", {}).get(
+                        "currentInning", ""
+                    ),
+                    "inning_state": game.get("linescore", {}).get("inningState", ""),
+                    "venue_id": game.get("venue", {}).get("id"),
+                    "venue_name": game.get("venue", {}).get("name"),
+                    "national_broadcasts": list(
+                        set(
+                            broadcast["name"]
+                            for broadcast in game.get("broadcasts", [])
+                            if broadcast.get("isNational", False)
+                        )
+                    ),
+                    "series_status": game.get("seriesStatus", {}).get("result"),
+                }
+                if game["content"].get("media", {}).get("freeGame", False):
+                    game_info["national_broadcasts"].append("MLB.tv Free Game")
+                if game_info["status"] in ["Final", "Game Over"]:
+                    if game.get("isTie"):
+                        game_info.update({"winning_team": "Tie", "losing_Team": "Tie"})
+                    else:
+                        game_info.update(
+                            {
+                                "winning_team": (
+                                    game["teams"]["away"]["team"].get("name", "???")
+                                    if game["teams"]["away"].get("isWinner")
+                                    else game["teams"]["home"]["team"].get(
+                                        "name", "???"
+                                    )
+                                ),
+                                "losing_team": (
+                                    game["teams"]["home"]["team"].get("name", "???")
+                                    if game["teams"]["away"].get("isWinner")
+                                    else game["teams"]["away"]["team"].get(
+                                        "name", "???"
+                                    )
+                                ),
+                                "winning_pitcher": game.get("decisions", {})
+                                .get("winner", {})
+                                .get("fullName", ""),
+                                "losing_pitcher": game.get("decisions", {})
+                                .get("loser", {})
+                                .get("fullName", ""),
+                                "save_pitcher": game.get("decisions", {})
+                                .get("save", {})
+                                .get("fullName"),
+                            }
+                        )
+                    summary = (
+                        date["date"]
+                        + " - "
+                        + game["teams"]["away"]["team"].get("name", "???")
+                        + " ("
+                        + str(game["teams"]["away"].get("score", ""))
+                        + ") @ "
+                        + game["teams"]["home"]["team"].get("name", "???")
+                        + " ("
+                        + str(game["teams"]["home"].get("score", ""))
+                        + ") ("
+                        + game["status"]["detailedState"]
+                        + ")"
+                    )
+                    game_info.update({"summary": summary})
+                elif game_info["status"] == "In Progress":
+                    game_info.update(
+                        {
+                            "summary": date["date"]
+                            + " - "
+                            + game["teams"]["away"]["team"]["name"]
+                            + " ("
+                            + str(game["teams"]["away"].get("score", "0"))
+                            + ") @ "
+                            + game["teams"]["home"]["team"]["name"]
+                            + " ("
+                            + str(game["teams"]["home"].get("score", "0"))
+                            + ") ("
+                            + game["linescore"]["inningState"]
+                            + " of the "
+                            + game["linescore"]["currentInningOrdinal"]
+                            + ")"
+                        }
+                    )
+                else:
+                    summary = (
+                        date["date"]
+                        + " - "
+                        + game["teams"]["away"]["team"]["name"]
+                        + " @ "
+                        + game["teams"]["home"]["team"]["name"]
+                        + " ("
+                        + game["status"]["detailedState"]
+                        + ")"
+                    )
+                    game_info.update({"summary": summary})
+
+                games.append(game_info)
+
+        return games
+
+
+def boxscore_data_params(gamePk, timecode=None):
+    """Returns the game endpoint parameters for boxscore_data()."""
+    params = {
+        "gamePk": gamePk,
+        "fields": "gameData,game,teams,teamName,shortName,teamStats,batting,atBats,runs,hits,doubles,triples,homeRuns,rbi,stolenBases,strikeOuts,baseOnBalls,leftOnBase,pitching,inningsPitched,earnedRuns,homeRuns,players,boxscoreName,liveData,boxscore,teams,players,id,fullName,allPositions,abbreviation,seasonStats,batting,avg,ops,obp,slg,era,pitchesThrown,numberOfPitches,strikes,battingOrder,info,title,fieldList,note,label,value,wins,losses,holds,blownSaves",
+    }
+    if timecode:
+        params.update({"timecode": timecode})
+
+    return params
+
+
+BATTER_FIELDS = [
+    "namefield",
+    "ab",
+    "r",
+    "h",
+    "doubles",
+    "triples",
+    "hr",
+    "rbi",
+    "sb",
+    "bb",
+    "k",
+    "lob",
+    "avg",
+    "ops",
+    "personId",
+    "battingOrder",
+    "substitution",
+    "note",
+    "name",
+    "position",
+    "obp",
+    "slg",
+]
+"""Keys of each row in the batter lists of boxscore_data()"""
+
+PITCHER_FIELDS = [
+    "namefield",
+    "ip",
+    "h",
+    "r",
+    "er",
+    "bb",
+    "k",
+    "hr",
+    "p",
+    "s",
+    "era",
+    "name",
+    "personId",
+    "note",
+]
+"""Keys of each row in the pitcher lists of boxscore_data()"""
+
+BatterRow = collections.namedtuple("BatterRow", BATTER_FIELDS)
+"""Compact batter row returned by boxscore_data(compact=True)"""
+
+PitcherRow = collections.namedtuple("PitcherRow", PITCHER_FIELDS)
+"""Compact pitcher row returned by boxscore_data(compact=True)"""
+
+
+def _same(value):
+    return value
+
+
+class _Strings(dict):
+    """str() of integer box score counts, with the small ones converted once
+    instead of in every row.
+
+    Only for ints: a float or bool key would find the string of the equal int.
+    """
+
+    def __missing__(self, value):
+        return str(value)
+
+
+_STR = _Strings((i, str(i)) for i in range(256))
+
+
+def _batter_header(teamName):
+    return {
+        "namefield": teamName + " Batters",
+        "ab": "AB",
+        "r": "R",
+        "h": "H",
+        "doubles": "2B",
+        "triples": "3B",
+        "hr": "HR",
+        "rbi": "RBI",
+        "sb": "SB",
+        "bb": "BB",
+        "k": "K",
+        "lob": "LOB",
+        "avg": "AVG",
+        "ops": "OPS",
+        "personId": 0,
+        "substitution": False,
+        "note": "",
+        "name": teamName + " Batters",
+        "position": "",
+        "obp": "OBP",
+        "slg": "SLG",
+        "battingOrder": "",
+    }
+
+
+def _pitcher_header(teamName):
+    return {
+        "namefield": teamName + " Pitchers",
+        "ip": "IP",
+        "h": "H",
+        "r": "R",
+        "er": "ER",
+        "bb": "BB",
+        "k": "K",
+        "hr": "HR",
+        "era": "ERA",
+        "p": "P",
+        "s": "S",
+        "name": teamName + " Pitchers",
+        "personId": 0,
+        "note": "",
+    }
+
+
+def _batter(player, info, batterId, compact):
+    """Returns the batter's row, or None if the player has no batting data in
+    the box score."""
+    batting = player["stats"]["batting"]
+    battingOrder = str(player["battingOrder"])
+    note = batting.get("note", "")
+    name = info["boxscoreName"]
+    position = player["position"]["abbreviation"]
+    if not len(batting):
+        # Protect against player with no batting data in the box score (#37)
+        return None
+
+    starter = battingOrder[-1] == "0"
+    namefield = (
+        (battingOrder[0] if starter else "   ") + " " + note + name + "  " + position
+    )
+    season = player["seasonStats"]["batting"]
+    if compact:
+        return BatterRow(
+            namefield,
+            batting["atBats"],
+            batting["runs"],
+            batting["hits"],
+            batting["doubles"],
+            batting["triples"],
+            batting["homeRuns"],
+            batting["rbi"],
+            batting["stolenBases"],
+            batting["baseOnBalls"],
+            batting["strikeOuts"],
+            batting["leftOnBase"],
+            season["avg"],
+            season["ops"],
+            batterId,
+            battingOrder,
+            not starter,
+            note,
+            name,
+            position,
+            season["obp"],
+            season["slg"],
+        )
+
+    s = _STR
+    return {
+        "namefield": namefield,
+        "ab": s[batting["atBats"]],
+        "r": s[batting["runs"]],
+        "h": s[batting["hits"]],
+        "doubles": s[batting["doubles"]],
+        "triples": s[batting["triples"]],
+        "hr": s[batting["homeRuns"]],
+        "rbi": s[batting["rbi"]],
+        "sb": s[batting["stolenBases"]],
+        "bb": s[batting["baseOnBalls"]],
+        "k": s[batting["strikeOuts"]],
+        "lob": s[batting["leftOnBase"]],
+        "avg": str(season["avg"]),
+        "ops": str(season["ops"]),
+        "personId": batterId,
+        "battingOrder": battingOrder,
+        "substitution": not starter,
+        "note": note,
+        "name": name,
+        "position": position,
+        "obp": str(season["obp"]),
+        "slg": str(season["slg"]),
+    }
+
+
+def _pitcher(player, pitching, info, pitcherId, compact):
+    """Returns the pitcher's row."""
+    name = info["boxscoreName"]
+    note = pitching.get("note", "")
+    namefield = name + "  " + note if note else name
+    pitches = pitching.get("pitchesThrown", pitching.get("numberOfPitches", 0))
+    era = player["seasonStats"]["pitching"]["era"]
+    if compact:
+        return PitcherRow(
+            namefield,
+            pitching["inningsPitched"],
+            pitching["hits"],
+            pitching["runs"],
+            pitching["earnedRuns"],
+            pitching["baseOnBalls"],
+            pitching["strikeOuts"],
+            pitching["homeRuns"],
+            pitches,
+            pitching["strikes"],
+            era,
+            name,
+            pitcherId,
+            note,
+        )
+
+    s = _STR
+    return {
+        "namefield": namefield,
+        "ip": str(pitching["inningsPitched"]),
+        "h": s[pitching["hits"]],
+        "r": s[pitching["runs"]],
+        "er": s[pitching["earnedRuns"]],
+        "bb": s[pitching["baseOnBalls"]],
+        "k": s[pitching["strikeOuts"]],
+        "hr": s[pitching["homeRuns"]],
+        "p": s[pitches],
+        "s": s[pitching["strikes"]],
+        "era": str(era),
+        "name": name,
+        "personId": pitcherId,
+        "note": note,
+    }
+
+
+def parse_boxscore_data(r, compact=False):
+    """Returns the boxscore data dict built by boxscore_data() from a game response.
+
+    With compact=True, the batter and pitcher rows and totals are BatterRow
+    and PitcherRow namedtuples holding the values as the StatsAPI returns
+    them, instead of dicts of strings. Totals rows leave the columns they
+    don't have empty.
+    """
+    boxData = {}
+    """boxData holds the dict to be returned"""
+
+    teamInfo = r["gameData"]["teams"]
+    playerInfo = r["gameData"]["players"]
+    teams = r["liveData"]["boxscore"]["teams"]
+    boxData.update({"gameId": r["gameData"]["game"]["id"]})
+    boxData.update({"teamInfo": teamInfo})
+    boxData.update({"playerInfo": playerInfo})
+    boxData.update({"away": teams["away"]})
+    boxData.update({"home": teams["home"]})
+
+    convert = _same if compact else str
+    count = _same if compact else _STR.__getitem__
+    awayName = teamInfo["away"]["teamName"]
+    homeName = teamInfo["home"]["teamName"]
+    for side, teamName in (("away", awayName), ("home", homeName)):
+        team = teams[side]
+        players = team["players"]
+
+        # Add column headers, then a row for each batter in the batting order
+        batters = [_batter_header(teamName)]
+        for batterId in team["batters"]:
+            key = "ID" + str(batterId)
+            player = players.get(key)
+            if not player or not player.get("battingOrder"):
+                continue
+
+            batter = _batter(player, playerInfo[key], batterId, compact)
+            if batter is not None:
+                batters.append(batter)
+        boxData.update({side + "Batters": batters})
+
+    # Add team totals
+    for side in ("away", "home"):
+        batting = teams[side]["teamStats"]["batting"]
+        boxData.update(
+            {
+                side
+                + "BattingTotals": {
+                    "namefield": "Totals",
+                    "ab": count(batting["atBats"]),
+                    "r": count(batting["runs"]),
+                    "h": count(batting["hits"]),
+                    "hr": count(batting["homeRuns"]),
+                    "rbi": count(batting["rbi"]),
+                    "bb": count(batting["baseOnBalls"]),
+                    "k": count(batting["strikeOuts"]),
+                    "lob": count(batting["leftOnBase"]),
+                    "avg": "",
+                    "ops": "",
+                    "obp": "",
+                    "slg": "",
+                    "name": "Totals",
+                    "position": "",
+                    "note": "",
+                    "substitution": False,
+                    "battingOrder": "",
+                    "personId": 0,
+                }
+            }
+        )
+
+    # Get batting notes
+    for side in ("away", "home"):
+        battingNotes = {}
+        for n in teams[side]["note"]:
+            battingNotes[len(battingNotes)] = n["label"] + "-" + n["value"]
+        boxData.update({side + "BattingNotes": battingNotes})
+
+    for side, teamName in (("away", awayName), ("home", homeName)):
+        team = teams[side]
+        players = team["players"]
+
+        # Get pitching box, starting with column headers
+        header = _pitcher_header(teamName)
+        # The home header row has always been named for the away team
+        header["name"] = awayName + " Pitchers"
+        pitchers = [header]
+        for pitcherId in team["pitchers"]:
+            key = "ID" + str(pitcherId)
+            player = players.get(key)
+            pitching = player.get("stats", {}).get("pitching") if player else None
+            if not pitching:
+                # Skip pitcher with no pitching data in the box score (#37)
+                # Or skip pitcher listed under the wrong team (from comments on #37)
+                continue
+
+            pitchers.append(
+                _pitcher(player, pitching, playerInfo[key], pitcherId, compact)
+            )
+        boxData.update({side + "Pitchers": pitchers})
+
+    # Get team totals
+    for side in ("away", "home"):
+        pitching = teams[side]["teamStats"]["pitching"]
+        boxData.update(
+            {
+                side
+                + "PitchingTotals": {
+                    "namefield": "Totals",
+                    "ip": convert(pitching["inningsPitched"]),
+                    "h": count(pitching["hits"]),
+                    "r": count(pitching["runs"]),
+                    "er": count(pitching["earnedRuns"]),
+                    "bb": count(pitching["baseOnBalls"]),
+                    "k": count(pitching["strikeOuts"]),
+                    "hr": count(pitching["homeRuns"]),
+                    "p": "",
+                    "s": "",
+                    "era": "",
+                    "name": "Totals",
+                    "personId": 0,
+                    "note": "",
+                }
+            }
+        )
+
+    if compact:
+        for side in ("away", "home"):
+            boxData[side + "Batters"][0] = BatterRow(**boxData[side + "Batters"][0])
+            boxData[side + "Pitchers"][0] = PitcherRow(**boxData[side + "Pitchers"][0])
+            boxData[side + "BattingTotals"] = BatterRow(
+                doubles="", triples="", sb="", **boxData[side + "BattingTotals"]
+            )
+            boxData[side + "PitchingTotals"] = PitcherRow(
+                **boxData[side + "PitchingTotals"]
+            )
+
+    # Get game info
+    boxData.update({"gameBoxInfo": r["liveData"]["boxscore"].get("info", [])})
+
+    return boxData
+
+
+def linescore_params(gamePk, timecode=None):
+    """Returns the game endpoint parameters for linescore()."""
+    params = {
+        "gamePk": gamePk,
+        "fields": "gameData,teams,teamName,shortName,status,abstractGameState,detailedState,liveData,linescore,innings,num,home,away,runs,hits,errors",
+    }
+    if timecode:
+        params.update({"timecode": timecode})
+
+    return params
+
+
+def parse_linescore(r):
+    """Returns the formatted linescore built by linescore() from a game response."""
+    return render.linescore(r)
+
+
+def game_scoring_play_data_params(gamePk):
+    """Returns the game endpoint parameters for game_scoring_play_data()."""
+    return {
+        "gamePk": gamePk,
+        "fields": (
+            "gamePk,link,gameData,game,pk,teams,away,id,name,teamCode,fileCode,"
+            "abbreviation,teamName,locationName,shortName,home,liveData,plays,"
+            "allPlays,scoringPlays,scoringPlays,atBatIndex,result,description,"
+            "awayScore,homeScore,about,halfInning,inning,endTime"
+        ),
+    }
+
+
+def parse_game_scoring_play_data(r):
+    """Returns the scoring play dict built by game_scoring_play_data() from a game response."""
+    if not len(r["liveData"]["plays"].get("scoringPlays", [])):
+        return {
+            "home": r["gameData"]["teams"]["home"],
+            "away": r["gameData"]["teams"]["away"],
+            "plays": [],
+        }
+
+    unorderedPlays = {}
+    for i in r["liveData"]["plays"].get("scoringPlays", []):
+        play = next(
+            (p for p in r["liveData"]["plays"]["allPlays"] if p.get("atBatIndex") == i),
+            None,
+        )
+        if play:
+            unorderedPlays.update({play["about"]["endTime"]: play})
+
+    sortedPlays = []
+    for x in sorted(unorderedPlays):
+        sortedPlays.append(unorderedPlays[x])
+
+    return {
+        "home": r["gameData"]["teams"]["home"],
+        "away": r["gameData"]["teams"]["away"],
+        "plays": sortedPlays,
+    }
+
+
+GAME_FIELDS = [
+    boxscore_data_params(None)["fields"],
+    linescore_params(None)["fields"],
+    game_scoring_play_data_params(None)["fields"],
+    "decisions,winner,loser,save,id,fullName",
+]
+"""fields lists of the game views combined by game_params()"""
+
+
+def game_params(gamePk, timecode=None):
+    """Returns the game endpoint parameters for one request covering boxscore_data(),
+    linescore(), game_scoring_play_data() and the game's decisions."""
+    fields = []
+    for name in ",".join(GAME_FIELDS).split(","):
+        if name not in fields:
+            fields.append(name)
+
+    params = {"gamePk": gamePk, "fields": ",".join(fields)}
+    if timecode:
+        params.update({"timecode": timecode})
+
+    return params
+
+
+def parse_decisions(r):
+    """Returns the winner, loser and save pitchers (each a dict with id and fullName,
+    when decided) from a game response."""
+    return r["liveData"].get("decisions", {})
+
+
+def game_highlight_data_params(gamePk):
+    """Returns the schedule endpoint parameters for game_highlight_data()."""
+    return {
+        "sportId": 1,
+        "gamePk": gamePk,
+        "hydrate": "game(content(highlights(highlights)))",
+        "fields": "dates,date,games,gamePk,content,highlights,items,headline,type,value,title,description,duration,playbacks,name,url",
+    }
+
+
+def parse_game_highlight_data(r):
+    """Returns the list of highlights built by game_highlight_data() from a schedule response."""
+    gameHighlights = (
+        r["dates"][0]["games"][0]
+        .get("content", {})
+        .get("highlights", {})
+        .get("highlights", {})
+    )
+    if not gameHighlights or not len(gameHighlights.get("items", [])):
+        return []
+
+    unorderedHighlights = {}
+    for v in (
+        x
+        for x in gameHighlights["items"]
+        if isinstance(x, dict) and x["type"] == "video"
+    ):
+        unorderedHighlights.update({v["date"]: v})
+
+    sortedHighlights = []
+    for x in sorted(unorderedHighlights):
+        sortedHighlights.append(unorderedHighlights[x])
+
+    return sortedHighlights
+
+
+def player_stat_data_params(
+    personId,
+    group="[hitting,pitching,fielding]",
+    type="season",
+    sportId=1,
+    season=None,
+):
+    """Returns the person endpoint parameters for player_stat_data()."""
+    if season is not None and "season" not in type:
+        raise ValueError(
+            "The 'season' parameter is only valid when using the 'season' type."
+        )
+
+    params = {
+        "personId": personId,
+        "hydrate": "stats(group="
+        + group
+        + ",type="
+        + type
+        + (",season=" + str(season) if season else "")
+        + ",sportId="
+        + str(sportId)
+        + "),currentTeam",
+    }
+
+    return params
+
+
+def parse_player_stat_data(r):
+    """Returns the player dict built by player_stat_data() from a person response."""
+    stat_groups = []
+
+    player = {
+        "id": r["people"][0]["id"],
+        "first_name": r["people"][0]["useName"],
+        "last_name": r["people"][0]["lastName"],
+        "active": r["people"][0]["active"],
+        "current_team": r["people"][0]["currentTeam"]["name"],
+        "position": r["people"][0]["primaryPosition"]["abbreviation"],
+        "nickname": r["people"][0].get("nickName"),
+        "last_played": r["people"][0].get("lastPlayedDate"),
+        "mlb_debut": r["people"][0].get("mlbDebutDate"),
+        "bat_side": r["people"][0]["batSide"]["description"],
+        "pitch_hand": r["people"][0]["pitchHand"]["description"],
+    }
+
+    for s in r["people"][0].get("stats", []):
+        for i in range(0, len(s["splits"])):
+            stat_group = {
+                "type": s["type"]["displayName"],
+                "group": s["group"]["displayName"],
+                "season": s["splits"][i].get("season"),
+                "stats": s["splits"][i]["stat"],
+            }
+            stat_groups.append(stat_group)
+
+    player.update({"stats": stat_groups})
+
+    return player
+
+
+def standings_data_params(
+    leagueId="103,104",
+    division="all",
+    include_wildcard=True,
+    season=None,
+    standingsTypes=None,
+    date=None,
+):
+    """Returns the standings endpoint parameters for standings_data()."""
+    params = {"leagueId": leagueId}
+    if date:
+        params.update({"date": date})
+
+    if not season:
+        if date:
+            season = date[-4:]
+        else:
+            season = datetime.now().year
+
+    if not standingsTypes:
+        standingsTypes = "regularSeason"
+
+    params.update({"season": season, "standingsTypes": standingsTypes})
+    params.update(
+        {
+            "hydrate": "team(division)",
+            "fields": "records,standingsType,teamRecords,team,name,division,id,nameShort,abbreviation,divisionRank,gamesBack,wildCardRank,wildCardGamesBack,wildCardEliminationNumber,divisionGamesBack,clinched,eliminationNumber,winningPercentage,type,wins,losses,leagueRank,sportRank",
+        }
+    )
+
+    return params
+
+
+def parse_standings_data(r, division="all"):
+    """Returns the divisions dict built by standings_data() from a standings response."""
+    divisions = {}
+
+    for y in r["records"]:
+        for x in (
+            x
+            for x in y["teamRecords"]
+            if str(division).lower() == "all"
+            or str(division).lower() == x["team"]["division"]["abbreviation"].lower()
+            or str(division) == str(x["team"]["division"]["id"])
+        ):
+            if x["team"]["division"]["id"] not in divisions.keys():
+                divisions.update(
+                    {
+                        x["team"]["division"]["id"]: {
+                            "div_name": x["team"]["division"]["name"],
+                            "teams": [],
+                        }
+                    }
+                )
+
+            team = {
+                "name": x["team"]["name"],
+                "div_rank": x["divisionRank"],
+                "w": x["wins"],
+                "l": x["losses"],
+                "gb": x["gamesBack"],
+                "wc_rank": x.get("wildCardRank", "-"),
+                "wc_gb": x.get("wildCardGamesBack", "-"),
+                "wc_elim_num": x.get("wildCardEliminationNumber", "-"),
+                "elim_num": x.get("eliminationNumber", "-"),
+                "team_id": x["team"]["id"],
+                "league_rank": x.get("leagueRank", "-"),
+                "sport_rank": x.get("sportRank", "-"),
+            }
+            divisions[x["team"]["division"]["id"]]["teams"].append(team)
+
+    return divisions
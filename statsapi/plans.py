@@ -0,0 +1,195 @@
+# encoding=utf-8
+"""Compiled request plans for MLB StatsAPI endpoints.
+
+Each entry in ENDPOINTS is compiled once into a RequestPlan, which holds the
+URL template pre-split into literal text and placeholder slots, frozenset
+parameter lookups and the required parameter sets. Building a URL from a plan
+is a single pass over the params and the template, with no string searching.
+"""
+import logging
+import re
+
+_PLACEHOLDER = re.compile(r"\{([^{}]*)\}")
+
+
+class _PathParam(object):
+    __slots__ = ("name", "is_bool", "prefix", "suffix", "true_value", "false_value")
+
+    def __init__(self, name, spec):
+        self.name = name
+        self.is_bool = spec.get("type") == "bool"
+        self.prefix = "/" if spec.get("leading_slash") else ""
+        self.suffix = "/" if spec.get("trailing_slash") else ""
+        self.true_value = spec.get("True", "")
+        self.false_value = spec.get("False", "")
+
+    def format(self, value):
+        """Return the URL text for the given parameter value, or None to ignore it."""
+        if self.is_bool:
+            value = str(value).lower()
+            if value == "true":
+                value = self.true_value
+            elif value == "false":
+                value = self.false_value
+            else:
+                return None
+        else:
+            value = str(value)
+
+        return self.prefix + value + self.suffix
+
+
+class _Slot(object):
+    __slots__ = ("name", "required", "fallback")
+
+    def __init__(self, name, spec):
+        self.name = name
+        self.required = bool(spec.get("required"))
+        if not self.required:
+            # Optional placeholders are removed when no value is given
+            self.fallback = ""
+        elif spec.get("default"):
+            self.fallback = (
+                ("/" if spec.get("leading_slash") else "")
+                + spec["default"]
+                + ("/" if spec.get("trailing_slash") else "")
+            )
+        else:
+            # Required with no default: the caller has to supply it
+            self.fallback = None
+
+
+class RequestPlan(object):
+    """Precompiled form of one ENDPOINTS entry."""
+
+    __slots__ = (
+        "name",
+        "source",
+        "literals",
+        "slots",
+        "path_params",
+        "query_params",
+        "required_sets",
+        "always_satisfied",
+        "required_params",
+        "note",
+    )
+
+    def __init__(self, name, ep, base_url=None, default_base_url=None):
+        self.name = name
+        self.source = ep
+        url = ep["url"]
+        if (
+            base_url
+            and default_base_url
+            and base_url != default_base_url
+            and url.startswith(default_base_url)
+        ):
+            url = base_url + url[len(default_base_url) :]
+
+        pieces = _PLACEHOLDER.split(url)
+        self.literals = tuple(pieces[0::2])
+        path_specs = ep.get("path_params", {})
+        self.slots = tuple(_Slot(n, path_specs.get(n) or {}) for n in pieces[1::2])
+        self.path_params = {k: _PathParam(k, v) for k, v in path_specs.items() if v}
+        self.query_params = frozenset(
+            q for q in ep.get("query_params", []) if isinstance(q, str)
+        )
+        self.required_params = ep.get("required_params", [])
+        self.required_sets = tuple(frozenset(x) for x in self.required_params if len(x))
+        self.always_satisfied = any(len(x) == 0 for x in self.required_params)
+        self.note = ep.get("note")
+
+    def build_url(self, params, force=False, logger=None):
+        """Return (url, query_params) for the given params.
+
+        Raises ValueError if a required path or query parameter is missing,
+        unless force is True.
+        """
+        debug = logger is not None and logger.isEnabledFor(logging.DEBUG)
+        path_values = {}
+        query_params = {}
+
+        # Sort parameters into path and query parameters, and discard invalid parameters
+        path_params = self.path_params
+        query_names = self.query_params
+        for p, pv in params.items():
+            spec = path_params.get(p)
+            if spec is not None:
+                value = spec.format(pv)
+                if value is not None:
+                    path_values[p] = value
+            elif p in query_names:
+                query_params[p] = str(pv)
+            elif force:
+                if debug:
+                    logger.debug(
+                        "Found invalid param, forcing into query parameters per force flag: %s",
+                        p,
+                    )
+                query_params[p] = str(pv)
+            elif debug:
+                logger.debug("Found invalid param, ignoring: %s", p)
+
+        # Fill the URL template
+        literals = self.literals
+        parts = [literals[0]]
+        for i, slot in enumerate(self.slots):
+            value = path_values.get(slot.name)
+            if value is None:
+                value = slot.fallback
+                if value is None:
+                    if not force:
+                        raise ValueError(
+                            "Missing required path parameter {%s}" % slot.name
+                        )
+
+                    if logger is not None:
+                        logger.warning(
+                            "Missing required path parameter {%s}, proceeding anyway per force flag...",
+                            slot.name,
+                        )
+                    value = "{" + slot.name + "}"
+
+            parts.append(value)
+            parts.append(literals[i + 1])
+
+        url = "".join(parts)
+
+        # Add query parameters to the URL
+        if query_params:
+            url += ("&" if "?" in url else "?") + "&".join(
+                k + "=" + v for k, v in query_params.items()
+            )
+
+        # Make sure required parameters are present
+        if not force and not self.always_satisfied:
+            if not any(s.issubset(query_params) for s in self.required_sets):
+                self._raise_missing(query_params)
+
+        if debug:
+            logger.debug("URL: %s", url)
+
+        return url, query_params
+
+    def _raise_missing(self, query_params):
+        missing_params = []
+        for x in self.required_params:
+            missing_params.extend(
+                a for a in x if a not in query_params and a not in missing_params
+            )
+        if self.note:
+            note = "\n--Endpoint note: " + self.note
+        else:
+            note = ""
+
+        raise ValueError(
+            "Missing required parameter(s): "
+            + ", ".join(missing_params)
+            + ".\n--Required parameters for the "
+            + self.name
+            + " endpoint: "
+            + str(self.required_params)
+            + ". \n--Note: If there are multiple sets in the required parameter list, you can choose any of the sets."
+            + note
+        )
@@ -0,0 +1,266 @@
+# encoding=utf-8
+"""Client-side rate limiting and retries for MLB StatsAPI requests.
+
+RateLimiter spaces requests out with token buckets (one global bucket plus
+optional per-endpoint buckets) and, when adaptive, cuts its rate while the
+StatsAPI answers with 429 or 5xx responses, then recovers gradually.
+RetryPolicy retries throttled, unavailable and failed requests with
+exponential backoff and jitter, honoring Retry-After.
+
+    limiter = statsapi.ratelimit.RateLimiter(rate=20, endpoint_rates={"game": 5})
+    client = statsapi.StatsAPIClient(rate_limiter=limiter)
+"""
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from datetime import datetime, timezone
+
+DEFAULT_RETRY_STATUSES = (429, 502, 503, 504)
+"""HTTP status codes retried by default"""
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket allowing rate requests per second on average.
+
+    * rate - tokens added per second
+    * burst - maximum number of tokens that can accumulate (default: rate, at least 1)
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return the number of seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.rate
+
+    def set_rate(self, rate):
+        """Change the refill rate, keeping the tokens accumulated so far."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self.rate = float(rate)
+
+
+class RateLimiter(object):
+    """Global and per-endpoint request rate limiter.
+
+    * rate - requests per second across all endpoints
+    * burst - requests allowed at once after an idle period (default: rate)
+    * endpoint_rates - dict of endpoint name: requests per second, applied in
+        addition to the global rate
+    * adaptive - lower the rates on 429/5xx responses and recover on success
+    * decrease - factor the rates are multiplied by on each 429/5xx response
+    * increase - fraction of the configured rates regained on each success
+    * min_factor - lowest fraction of the configured rates to throttle down to
+    """
+
+    def __init__(
+        self,
+        rate=10,
+        burst=None,
+        endpoint_rates=None,
+        adaptive=True,
+        decrease=0.5,
+        increase=0.05,
+        min_factor=0.05,
+    ):
+        self.base_rate = float(rate)
+        self.endpoint_rates = dict(endpoint_rates or {})
+        self.adaptive = adaptive
+        self.decrease = decrease
+        self.increase = increase
+        self.min_factor = min_factor
+        self.factor = 1.0
+        self._bucket = TokenBucket(rate, burst)
+        self._buckets = {k: TokenBucket(v) for k, v in self.endpoint_rates.items()}
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "delayed": 0,
+            "wait_time": 0.0,
+            "throttled": 0,
+            "server_errors": 0,
+        }
+
+    def reserve(self, endpoint=None):
+        """Reserve a request slot and return the number of seconds to wait for it."""
+        wait = self._bucket.reserve()
+        bucket = self._buckets.get(endpoint)
+        if bucket is not None:
+            wait = max(wait, bucket.reserve())
+
+        with self._lock:
+            self._stats["requests"] += 1
+            if wait > 0:
+                self._stats["delayed"] += 1
+                self._stats["wait_time"] += wait
+
+        return wait
+
+    def acquire(self, endpoint=None):
+        """Block until a request to the given endpoint is allowed."""
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, endpoint=None):
+        """Wait, without blocking the event loop, until a request to the given endpoint is allowed."""
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record(self, endpoint, status_code):
+        """Record the status code of a response, adapting the rate if enabled."""
+        throttled = status_code == 429
+        failed = status_code is None or status_code >= 500
+        with self._lock:
+            if throttled:
+                self._stats["throttled"] += 1
+            elif failed:
+                self._stats["server_errors"] += 1
+
+            if not self.adaptive:
+                return
+
+            factor = self.factor
+            if throttled or failed:
+                factor = max(self.min_factor, factor * self.decrease)
+            elif factor < 1.0:
+                factor = min(1.0, factor + self.increase)
+
+            if factor == self.factor:
+                return
+
+            self.factor = factor
+
+        self._bucket.set_rate(self.base_rate * factor)
+        for k, bucket in self._buckets.items():
+            bucket.set_rate(self.endpoint_rates[k] * factor)
+
+    @property
+    def rate(self):
+        """Current global rate in requests per second."""
+        return self.base_rate * self.factor
+
+    def stats(self):
+        """Return a dict of limiter statistics: current rate and factor, requests,
+        delayed requests and total wait time, throttled (429) and server error responses.
+        """
+        with self._lock:
+            return dict(self._stats, rate=self.rate, factor=self.factor)
+
+
+class RetryPolicy(object):
+    """When and how long to wait before retrying a failed request.
+
+    * max_retries - retries after the first attempt
+    * backoff - base delay in seconds, doubled on each retry
+    * max_backoff - longest delay between attempts
+    * jitter - randomize each delay between 0 and its computed value ("full jitter")
+    * statuses - HTTP status codes to retry
+    * connection_errors - also retry connection errors and timeouts
+    * max_retry_after - longest Retry-After delay to honor; longer ones are not retried
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        backoff=0.5,
+        max_backoff=30,
+        jitter=True,
+        statuses=DEFAULT_RETRY_STATUSES,
+        connection_errors=True,
+        max_retry_after=120,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.connection_errors = connection_errors
+        self.max_retry_after = max_retry_after
+        self._lock = threading.Lock()
+        self._stats = {"retries": 0, "exhausted": 0}
+
+    def delay(self, attempt, response=None):
+        """Return seconds to wait before retry number attempt + 1, or None to give up.
+
+        attempt is the number of retries made so far.
+        """
+        if attempt >= self.max_retries:
+            self._count("exhausted")
+            return None
+
+        retry_after = (
+            parse_retry_after(response.headers.get("Retry-After"))
+            if response is not None
+            else None
+        )
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                self._count("exhausted")
+                return None
+
+            delay = retry_after
+        else:
+            delay = min(self.max_backoff, self.backoff * (2**attempt))
+            if self.jitter:
+                delay = random.uniform(0, delay)
+
+        self._count("retries")
+        return delay
+
+    def retry_status(self, status_code):
+        """Return True if responses with the given status code should be retried."""
+        return status_code in self.statuses
+
+    def stats(self):
+        """Return a dict with the number of retries made and requests that ran out of retries."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, stat):
+        with self._lock:
+            self._stats[stat] += 1
+
+
+def parse_retry_after(value):
+    """Return the number of seconds a Retry-After header value asks to wait, or None."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
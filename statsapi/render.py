@@ -0,0 +1,566 @@
+# encoding=utf-8
+"""Text, Markdown, HTML and JSON output for boxscores, linescores, standings,
+rosters and stat leaders.
+
+Each function renders data that has already been fetched, so rendering the
+same game or standings in several formats makes no further requests:
+
+    boxData = statsapi.boxscore_data(565997)
+    text = statsapi.render.boxscore(boxData)
+    html = statsapi.render.boxscore(boxData, format="html")
+
+"text" is the output of statsapi.boxscore(), statsapi.linescore() etc. The
+other formats lay the same rows out as tables. Renderers are looked up by
+name in RENDERERS; add a Renderer (or TableRenderer) instance to it to make
+another format available to every function here.
+
+Row templates are compiled once, at import, and output is assembled with
+str.join() instead of repeated string concatenation.
+"""
+import collections
+import html
+import json
+
+Table = collections.namedtuple("Table", ["title", "columns", "rows", "notes"])
+"""One section of rendered output.
+
+* title - heading, or None
+* columns - list of column labels (may be empty, for a section of notes only)
+* rows - list of rows, each a list of values in column order
+* notes - list of lines shown after the rows
+"""
+
+ROW_LEN = 79
+"""Width of each side of the text box score, excluding the " | " separator"""
+
+FULL_ROW_LEN = ROW_LEN * 2 + 3
+"""Full width of the text box score"""
+
+BATTER_COLUMNS = ["namefield", "ab", "r", "h", "rbi", "bb", "k", "lob", "avg", "ops"]
+"""boxscore_data() batter row keys shown in a box score"""
+
+PITCHER_COLUMNS = ["namefield", "ip", "h", "r", "er", "bb", "k", "hr", "era"]
+"""boxscore_data() pitcher row keys shown in a box score"""
+
+_BATTER_ROW = (
+    "{namefield:<40} {ab:^3} {r:^3} {h:^3} {rbi:^3} {bb:^3} {k:^3} {lob:^3} "
+    "{avg:^4} {ops:^5}"
+)
+_BATTER_LINE = ((_BATTER_ROW + " | ").format_map, (_BATTER_ROW + "\n").format_map)
+_PITCHER_ROW = (
+    "{namefield:<43} {ip:^4} {h:^3} {r:^3} {er:^3} {bb:^3} {k:^3} {hr:^3} {era:^6}"
+)
+_PITCHER_LINE = ((_PITCHER_ROW + " | ").format_map, (_PITCHER_ROW + "\n").format_map)
+_SIDES_LINE = ("{:<%d} | {:<%d}\n" % (ROW_LEN, ROW_LEN)).format
+_FULL_LINE = ("{:<%d}\n" % FULL_ROW_LEN).format
+_SEPARATOR = "-" * ROW_LEN + " | " + "-" * ROW_LEN + "\n"
+_BLANK_LINE = " " * ROW_LEN + " | " + " " * ROW_LEN + "\n"
+
+_BLANK_BATTER = dict.fromkeys(BATTER_COLUMNS, "")
+_BLANK_PITCHER = dict.fromkeys(PITCHER_COLUMNS, "")
+
+_STANDINGS_WC_HEADER = (
+    "{:^4} {:<21} {:^3} {:^3} {:^4} {:^4} {:^7} {:^5} {:^4}\n".format(
+        "Rank", "Team", "W", "L", "GB", "(E#)", "WC Rank", "WC GB", "(E#)"
+    )
+)
+_STANDINGS_WC_ROW = (
+    "{div_rank:^4} {name:<21} {w:^3} {l:^3} {gb:^4} {elim_num:^4} "
+    "{wc_rank:^7} {wc_gb:^5} {wc_elim_num:^4}\n"
+).format_map
+_STANDINGS_HEADER = "{:^4} {:<21} {:^3} {:^3} {:^4} {:^4}\n".format(
+    "Rank", "Team", "W", "L", "GB", "(E#)"
+)
+_STANDINGS_ROW = (
+    "{div_rank:^4} {name:<21} {w:^3} {l:^3} {gb:^4} {elim_num:^4}\n"
+).format_map
+_STANDINGS_COLUMNS = [
+    ("div_rank", "Rank"),
+    ("name", "Team"),
+    ("w", "W"),
+    ("l", "L"),
+    ("gb", "GB"),
+    ("elim_num", "(E#)"),
+]
+_STANDINGS_WC_COLUMNS = _STANDINGS_COLUMNS + [
+    ("wc_rank", "WC Rank"),
+    ("wc_gb", "WC GB"),
+    ("wc_elim_num", "(E#)"),
+]
+
+_LINESCORE_TOTALS = "{:^4}{:^4}{:^4}".format
+_ROSTER_ROW = "#{:<3} {:<3} {}\n".format
+_TEAM_LEADERS_HEADER = "{:<4} {:<20} {:<5}\n".format("Rank", "Name", "Value")
+_TEAM_LEADERS_ROW = "{:^4} {:<20} {:^5}\n".format
+_LEAGUE_LEADERS_HEADER = "{:<4} {:<20} {:<23} {:<5}\n".format(
+    "Rank", "Name", "Team", "Value"
+)
+_LEAGUE_LEADERS_ROW = "{:^4} {:<20} {:<23} {:^5}\n".format
+
+
+def _row(row):
+    """Return a boxscore_data() row as a dict, whether a dict or a compact namedtuple."""
+    return row if isinstance(row, dict) else row._asdict()
+
+
+def _wrap(text, width):
+    """Split text into lines of at most width characters, indenting continued lines."""
+    if len(text) <= width:
+        return [text]
+
+    lines = []
+    check = ""
+    for word in text.split():
+        if len(check) + 1 + len(word) <= width:
+            check = word if check == "" else check + " " + word
+        else:
+            lines.append(check)
+            check = "    " + word
+
+    if len(check):
+        lines.append(check)
+
+    return lines
+
+
+def _paired(away, home, blank):
+    """Return away and home lists padded with blank to the same length."""
+    away = list(away)
+    home = list(home)
+    away.extend([blank] * (len(home) - len(away)))
+    home.extend([blank] * (len(away) - len(home)))
+    return away, home
+
+
+def _notes(notes):
+    """Return the values of a boxscore_data() notes dict ({0: note, 1: note, ...}) in order."""
+    return [notes[i] for i in range(len(notes))]
+
+
+def _box_info(boxData, battingInfo, fieldingInfo):
+    """Return the away and home BATTING and FIELDING info lines."""
+    sides = []
+    for side in ("away", "home"):
+        lines = []
+        for infoType, wanted in (("BATTING", battingInfo), ("FIELDING", fieldingInfo)):
+            if not wanted:
+                continue
+
+            for z in (x for x in boxData[side]["info"] if x.get("title") == infoType):
+                lines.append(z["title"])
+                for x in z["fieldList"]:
+                    lines.extend(_wrap(x["label"] + ": " + x.get("value", ""), ROW_LEN))
+            if infoType == "BATTING" and lines:
+                lines.append(" ")
+        sides.append(lines)
+
+    return sides
+
+
+def _game_info(boxData):
+    """Return the game info lines (umpires, weather, attendance, ...)."""
+    lines = []
+    for x in boxData["gameBoxInfo"]:
+        lines.extend(
+            _wrap(
+                x["label"] + (": " if x.get("value") else "") + x.get("value", ""),
+                FULL_ROW_LEN,
+            )
+        )
+
+    return lines
+
+
+def _linescore_rows(r):
+    """Return the linescore header and team rows from a game response."""
+    linescore = r["liveData"]["linescore"]
+    innings = linescore["innings"]
+    header = [r["gameData"]["status"]["abstractGameState"]]
+    away = [r["gameData"]["teams"]["away"]["teamName"]]
+    home = [r["gameData"]["teams"]["home"]["teamName"]]
+    for x in innings:
+        header.append(str(x.get("num", "")))
+        away.append(str(x.get("away", {}).get("runs", 0)))
+        home.append(str(x.get("home", {}).get("runs", 0)))
+
+    for i in range(len(innings) + 1, 10):
+        header.append(str(i))
+        away.append(" ")
+        home.append(" ")
+
+    header.extend(["R", "H", "E"])
+    for row, side in ((away, "away"), (home, "home")):
+        totals = linescore.get("teams", {}).get(side, {})
+        row.extend(
+            [
+                str(totals.get("runs", 0)),
+                str(totals.get("hits", 0)),
+                str(totals.get("errors", 0)),
+            ]
+        )
+
+    return [header, away, home]
+
+
+class Renderer(object):
+    """Renders each kind of data; subclass it to add an output format."""
+
+    def boxscore(
+        self,
+        boxData,
+        battingBox=True,
+        battingInfo=True,
+        fieldingInfo=True,
+        pitchingBox=True,
+        gameInfo=True,
+    ):
+        """Render a boxscore_data() dict."""
+        raise NotImplementedError
+
+    def linescore(self, r):
+        """Render the linescore of a game endpoint response."""
+        raise NotImplementedError
+
+    def standings(self, divisions, include_wildcard=True):
+        """Render a standings_data() dict."""
+        raise NotImplementedError
+
+    def roster(self, players):
+        """Render a list of [jerseyNumber, position abbreviation, fullName] rows."""
+        raise NotImplementedError
+
+    def team_leaders(self, lines):
+        """Render a team_leader_data() list."""
+        raise NotImplementedError
+
+    def league_leaders(self, lines):
+        """Render a league_leader_data() list."""
+        raise NotImplementedError
+
+
+class TextRenderer(Renderer):
+    """Fixed-width text, as returned by boxscore(), linescore(), standings() etc."""
+
+    def boxscore(
+        self,
+        boxData,
+        battingBox=True,
+        battingInfo=True,
+        fieldingInfo=True,
+        pitchingBox=True,
+        gameInfo=True,
+    ):
+        out = []
+        if battingBox:
+            away, home = _paired(
+                boxData["awayBatters"], boxData["homeBatters"], _BLANK_BATTER
+            )
+            away.append(boxData["awayBattingTotals"])
+            home.append(boxData["homeBattingTotals"])
+            self._box(out, away, home, _BATTER_LINE)
+
+            awayNotes, homeNotes = _paired(
+                _notes(boxData["awayBattingNotes"]),
+                _notes(boxData["homeBattingNotes"]),
+                "",
+            )
+            out.extend(map(_SIDES_LINE, awayNotes, homeNotes))
+            out.append(_BLANK_LINE)
+
+        awayInfo, homeInfo = _box_info(boxData, battingInfo, fieldingInfo)
+        if awayInfo:
+            out.extend(map(_SIDES_LINE, *_paired(awayInfo, homeInfo, "")))
+            out.append(_SEPARATOR)
+
+        if pitchingBox:
+            away, home = _paired(
+                boxData["awayPitchers"], boxData["homePitchers"], _BLANK_PITCHER
+            )
+            away.append(boxData["awayPitchingTotals"])
+            home.append(boxData["homePitchingTotals"])
+            self._box(out, away, home, _PITCHER_LINE)
+
+        if gameInfo:
+            lines = _game_info(boxData)
+            out.extend(map(_FULL_LINE, lines))
+            if lines:
+                out.append("-" * FULL_ROW_LEN + "\n")
+
+        return "".join(out)
+
+    def _box(self, out, away, home, templates):
+        """Add the header, player and totals rows of a batting or pitching box."""
+        left, right = templates
+        last = len(away) - 1
+        for i in range(len(away)):
+            line = left(_row(away[i])) + right(_row(home[i]))
+            if i == 0 or i == last:
+                out.append(_SEPARATOR)
+                out.append(line)
+                out.append(_SEPARATOR)
+            else:
+                out.append(line)
+
+    def linescore(self, r):
+        rows = _linescore_rows(r)
+        width = len(max([row[0] for row in rows], key=len)) + 1
+        name = ("{:<%d}" % width).format
+        innings = ("{:^2}" * (len(rows[0]) - 4)).format
+        return "\n".join(
+            name(row[0]) + innings(*row[1:-3]) + _LINESCORE_TOTALS(*row[-3:])
+            for row in rows
+        )
+
+    def standings(self, divisions, include_wildcard=True):
+        header, row = (
+            (_STANDINGS_WC_HEADER, _STANDINGS_WC_ROW)
+            if include_wildcard
+            else (_STANDINGS_HEADER, _STANDINGS_ROW)
+        )
+        out = []
+        for div in divisions.values():
+            out.append(div["div_name"] + "\n")
+            out.append(header)
+            out.extend(map(row, div["teams"]))
+            out.append("\n")
+
+        return "".join(out)
+
+    def roster(self, players):
+        return "".join(_ROSTER_ROW(*p) for p in players)
+
+    def team_leaders(self, lines):
+        return _TEAM_LEADERS_HEADER + "".join(_TEAM_LEADERS_ROW(*a) for a in lines)
+
+    def league_leaders(self, lines):
+        return _LEAGUE_LEADERS_HEADER + "".join(_LEAGUE_LEADERS_ROW(*a) for a in lines)
+
+
+class TableRenderer(Renderer):
+    """Lays each kind of data out as a list of Tables; subclasses format them
+    by implementing tables()."""
+
+    def tables(self, tables):
+        """Return the output for a list of Tables."""
+        raise NotImplementedError
+
+    def boxscore(
+        self,
+        boxData,
+        battingBox=True,
+        battingInfo=True,
+        fieldingInfo=True,
+        pitchingBox=True,
+        gameInfo=True,
+    ):
+        tables = []
+        infos = _box_info(boxData, battingInfo, fieldingInfo)
+        for i, side in enumerate(("away", "home")):
+            teamName = boxData["teamInfo"][side]["teamName"]
+            if battingBox:
+                tables.append(
+                    self._box_table(
+                        boxData[side + "Batters"],
+                        boxData[side + "BattingTotals"],
+                        BATTER_COLUMNS,
+                        _notes(boxData[side + "BattingNotes"]),
+                    )
+                )
+            if infos[i]:
+                tables.append(
+                    Table(teamName, [], [], [x for x in infos[i] if x.strip()])
+                )
+            if pitchingBox:
+                tables.append(
+                    self._box_table(
+                        boxData[side + "Pitchers"],
+                        boxData[side + "PitchingTotals"],
+                        PITCHER_COLUMNS,
+                        [],
+                    )
+                )
+        if gameInfo and boxData["gameBoxInfo"]:
+            tables.append(Table("Game Info", [], [], _game_info(boxData)))
+
+        return self.tables(tables)
+
+    def _box_table(self, rows, totals, columns, notes):
+        header = _row(rows[0])
+        return Table(
+            header["namefield"],
+            [""] + [header[c] for c in columns[1:]],
+            [[_row(p)[c] for c in columns] for p in rows[1:]]
+            + [[_row(totals)[c] for c in columns]],
+            notes,
+        )
+
+    def linescore(self, r):
+        header, away, home = _linescore_rows(r)
+        return self.tables([Table(None, header, [away, home], [])])
+
+    def standings(self, divisions, include_wildcard=True):
+        columns = _STANDINGS_WC_COLUMNS if include_wildcard else _STANDINGS_COLUMNS
+        return self.tables(
+            [
+                Table(
+                    div["div_name"],
+                    [label for _, label in columns],
+                    [[t[key] for key, _ in columns] for t in div["teams"]],
+                    [],
+                )
+                for div in divisions.values()
+            ]
+        )
+
+    def roster(self, players):
+        return self.tables([Table(None, ["#", "Pos", "Name"], players, [])])
+
+    def team_leaders(self, lines):
+        return self.tables([Table(None, ["Rank", "Name", "Value"], lines, [])])
+
+    def league_leaders(self, lines):
+        return self.tables([Table(None, ["Rank", "Name", "Team", "Value"], lines, [])])
+
+
+class MarkdownRenderer(TableRenderer):
+    """GitHub-flavored Markdown tables."""
+
+    @staticmethod
+    def _cell(value):
+        return str(value).replace("|", "\\|")
+
+    def tables(self, tables):
+        out = []
+        for table in tables:
+            if table.title:
+                out.append("**%s**\n\n" % table.title)
+            if table.columns:
+                cell = self._cell
+                out.append("| " + " | ".join(map(cell, table.columns)) + " |\n")
+                out.append("|" + "---|" * len(table.columns) + "\n")
+                out.extend(
+                    "| " + " | ".join(map(cell, row)) + " |\n" for row in table.rows
+                )
+                out.append("\n")
+            if table.notes:
+                out.append("  \n".join(map(self._cell, table.notes)) + "\n\n")
+
+        return "".join(out).rstrip("\n") + "\n"
+
+
+class HTMLRenderer(TableRenderer):
+    """HTML <table> elements, with the title as the caption."""
+
+    def tables(self, tables):
+        escape = html.escape
+        out = []
+        for table in tables:
+            out.append("<table>\n")
+            if table.title:
+                out.append("<caption>%s</caption>\n" % escape(table.title))
+            if table.columns:
+                out.append(
+                    "<thead><tr>"
+                    + "".join("<th>%s</th>" % escape(str(c)) for c in table.columns)
+                    + "</tr></thead>\n<tbody>\n"
+                )
+                out.extend(
+                    "<tr>"
+                    + "".join("<td>%s</td>" % escape(str(v)) for v in row)
+                    + "</tr>\n"
+                    for row in table.rows
+                )
+                out.append("</tbody>\n")
+            if table.notes:
+                out.append(
+                    "<tfoot>\n"
+                    + "".join(
+                        '<tr><td colspan="%d">%s</td></tr>\n'
+                        % (max(1, len(table.columns)), escape(note))
+                        for note in table.notes
+                    )
+                    + "</tfoot>\n"
+                )
+            out.append("</table>\n")
+
+        return "".join(out)
+
+
+class JSONRenderer(TableRenderer):
+    """A JSON array of tables, each with its title, rows (objects keyed by
+    column label) and notes."""
+
+    def tables(self, tables):
+        return json.dumps(
+            [
+                {
+                    "title": table.title,
+                    "rows": [dict(zip(table.columns, row)) for row in table.rows],
+                    "notes": table.notes,
+                }
+                for table in tables
+            ]
+        )
+
+
+RENDERERS = {
+    "text": TextRenderer(),
+    "markdown": MarkdownRenderer(),
+    "html": HTMLRenderer(),
+    "json": JSONRenderer(),
+}
+"""Renderers by format name"""
+
+
+def get_renderer(format="text"):
+    """Return the Renderer for a format name.
+
+    Raises ValueError if there is no renderer for the format.
+    """
+    try:
+        return RENDERERS[format]
+    except KeyError:
+        raise ValueError(
+            "No renderer for format %s. Available formats: %s"
+            % (format, ", ".join(RENDERERS))
+        )
+
+
+def boxscore(
+    boxData,
+    format="text",
+    battingBox=True,
+    battingInfo=True,
+    fieldingInfo=True,
+    pitchingBox=True,
+    gameInfo=True,
+):
+    """Render a boxscore_data() dict (with dict or compact rows)."""
+    return get_renderer(format).boxscore(
+        boxData, battingBox, battingInfo, fieldingInfo, pitchingBox, gameInfo
+    )
+
+
+def linescore(r, format="text"):
+    """Render the linescore of a game endpoint response, e.g. a live feed."""
+    return get_renderer(format).linescore(r)
+
+
+def standings(divisions, format="text", include_wildcard=True):
+    """Render a standings_data() dict."""
+    return get_renderer(format).standings(divisions, include_wildcard)
+
+
+def roster(players, format="text"):
+    """Render a list of [jerseyNumber, position abbreviation, fullName] rows."""
+    return get_renderer(format).roster(players)
+
+
+def team_leaders(lines, format="text"):
+    """Render a team_leader_data() list."""
+    return get_renderer(format).team_leaders(lines)
+
+
+def league_leaders(lines, format="text"):
+    """Render a league_leader_data() list."""
+    return get_renderer(format).league_leaders(lines)
@@ -0,0 +1,297 @@
+# encoding=utf-8
+"""Adaptive polling of many games from a single worker.
+
+PollScheduler keeps a priority queue (heapq) of games ordered by when each
+is next due. After every poll it classifies the game from its feed (see
+game_state()) and picks the next poll time from that state and from how
+often the game's feed has actually been changing:
+
+* scheduled - polled rarely, more often as the start time approaches
+* pregame - warmup and pre-game
+* live - a plate appearance in progress
+* break - between half innings (linescore inningState Middle or End)
+* delayed - rain delays and other stoppages
+* final - no longer polled (also postponed, suspended and cancelled games)
+
+Within a state, the interval grows toward max_factor times the state's
+interval while a game's feed stays unchanged, and shrinks back when it
+changes again. gamePks are unique across sports, so one scheduler can serve
+MLB and MiLB (other sportId) games together:
+
+    scheduler = statsapi.scheduler.PollScheduler(on_update=handle_feed)
+    for gamePk in gamePks:
+        scheduler.add(gamePk)
+    scheduler.run()
+"""
+import heapq
+import time
+from datetime import datetime, timezone
+
+from .client import default_client
+
+DEFAULT_INTERVALS = {
+    "scheduled": 1800,
+    "pregame": 120,
+    "live": 10,
+    "break": 30,
+    "delayed": 300,
+}
+"""Default seconds between polls in each game state"""
+
+FINAL_STATES = ("Postponed", "Suspended", "Cancelled", "Canceled")
+"""detailedState prefixes of games that are not going to change again today"""
+
+DELAYED_STATES = ("Delayed", "Rain Delay")
+"""detailedState prefixes of stoppages"""
+
+
+def game_state(feed):
+    """Classify a game's live feed as scheduled, pregame, live, break, delayed or final."""
+    status = feed.get("gameData", {}).get("status", {})
+    detailed = status.get("detailedState", "")
+    abstract = status.get("abstractGameState")
+    if abstract == "Final" or detailed.startswith(FINAL_STATES):
+        return "final"
+    if detailed.startswith(DELAYED_STATES):
+        return "delayed"
+    if status.get("statusCode") in ("PW", "P") or detailed in ("Warmup", "Pre-Game"):
+        return "pregame"
+    if abstract == "Live":
+        inning_state = feed.get("liveData", {}).get("linescore", {}).get("inningState")
+        if inning_state in ("Middle", "End"):
+            return "break"
+
+        return "live"
+
+    return "scheduled"
+
+
+def _start_time(feed):
+    value = feed.get("gameData", {}).get("datetime", {}).get("dateTime")
+    if not value:
+        return None
+
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(
+            tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
+
+
+class ScheduledGame(object):
+    """Polling state of one game in a PollScheduler."""
+
+    __slots__ = (
+        "gamePk",
+        "state",
+        "due",
+        "interval",
+        "timecode",
+        "last_change",
+        "change_gap",
+        "polls",
+        "changes",
+        "errors",
+    )
+
+    def __init__(self, gamePk, due):
+        self.gamePk = gamePk
+        self.state = None
+        self.due = due
+        self.interval = None
+        self.timecode = None
+        self.last_change = None
+        self.change_gap = None
+        self.polls = 0
+        self.changes = 0
+        self.errors = 0
+
+
+class PollScheduler(object):
+    """Polls games when they are due, adapting each game's interval to its state.
+
+    * client - StatsAPIClient used by the default poll function
+        (default: statsapi.default_client())
+    * poll - callable(gamePk) returning the game's current live feed, e.g. a
+        GameFollower's poll (default: download the full feed with the client)
+    * on_update - callable(gamePk, feed) called when a game's feed has changed
+    * intervals - dict of state: seconds, overriding DEFAULT_INTERVALS
+    * max_factor - largest multiple of a state's interval used for a game
+        whose feed keeps not changing
+    * min_interval - shortest interval, in seconds, ever used
+    * clock, sleep - time functions, replaceable for testing
+    """
+
+    def __init__(
+        self,
+        client=None,
+        poll=None,
+        on_update=None,
+        intervals=None,
+        max_factor=4.0,
+        min_interval=2.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.client = client or default_client()
+        self.poll = poll or self._poll
+        self.on_update = on_update
+        self.intervals = dict(DEFAULT_INTERVALS, **(intervals or {}))
+        self.max_factor = max_factor
+        self.min_interval = min_interval
+        self.clock = clock
+        self.sleep = sleep
+        self.games = {}
+        self._queue = []
+        self._seq = 0
+        self._stats = {"polls": 0, "changes": 0, "errors": 0, "finished": 0}
+
+    def _poll(self, gamePk):
+        return self.client._get_unshared("game", {"gamePk": gamePk})
+
+    def _push(self, game):
+        self._seq += 1
+        heapq.heappush(self._queue, (game.due, self._seq, game.gamePk))
+
+    def add(self, gamePk, delay=0):
+        """Start polling a game, first in delay seconds."""
+        if gamePk in self.games:
+            return
+
+        game = ScheduledGame(gamePk, self.clock() + delay)
+        self.games[gamePk] = game
+        self._push(game)
+
+    def remove(self, gamePk):
+        """Stop polling a game."""
+        # Its queue entry is skipped when it comes up
+        self.games.pop(gamePk, None)
+
+    def next_due(self):
+        """Return the seconds until the next game is due (0 if overdue),
+        or None if no game is scheduled."""
+        while self._queue:
+            due, _, gamePk = self._queue[0]
+            game = self.games.get(gamePk)
+            if game is None or game.due != due:
+                heapq.heappop(self._queue)
+                continue
+
+            return max(0.0, due - self.clock())
+
+        return None
+
+    def interval_for(self, game, feed, now):
+        """Return seconds until the next poll of a game, or None to stop polling it."""
+        if game.state == "final":
+            return None
+
+        interval = self.intervals[game.state]
+        if game.state == "scheduled":
+            start = _start_time(feed)
+            if start is not None:
+                until = (start - datetime.now(timezone.utc)).total_seconds()
+                # Poll at half the remaining time, so the first pitch isn't missed
+                interval = min(interval, max(self.intervals["pregame"], until / 2))
+
+            return max(self.min_interval, interval)
+
+        # Slow down for games whose feed changes less often than the state suggests
+        quiet = now - game.last_change if game.last_change is not None else 0
+        observed = max(game.change_gap or 0, quiet)
+        interval = min(max(interval, observed / 2), interval * self.max_factor)
+        return max(self.min_interval, interval)
+
+    def run_pending(self):
+        """Poll every game that is due and return the list of gamePks polled."""
+        polled = []
+        while self.next_due() == 0:
+            _, _, gamePk = heapq.heappop(self._queue)
+            game = self.games[gamePk]
+            self._run(game)
+            polled.append(gamePk)
+
+        return polled
+
+    def _run(self, game):
+        now = self.clock()
+        game.polls += 1
+        self._stats["polls"] += 1
+        try:
+            feed = self.poll(game.gamePk)
+        except Exception as e:
+            game.errors += 1
+            self._stats["errors"] += 1
+            game.interval = min(
+                (game.interval or self.intervals["live"]) * 2,
+                self.intervals["delayed"],
+            )
+            self.client.logger.warning(
+                "Polling game %s failed (%s), retrying in %.0fs",
+                game.gamePk,
+                e,
+                game.interval,
+            )
+            game.due = now + game.interval
+            self._push(game)
+            return
+
+        timecode = feed.get("metaData", {}).get("timeStamp")
+        state = game_state(feed)
+        changed = timecode != game.timecode or state != game.state
+        if changed:
+            if game.last_change is not None:
+                gap = now - game.last_change
+                game.change_gap = (
+                    gap
+                    if game.change_gap is None
+                    else 0.3 * gap + 0.7 * game.change_gap
+                )
+            game.last_change = now
+            game.changes += 1
+            self._stats["changes"] += 1
+            game.timecode = timecode
+        if state != game.state:
+            # Forget the old state's pace when the game moves on
+            game.change_gap = None
+            game.state = state
+
+        if changed and self.on_update is not None:
+            self.on_update(game.gamePk, feed)
+
+        game.interval = self.interval_for(game, feed, now)
+        if game.interval is None:
+            self.games.pop(game.gamePk, None)
+            self._stats["finished"] += 1
+            return
+
+        game.due = now + game.interval
+        self._push(game)
+
+    def run(self, until=None):
+        """Poll games as they come due until none are left (all final or removed).
+
+        * until - clock() value at which to return even if games remain
+        """
+        while True:
+            wait = self.next_due()
+            if wait is None:
+                return
+            if until is not None and self.clock() + wait > until:
+                self.sleep(max(0.0, until - self.clock()))
+                return
+
+            if wait:
+                self.sleep(wait)
+            self.run_pending()
+
+    def stats(self):
+        """Return a dict with the number of games scheduled and their states,
+        and totals of polls made, polls that found a change, failed polls, and
+        games that finished."""
+        states = {}
+        for game in list(self.games.values()):
+            states[game.state] = states.get(game.state, 0) + 1
+
+        return dict(self._stats, games=sum(states.values()), states=states)
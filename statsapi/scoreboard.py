@@ -0,0 +1,215 @@
+# encoding=utf-8
+"""Keep many games up to date with one change query per polling cycle.
+
+Scoreboard asks the game_changes endpoint which games were updated since its
+watermark (the start of its previous successful cycle), then downloads the
+feeds of just those games in parallel with StatsAPIClient.get_many(), instead
+of re-downloading every game on every cycle:
+
+    board = statsapi.scoreboard.Scoreboard([716463, 716464, 716465])
+    for cycle in board.run(interval=10):
+        print(cycle.changed, "games changed in", round(cycle.seconds, 2), "s")
+        for gamePk in cycle.refreshed:
+            feed = board.games[gamePk]
+"""
+import collections
+import time
+from datetime import datetime, timedelta, timezone
+
+from . import cache as _cache
+from .client import DEFAULT_BATCH_WORKERS, default_client
+
+DEFAULT_OVERLAP = 5
+"""Seconds the watermark is moved back to allow for clock differences with the StatsAPI"""
+
+DEFAULT_LOOKBACK = 3600
+"""Seconds of changes requested on the first cycle when following every game"""
+
+Cycle = collections.namedtuple(
+    "Cycle",
+    [
+        "started",
+        "seconds",
+        "changes_seconds",
+        "refresh_seconds",
+        "changed",
+        "refreshed",
+        "errors",
+        "watermark",
+    ],
+)
+"""Statistics for one Scoreboard polling cycle.
+
+* started - UTC datetime the cycle started
+* seconds - total cycle latency
+* changes_seconds - time spent asking game_changes which games changed
+* refresh_seconds - time spent downloading the changed games' feeds
+* changed - number of tracked games reported as changed (or not loaded yet)
+* refreshed - list of gamePks whose feeds were updated
+* errors - dict of gamePk: exception for feeds that failed to download
+    (they are retried on the next cycle)
+* watermark - updatedSince value to be used by the next cycle
+"""
+
+
+def _since(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class Scoreboard(object):
+    """Tracks the live feeds of a set of games, refreshing only the ones that change.
+
+    * gamePks - games to track, or None to track every game game_changes reports
+    * client - StatsAPIClient to make requests with (default: statsapi.default_client())
+    * sportId - sportId passed to game_changes
+    * params - extra parameters for each game request, e.g. {"fields": "gameData,liveData,linescore"}
+    * max_workers - number of feeds downloaded at once
+    * overlap - seconds the watermark is moved back on each cycle
+    * lookback - when tracking every game, seconds of changes requested on the first cycle
+    * history - number of recent Cycles kept in the cycles attribute
+
+    The current feeds are in the games attribute, a dict of gamePk: feed.
+    """
+
+    def __init__(
+        self,
+        gamePks=None,
+        client=None,
+        sportId=1,
+        params=None,
+        max_workers=DEFAULT_BATCH_WORKERS,
+        overlap=DEFAULT_OVERLAP,
+        lookback=DEFAULT_LOOKBACK,
+        history=100,
+    ):
+        self.client = client or default_client()
+        self.track_all = gamePks is None
+        self.tracked = set(gamePks or [])
+        self.sportId = sportId
+        self.params = dict(params or {})
+        self.max_workers = max_workers
+        self.overlap = overlap
+        self.lookback = lookback
+        self.games = {}
+        self.watermark = None
+        self.cycles = collections.deque(maxlen=history)
+        self._pending = set(self.tracked)
+
+    def track(self, gamePk):
+        """Start tracking a game; its feed is downloaded on the next cycle."""
+        self.tracked.add(gamePk)
+        if gamePk not in self.games:
+            self._pending.add(gamePk)
+
+    def untrack(self, gamePk):
+        """Stop tracking a game and forget its feed."""
+        self.tracked.discard(gamePk)
+        self._pending.discard(gamePk)
+        self.games.pop(gamePk, None)
+
+    def changed_games(self, since):
+        """Return the set of gamePks game_changes reports as updated since a UTC datetime."""
+        # Not cached: the same updatedSince asked again may have new answers
+        r = self.client._get_unshared(
+            "game_changes",
+            {
+                "updatedSince": _since(since),
+                "sportId": self.sportId,
+                "fields": "dates,games,gamePk",
+            },
+        )
+        return {g["gamePk"] for d in r.get("dates", []) for g in d.get("games", [])}
+
+    def poll(self):
+        """Run one cycle: find the changed games, refresh them, and return a Cycle."""
+        started = datetime.now(timezone.utc)
+        start = time.perf_counter()
+
+        since = self.watermark
+        if since is None and self.track_all:
+            since = started - timedelta(seconds=self.lookback)
+        if since is not None:
+            changed = self.changed_games(since)
+            if self.track_all:
+                self.tracked.update(changed)
+            changed &= self.tracked
+        else:
+            # First cycle with a fixed set of games: load them all
+            changed = set()
+        changes_seconds = time.perf_counter() - start
+
+        # Feeds never loaded, or that failed last time, are refreshed as well
+        changed |= self._pending & self.tracked
+        refreshed, errors = self._refresh(changed)
+        self._pending = set(errors)
+        self.watermark = started - timedelta(seconds=self.overlap)
+
+        seconds = time.perf_counter() - start
+        cycle = Cycle(
+            started,
+            seconds,
+            changes_seconds,
+            seconds - changes_seconds,
+            len(changed),
+            refreshed,
+            errors,
+            self.watermark,
+        )
+        self.cycles.append(cycle)
+        return cycle
+
+    def _refresh(self, gamePks):
+        params_list = [dict(self.params, gamePk=gamePk) for gamePk in sorted(gamePks)]
+        cache = self.client.cache
+        if cache is not None:
+            # game_changes says these are out of date, whatever their TTL
+            for params in params_list:
+                cache.delete(_cache.make_key("game", params))
+
+        refreshed = []
+        errors = {}
+        for result in self.client.get_many("game", params_list, self.max_workers):
+            gamePk = result.params["gamePk"]
+            if result.error is not None:
+                self.client.logger.warning(
+                    "Could not refresh game %s: %s", gamePk, result.error
+                )
+                errors[gamePk] = result.error
+            else:
+                self.games[gamePk] = result.data
+                refreshed.append(gamePk)
+
+        return refreshed, errors
+
+    def run(self, interval=10, cycles=None):
+        """Poll every interval seconds, yielding each Cycle.
+
+        * interval - seconds from the start of one cycle to the start of the next
+        * cycles - number of cycles to run (default: until the caller stops iterating)
+        """
+        n = 0
+        while cycles is None or n < cycles:
+            cycle = self.poll()
+            n += 1
+            yield cycle
+            if cycles is None or n < cycles:
+                time.sleep(max(0, interval - cycle.seconds))
+
+    def stats(self):
+        """Return a dict summarizing the recent cycles: cycles, mean and max
+        latency in seconds, and the mean number of changed games per cycle."""
+        cycles = list(self.cycles)
+        if not cycles:
+            return {
+                "cycles": 0,
+                "mean_seconds": 0.0,
+                "max_seconds": 0.0,
+                "mean_changed": 0.0,
+            }
+
+        return {
+            "cycles": len(cycles),
+            "mean_seconds": sum(c.seconds for c in cycles) / len(cycles),
+            "max_seconds": max(c.seconds for c in cycles),
+            "mean_changed": sum(c.changed for c in cycles) / len(cycles),
+        }
@@ -0,0 +1,130 @@
+# encoding=utf-8
+"""Pooled HTTP sessions for MLB StatsAPI requests.
+
+`requests.get()` builds a throwaway Session for every call, so each request
+pays for a new TCP+TLS handshake. The SessionPool in this module keeps
+keep-alive sessions around instead. `requests.Session` is not documented as
+thread-safe, so the pool hands out one session per thread; all of them share
+the pool configuration.
+"""
+import threading
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 4
+"""Number of distinct hosts to keep connection pools for"""
+DEFAULT_POOL_SIZE = 10
+"""Maximum number of keep-alive connections per host, per thread"""
+
+
+class SessionPool(object):
+    """Hands out keep-alive `requests.Session` objects, one per thread.
+
+    * pool_size - max keep-alive connections per host held by each session
+    * pool_connections - number of host pools each session keeps
+    * pool_block - block (instead of opening extra connections) when the pool is exhausted
+    * headers - dict of headers to send with every request
+    * session - a single session to use for every thread instead of managed sessions
+    * session_factory - callable returning a new session, used once per thread
+    """
+
+    def __init__(
+        self,
+        pool_size=DEFAULT_POOL_SIZE,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_block=False,
+        headers=None,
+        session=None,
+        session_factory=None,
+    ):
+        self.pool_size = pool_size
+        self.pool_connections = pool_connections
+        self.pool_block = pool_block
+        self.headers = dict(headers or {})
+        self._session = session
+        self._session_factory = session_factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Weak references, so sessions of finished threads can be collected
+        self._managed = weakref.WeakSet()
+
+    def get_session(self):
+        """Return the session for the calling thread, creating it if needed."""
+        if self._session is not None:
+            return self._session
+
+        s = getattr(self._local, "session", None)
+        if s is None:
+            s = self._new_session()
+            self._local.session = s
+            with self._lock:
+                self._managed.add(s)
+
+        return s
+
+    def set_session(self, session):
+        """Use the given session for every thread. Pass None to go back to managed sessions."""
+        self._session = session
+
+    def _new_session(self):
+        if self._session_factory:
+            return self._session_factory()
+
+        s = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_size,
+            pool_block=self.pool_block,
+        )
+        s.mount("https://", adapter)
+        s.mount("http://", adapter)
+        s.headers.update(self.headers)
+        return s
+
+    def close(self):
+        """Close all managed sessions. Threads will get fresh sessions on their next request.
+
+        An injected session is not closed; its owner is responsible for it.
+        """
+        with self._lock:
+            managed, self._managed = list(self._managed), weakref.WeakSet()
+        for s in managed:
+            s.close()
+        self._local = threading.local()
+
+
+default_pool = SessionPool()
+"""Session pool used by statsapi.get() and the functions built on it"""
+
+
+def get_session():
+    """Return the calling thread's session from the default pool."""
+    return default_pool.get_session()
+
+
+def set_session(session):
+    """Inject a session to be used by statsapi.get(). Pass None to restore managed sessions."""
+    default_pool.set_session(session)
+
+
+def configure(
+    pool_size=DEFAULT_POOL_SIZE,
+    pool_connections=DEFAULT_POOL_CONNECTIONS,
+    pool_block=False,
+    headers=None,
+    session_factory=None,
+):
+    """Replace the default pool's configuration. Existing managed sessions are closed."""
+    global default_pool
+    old_pool = default_pool
+    default_pool = SessionPool(
+        pool_size=pool_size,
+        pool_connections=pool_connections,
+        pool_block=pool_block,
+        headers=headers,
+        session=old_pool._session,
+        session_factory=session_factory,
+    )
+    old_pool.close()
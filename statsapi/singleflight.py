@@ -0,0 +1,91 @@
+# encoding=utf-8
+"""Request coalescing: concurrent identical calls share a single execution.
+
+When many threads (or coroutines) ask for the same request at the same time,
+only the first one calls the StatsAPI; the others wait for it and receive the
+same decoded result, or the same exception. Results are shared objects, so
+treat them as read-only.
+"""
+import asyncio
+import threading
+
+
+class _Call(object):
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Coalesces concurrent calls with the same key across threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    def do(self, key, fn, *args, **kwargs):
+        """Return fn(*args, **kwargs), sharing the call with any in flight for key."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+                self._stats["calls"] += 1
+            else:
+                leader = False
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def stats(self):
+        """Return a dict with the number of calls made and calls coalesced into them."""
+        with self._lock:
+            return dict(self._stats)
+
+
+class AsyncSingleFlight(object):
+    """Coalesces concurrent coroutine calls with the same key on one event loop."""
+
+    def __init__(self):
+        self._tasks = {}
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    async def do(self, key, fn, *args, **kwargs):
+        """Return await fn(*args, **kwargs), sharing the call with any in flight for key."""
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            task = loop.create_task(fn(*args, **kwargs))
+            self._tasks[task_key] = task
+            task.add_done_callback(lambda t: self._tasks.pop(task_key, None))
+            self._stats["calls"] += 1
+        else:
+            self._stats["coalesced"] += 1
+
+        # Shield the shared task so one caller's cancellation doesn't cancel it for the rest
+        return await asyncio.shield(task)
+
+    def stats(self):
+        """Return a dict with the number of calls made and calls coalesced into them."""
+        return dict(self._stats)
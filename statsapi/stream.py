@@ -0,0 +1,241 @@
+# encoding=utf-8
+"""Incremental parsing of large StatsAPI responses.
+
+iter_array() scans a JSON document as its chunks arrive and yields the items
+of one nested array, decoding a single item at a time. The rest of the
+document is skipped without being decoded, and bytes are released as soon as
+they are scanned, so memory use depends on the size of one item rather than
+the whole document. StatsAPIClient.iter_plays() and iter_pitches() use it on
+the game live feed:
+
+    for play in statsapi.iter_plays(565997):
+        print(play["about"]["inning"], play["result"]["description"])
+"""
+import json
+import re
+
+from . import decoding
+
+PLAYS_PATH = ("liveData", "plays", "allPlays")
+"""Path to the list of plays in the game live feed"""
+
+DEFAULT_CHUNK_SIZE = 65536
+"""Bytes read from the response at a time"""
+
+# A complete string, a bracket, or a lone quote opening a string that
+# continues past the end of the buffer
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]|"', re.DOTALL)
+_SCALAR_END = re.compile(rb"[,\]}\s]")
+_WHITESPACE = frozenset(b" \t\r\n")
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_COMMA = ord(",")
+_COLON = ord(":")
+_OPEN = frozenset(b"[{")
+_LBRACE = ord("{")
+_RBRACE = ord("}")
+_LBRACKET = ord("[")
+_RBRACKET = ord("]")
+
+
+class _Reader(object):
+    """Buffer over an iterable of byte chunks that drops bytes once consumed."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.buf = bytearray()
+        self.pos = 0
+        self.mark = None
+
+    def fill(self):
+        """Append the next chunk, discarding consumed bytes. Returns False at the end."""
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+
+            keep = self.pos if self.mark is None else self.mark
+            if keep:
+                del self.buf[:keep]
+                self.pos -= keep
+                if self.mark is not None:
+                    self.mark -= keep
+
+            self.buf += chunk
+            return True
+
+        return False
+
+    def peek(self):
+        """Skip whitespace and return the next byte, or None at the end."""
+        while True:
+            buf = self.buf
+            pos = self.pos
+            end = len(buf)
+            while pos < end and buf[pos] in _WHITESPACE:
+                pos += 1
+
+            self.pos = pos
+            if pos < end:
+                return buf[pos]
+            if not self.fill():
+                return None
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(
+                "Expected %r at byte %d of the JSON buffer" % (chr(char), self.pos)
+            )
+
+        self.pos += 1
+
+    def skip_value(self, capture=False):
+        """Consume one JSON value, returning its bytes if capture is True."""
+        c = self.peek()
+        if c is None:
+            raise ValueError("Unexpected end of JSON input")
+
+        if capture:
+            self.mark = self.pos
+
+        if c in _OPEN:
+            depth = 0
+            search = _TOKEN.search
+            while True:
+                buf = self.buf
+                pos = self.pos
+                m = search(buf, pos)
+                while m is not None:
+                    pos = m.end()
+                    c = buf[m.start()]
+                    if c == _QUOTE:
+                        if pos - m.start() == 1:
+                            # Unterminated string: read more and scan it again
+                            pos = m.start()
+                            break
+                    elif c in _OPEN:
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            break
+
+                    m = search(buf, pos)
+
+                self.pos = pos if m is not None else len(buf)
+                if depth == 0:
+                    break
+                if not self.fill():
+                    raise ValueError("Unexpected end of JSON input")
+        elif c == _QUOTE:
+            self._skip_string()
+        else:
+            while True:
+                m = _SCALAR_END.search(self.buf, self.pos)
+                if m is not None:
+                    self.pos = m.start()
+                    break
+
+                self.pos = len(self.buf)
+                if not self.fill():
+                    break
+
+        if capture:
+            value = bytes(self.buf[self.mark : self.pos])
+            self.mark = None
+            return value
+
+    def _skip_string(self):
+        # self.pos is at the opening quote; keep it there until the string
+        # ends so a refill can't discard the part already scanned
+        scanned = 1
+        while True:
+            buf = self.buf
+            j = buf.find(b'"', self.pos + scanned)
+            if j == -1:
+                scanned = len(buf) - self.pos
+                if not self.fill():
+                    raise ValueError("Unterminated string in JSON input")
+                continue
+
+            k = j - 1
+            while buf[k] == _BACKSLASH:
+                k -= 1
+            if (j - 1 - k) % 2 == 0:
+                self.pos = j + 1
+                return
+
+            scanned = j + 1 - self.pos
+
+
+def _iter_items(reader, path, decoder):
+    c = reader.peek()
+    if path:
+        if c != _LBRACE:
+            reader.skip_value()
+            return
+
+        reader.pos += 1
+        while True:
+            c = reader.peek()
+            if c == _RBRACE:
+                reader.pos += 1
+                return
+            elif c == _COMMA:
+                reader.pos += 1
+                continue
+
+            key = json.loads(reader.skip_value(capture=True))
+            reader.expect(_COLON)
+            if key == path[0]:
+                yield from _iter_items(reader, path[1:], decoder)
+            else:
+                reader.skip_value()
+
+    if c != _LBRACKET:
+        reader.skip_value()
+        return
+
+    reader.pos += 1
+    while True:
+        c = reader.peek()
+        if c == _RBRACKET:
+            reader.pos += 1
+            return
+        elif c == _COMMA:
+            reader.pos += 1
+            continue
+        elif c is None:
+            raise ValueError("Unexpected end of JSON input")
+
+        yield decoder(reader.skip_value(capture=True))
+
+
+def iter_array(chunks, path, decoder=None):
+    """Yield the decoded items of the array at path in a JSON document.
+
+    * chunks - iterable of bytes making up the document, e.g. Response.iter_content()
+    * path - sequence of object keys leading to the array, e.g. PLAYS_PATH
+    * decoder - callable decoding one item (default: statsapi.decoding.loads)
+
+    Yields nothing if the path does not exist or does not lead to an array.
+    The whole document is consumed, so the connection can be reused.
+    Raises ValueError if the document is truncated or malformed.
+    """
+    reader = _Reader(chunks)
+    yield from _iter_items(reader, tuple(path), decoder or decoding.loads)
+    if reader.peek() is not None:
+        raise ValueError("Unexpected data after JSON document")
+
+
+def iter_pitches(plays):
+    """Yield the pitch events from an iterable of plays.
+
+    Each pitch is the play event dict from the play's playEvents, with the
+    play's atBatIndex added.
+    """
+    for play in plays:
+        at_bat = play.get("atBatIndex", play.get("about", {}).get("atBatIndex"))
+        for event in play.get("playEvents", []):
+            if event.get("isPitch"):
+                event["atBatIndex"] = at_bat
+                yield event
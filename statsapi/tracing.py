@@ -0,0 +1,174 @@
+# encoding=utf-8
+"""Span-style tracing of StatsAPIClient calls.
+
+A client given a Tracer opens a span around every high-level function call
+("call" spans, e.g. boxscore or lookup_player) and around each phase of the
+work inside it:
+
+* network - sending the request and receiving the response
+* decode - decoding the response body
+* transform - turning the decoded response into the function's result
+* render - formatting the result as text
+
+Each span is a dict passed to the tracer's start and end callbacks, with
+these keys:
+
+* name - function name, e.g. "boxscore_data", or endpoint name for network
+    and decode spans
+* phase - "call", "network", "decode", "transform" or "render"
+* attributes - dict of details, e.g. the call's args and kwargs or the URL
+* parent - the enclosing span, or None
+* depth - number of enclosing spans
+* start, end - time.perf_counter() values (end is None until the span ends)
+* duration - seconds, set when the span ends
+* error - the exception that ended the span, or None
+
+The current span is tracked with a context variable, so nested calls such as
+lookup_player() -> latest_season() -> get() form a tree even when several
+threads or asyncio tasks share a client. CallTree collects that tree:
+
+    tree = statsapi.tracing.CallTree()
+    client = statsapi.StatsAPIClient(tracer=tree)
+    client.boxscore(565997)
+    print(tree.format())
+"""
+import contextlib
+import contextvars
+import threading
+import time
+
+PHASES = ("call", "network", "decode", "transform", "render")
+"""Phases a span can have"""
+
+_current = contextvars.ContextVar("statsapi_span", default=None)
+
+
+def current_span():
+    """Return the innermost open span in this context, or None."""
+    return _current.get()
+
+
+class Tracer(object):
+    """Receives a client's spans as they start and end.
+
+    * on_start - callable(span) called when a span starts
+    * on_end - callable(span) called when a span ends
+
+    Subclasses can override start() and end() instead.
+    """
+
+    def __init__(self, on_start=None, on_end=None):
+        self.on_start = on_start
+        self.on_end = on_end
+
+    def start(self, span):
+        if self.on_start is not None:
+            self.on_start(span)
+
+    def end(self, span):
+        if self.on_end is not None:
+            self.on_end(span)
+
+    @contextlib.contextmanager
+    def span(self, name, phase, **attributes):
+        """Context manager timing a span nested in the current one, yielding the span dict.
+
+        * name - span name; defaults to the parent span's name
+        * phase - one of PHASES
+        * attributes - details stored in the span's attributes dict
+        """
+        parent = _current.get()
+        span = {
+            "name": name if name is not None else (parent or {}).get("name"),
+            "phase": phase,
+            "attributes": attributes,
+            "parent": parent,
+            "depth": 0 if parent is None else parent["depth"] + 1,
+            "start": time.perf_counter(),
+            "end": None,
+            "duration": None,
+            "error": None,
+        }
+        token = _current.set(span)
+        self.start(span)
+        try:
+            yield span
+        except BaseException as e:
+            span["error"] = e
+            raise
+        finally:
+            _current.reset(token)
+            span["end"] = time.perf_counter()
+            span["duration"] = span["end"] - span["start"]
+            self.end(span)
+
+
+class CallTree(Tracer):
+    """Tracer keeping finished spans as a tree.
+
+    Each span gets a "children" list of the spans nested in it, and spans
+    without a parent are appended to roots when they end.
+
+    * max_roots - number of root spans to keep (default: all)
+    """
+
+    def __init__(self, max_roots=None):
+        super().__init__()
+        self.roots = []
+        self.max_roots = max_roots
+        self._lock = threading.Lock()
+
+    def start(self, span):
+        span["children"] = []
+        if span["parent"] is not None:
+            with self._lock:
+                span["parent"].setdefault("children", []).append(span)
+
+    def end(self, span):
+        if span["parent"] is None:
+            with self._lock:
+                self.roots.append(span)
+                if self.max_roots is not None and len(self.roots) > self.max_roots:
+                    del self.roots[: len(self.roots) - self.max_roots]
+
+    def clear(self):
+        with self._lock:
+            self.roots = []
+
+    def totals(self):
+        """Return a dict of phase: total seconds spent in spans of that phase,
+        excluding time spent in nested spans."""
+        totals = dict.fromkeys(PHASES, 0.0)
+        with self._lock:
+            stack = list(self.roots)
+
+        while stack:
+            span = stack.pop()
+            children = span.get("children", [])
+            totals[span["phase"]] += span["duration"] - sum(
+                c["duration"] or 0 for c in children
+            )
+            stack.extend(children)
+
+        return totals
+
+    def format(self):
+        """Return the tree as indented text, one span per line."""
+        lines = []
+        with self._lock:
+            stack = list(reversed(self.roots))
+
+        while stack:
+            span = stack.pop()
+            lines.append(
+                "{}{} {} {:.2f} ms{}".format(
+                    "  " * span["depth"],
+                    span["phase"],
+                    span["name"],
+                    (span["duration"] or 0) * 1000,
+                    " (%s)" % type(span["error"]).__name__ if span["error"] else "",
+                )
+            )
+            stack.extend(reversed(span.get("children", [])))
+
+        return "\n".join(lines)
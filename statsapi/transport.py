@@ -0,0 +1,217 @@
+# encoding=utf-8
+"""Pluggable transports that carry StatsAPIClient requests.
+
+A transport has a get(url, **request_kwargs) method returning a
+requests.Response. StatsAPIClient uses RequestsTransport, which sends
+requests over pooled sessions, unless another is given:
+
+* RecordingTransport saves every response to a gzip-compressed archive
+* ReplayTransport serves responses from an archive without network access
+* LatencyTransport delays another transport's responses to simulate a network
+
+    with statsapi.StatsAPIClient(
+        transport=RecordingTransport("games.jsonl.gz")
+    ) as client:
+        client.boxscore_data(565997)
+
+    offline = statsapi.StatsAPIClient(transport=ReplayTransport("games.jsonl.gz"))
+    offline.boxscore_data(565997)
+"""
+import base64
+import gzip
+import json
+import random
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from . import sessions
+
+
+class Transport(object):
+    """Base class for transports."""
+
+    def get(self, url, **request_kwargs):
+        """Send a GET request and return a requests.Response."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the transport."""
+
+
+class RequestsTransport(Transport):
+    """Sends requests over the calling thread's session from a SessionPool.
+
+    * pool - statsapi.sessions.SessionPool (default: the shared pool in statsapi.sessions)
+    """
+
+    def __init__(self, pool=None):
+        self.pool = pool
+
+    def get(self, url, **request_kwargs):
+        if self.pool is not None:
+            session = self.pool.get_session()
+        else:
+            session = sessions.get_session()
+
+        return session.get(url, **request_kwargs)
+
+
+class RecordingTransport(Transport):
+    """Sends requests through another transport and appends each response to an archive.
+
+    * path - archive file, gzip-compressed JSON lines; appended to if it exists
+    * transport - transport to record (default: RequestsTransport())
+
+    Streamed responses are read in full before they are returned.
+    """
+
+    def __init__(self, path, transport=None):
+        self.path = path
+        self.transport = transport or RequestsTransport()
+        self._lock = threading.Lock()
+        self._file = None
+
+    def get(self, url, **request_kwargs):
+        r = self.transport.get(url, **request_kwargs)
+        record = {
+            "url": url,
+            "status": r.status_code,
+            "headers": dict(r.headers),
+        }
+        try:
+            record["text"] = r.content.decode("utf-8")
+        except UnicodeDecodeError:
+            record["base64"] = base64.b64encode(r.content).decode("ascii")
+
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = gzip.open(self.path, "at", encoding="utf-8")
+            self._file.write(line)
+
+        return r
+
+    def close(self):
+        """Finish writing the archive."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """Serves responses recorded by RecordingTransport, without network access.
+
+    * path - archive file written by RecordingTransport
+    * fallback - transport for requests missing from the archive (default: raise LookupError)
+
+    Requests are matched by URL, ignoring the order of query parameters.
+    Responses recorded more than once for a URL are served in recorded order,
+    and the last one is repeated after that, so replays are deterministic.
+    """
+
+    def __init__(self, path, fallback=None):
+        self.path = path
+        self.fallback = fallback
+        self._responses = {}
+        self._served = {}
+        self._lock = threading.Lock()
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._responses.setdefault(
+                        _normalize_url(record["url"]), []
+                    ).append(record)
+
+    def __len__(self):
+        return sum(len(v) for v in self._responses.values())
+
+    def get(self, url, **request_kwargs):
+        key = _normalize_url(url)
+        records = self._responses.get(key)
+        if records is None:
+            if self.fallback is not None:
+                return self.fallback.get(url, **request_kwargs)
+
+            raise LookupError("No recorded response for %s" % url)
+
+        with self._lock:
+            i = self._served.get(key, 0)
+            self._served[key] = i + 1
+
+        return _response(url, records[min(i, len(records) - 1)])
+
+    def rewind(self):
+        """Serve every URL's responses from the first one again."""
+        with self._lock:
+            self._served.clear()
+
+    def close(self):
+        if self.fallback is not None:
+            self.fallback.close()
+
+
+class LatencyTransport(Transport):
+    """Delays the responses of another transport, e.g. a ReplayTransport.
+
+    * transport - transport to wrap
+    * latency - seconds added to every request
+    * jitter - up to this many seconds added at random
+    * bandwidth - bytes per second used to add transfer time for each body (default: none)
+    * seed - random seed, for repeatable jitter
+    """
+
+    def __init__(self, transport, latency=0.05, jitter=0.0, bandwidth=None, seed=None):
+        self.transport = transport
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def get(self, url, **request_kwargs):
+        start = time.monotonic()
+        r = self.transport.get(url, **request_kwargs)
+        delay = self.latency
+        if self.jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.jitter)
+        if self.bandwidth:
+            delay += len(r.content) / self.bandwidth
+
+        remaining = delay - (time.monotonic() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+
+        return r
+
+    def close(self):
+        self.transport.close()
+
+
+def _normalize_url(url):
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+
+def _response(url, record):
+    r = requests.Response()
+    r.url = url
+    r.status_code = record["status"]
+    r.headers = CaseInsensitiveDict(record["headers"])
+    r.encoding = "utf-8"
+    if "text" in record:
+        r._content = record["text"].encode("utf-8")
+    else:
+        r._content = base64.b64decode(record["base64"])
+    r._content_consumed = True
+    r.reason = "OK" if r.status_code < 400 else "Recorded error"
+    return r
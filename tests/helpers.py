@@ -0,0 +1,30 @@
+import json
+from unittest import mock
+
+
+def response(data, status_code=200, headers=None):
+    """Return a fake requests.Response whose body is data, encoded as JSON unless it is bytes."""
+    if not isinstance(data, bytes):
+        data = json.dumps(data).encode()
+
+    return mock.Mock(status_code=status_code, content=data, headers=headers or {})
+
+
+def fake_dict(url="http://www.foo.com"):
+    """Return an endpoints dict holding a single "foo" endpoint at url."""
+    return {
+        "foo": {
+            "url": url,
+            "path_params": {
+                "ver": {
+                    "type": "str",
+                    "default": "v1",
+                    "leading_slash": False,
+                    "trailing_slash": False,
+                    "required": True,
+                }
+            },
+            "query_params": ["bar"],
+            "required_params": [[]],
+        }
+    }
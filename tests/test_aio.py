@@ -0,0 +1,61 @@
+import asyncio
+import statsapi
+import threading
+import time
+
+
+def fake_linescore():
+    return {
+        "gameData": {
+            "status": {"abstractGameState": "Final"},
+            "teams": {"away": {"teamName": "Mets"}, "home": {"teamName": "Phillies"}},
+        },
+        "liveData": {
+            "linescore": {
+                "innings": [
+                    {"num": i, "away": {"runs": 0}, "home": {"runs": 1}}
+                    for i in range(1, 10)
+                ],
+                "teams": {
+                    "away": {"runs": 0, "hits": 4, "errors": 1},
+                    "home": {"runs": 9, "hits": 12, "errors": 0},
+                },
+            }
+        },
+    }
+
+
+def test_async_helpers_share_sync_parsing(mocker):
+    client = statsapi.StatsAPIClient()
+    mocker.patch.object(client, "get", return_value=fake_linescore())
+    aclient = statsapi.AsyncStatsAPIClient(client)
+
+    result = asyncio.run(aclient.linescore(565997))
+    assert result == client.linescore(565997)
+    aclient.close()
+
+
+def test_async_concurrency_is_bounded(mocker):
+    client = statsapi.StatsAPIClient()
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def slow_get(*args, **kwargs):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return fake_linescore()
+
+    mocker.patch.object(client, "get", side_effect=slow_get)
+    aclient = statsapi.AsyncStatsAPIClient(client, max_concurrency=3)
+
+    async def main():
+        return await asyncio.gather(*(aclient.linescore(pk) for pk in range(12)))
+
+    results = asyncio.run(main())
+    assert len(results) == 12
+    assert state["peak"] <= 3
+    aclient.close()
@@ -0,0 +1,136 @@
+from statsapi import parsers
+
+
+def batter(battingOrder, note=None, batting=True):
+    stats = {}
+    if batting:
+        stats = dict.fromkeys(
+            [
+                "atBats",
+                "runs",
+                "hits",
+                "doubles",
+                "triples",
+                "homeRuns",
+                "rbi",
+                "stolenBases",
+                "baseOnBalls",
+                "strikeOuts",
+                "leftOnBase",
+            ],
+            1,
+        )
+        if note:
+            stats["note"] = note
+    return {
+        "battingOrder": battingOrder,
+        "position": {"abbreviation": "SS"},
+        "stats": {"batting": stats},
+        "seasonStats": {
+            "batting": {"avg": ".250", "ops": ".700", "obp": ".300", "slg": ".400"}
+        },
+    }
+
+
+def pitcher(**extra):
+    pitching = dict(
+        dict.fromkeys(
+            [
+                "hits",
+                "runs",
+                "earnedRuns",
+                "baseOnBalls",
+                "strikeOuts",
+                "homeRuns",
+                "strikes",
+            ],
+            2,
+        ),
+        inningsPitched="6.0",
+        **extra
+    )
+    return {
+        "stats": {"pitching": pitching},
+        "seasonStats": {"pitching": {"era": "3.00"}},
+    }
+
+
+def team_stats():
+    batting = dict.fromkeys(
+        ["atBats", "runs", "hits", "homeRuns", "rbi", "baseOnBalls", "strikeOuts"], 3
+    )
+    pitching = dict.fromkeys(
+        ["hits", "runs", "earnedRuns", "baseOnBalls", "strikeOuts", "homeRuns"], 3
+    )
+    return {
+        "batting": dict(batting, leftOnBase=5),
+        "pitching": dict(pitching, inningsPitched="9.0"),
+    }
+
+
+def fake_game():
+    away = {
+        "batters": [1, 2, 3, 4],
+        "pitchers": [5, 6, 9],
+        "players": {
+            "ID1": batter("100"),
+            "ID2": batter("101", note="a-"),
+            "ID3": batter(None),
+            "ID4": batter("200", batting=False),
+            "ID5": pitcher(note="(W, 1-0)", numberOfPitches=80),
+            "ID6": pitcher(pitchesThrown=20),
+        },
+        "teamStats": team_stats(),
+        "note": [{"label": "a", "value": "Singled for Smith in the 8th."}],
+    }
+    home = {
+        "batters": [],
+        "pitchers": [],
+        "players": {},
+        "teamStats": team_stats(),
+        "note": [],
+    }
+    return {
+        "gameData": {
+            "game": {"id": "2019/07/21/nynmlb-phimlb-1"},
+            "teams": {"away": {"teamName": "Mets"}, "home": {"teamName": "Phillies"}},
+            "players": {"ID%d" % i: {"boxscoreName": "P%d" % i} for i in range(10)},
+        },
+        "liveData": {"boxscore": {"teams": {"away": away, "home": home}}},
+    }
+
+
+def test_boxscore_rows():
+    box = parsers.parse_boxscore_data(fake_game())
+
+    assert [b["namefield"] for b in box["awayBatters"]] == [
+        "Mets Batters",
+        "1 P1  SS",
+        "    a-P2  SS",
+    ]
+    assert box["awayBatters"][2]["substitution"] is True
+    assert box["awayBatters"][1]["ab"] == "1"
+    assert box["awayBattingNotes"] == {0: "a-Singled for Smith in the 8th."}
+    assert [(p["namefield"], p["p"]) for p in box["awayPitchers"]] == [
+        ("Mets Pitchers", "P"),
+        ("P5  (W, 1-0)", "80"),
+        ("P6", "20"),
+    ]
+    assert box["homePitchers"][0]["namefield"] == "Phillies Pitchers"
+    assert box["homeBattingTotals"]["lob"] == "5"
+    assert box["gameBoxInfo"] == []
+
+
+def test_compact_rows_hold_the_same_values():
+    game = fake_game()
+    box = parsers.parse_boxscore_data(game)
+    compact = parsers.parse_boxscore_data(game, compact=True)
+
+    for key in ["awayBatters", "awayPitchers", "homePitchers"]:
+        assert [
+            {k: str(v) for k, v in row._asdict().items()} for row in compact[key]
+        ] == [{k: str(v) for k, v in row.items()} for row in box[key]]
+    assert compact["awayBatters"][1].ab == 1
+    assert compact["awayPitchers"][1].era == "3.00"
+    assert compact["awayBattingTotals"].doubles == ""
+    assert compact["homePitchingTotals"].ip == "9.0"
@@ -0,0 +1,216 @@
+import responses
+import sqlite3
+import statsapi
+import zlib
+from statsapi.sessions import SessionPool
+from statsapi.cache import MemoryCache, SQLiteCache, make_key
+
+
+def test_make_key_is_canonical():
+    assert make_key("schedule", {"sportId": 1, "date": "07/04/2023"}) == make_key(
+        "schedule", {"date": "07/04/2023", "sportId": "1"}
+    )
+
+
+def test_memory_cache_expires_entries(mocker):
+    now = mocker.patch("statsapi.cache.time.time", return_value=1000.0)
+    cache = MemoryCache(ttls={"game": 10})
+    cache.set("k", {"a": 1}, 10, cache.ttl_for("game"))
+    assert cache.get("k").data == {"a": 1}
+
+    now.return_value = 1011.0
+    assert cache.get("k") is None
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["expirations"] == 1
+
+
+def test_memory_cache_lru_eviction_by_entries_and_bytes():
+    cache = MemoryCache(max_entries=2, max_bytes=100)
+    cache.set("a", 1, 10, 60)
+    cache.set("b", 2, 10, 60)
+    cache.get("a")
+    cache.set("c", 3, 10, 60)
+    assert cache.get("b") is None
+    assert cache.get("a").data == 1
+
+    cache.set("d", 4, 95, 60)
+    assert cache.get("a") is None and cache.get("c") is None
+    assert cache.stats()["bytes"] == 95
+
+
+def test_client_serves_repeat_calls_from_cache(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.content = b"{}"
+    mock_session.get.return_value.headers = {}
+    client = statsapi.StatsAPIClient(session=mock_session, cache=MemoryCache())
+
+    first = client.get("meta", {"type": "gameTypes"})
+    second = client.get("meta", {"type": "gameTypes"})
+    assert first is second
+    assert mock_session.get.call_count == 1
+    assert client.cache.stats()["hits"] == 1
+
+
+def test_sqlite_cache_round_trip_and_prune(tmp_path, mocker):
+    now = mocker.patch("statsapi.cache.time.time", return_value=1000.0)
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    key = make_key("game", {"gamePk": 565997})
+    cache.set(key, None, 13, 10, b'{"gamePk":1}')
+    cache.set(make_key("meta", {"type": "sky"}), [{"code": "1"}], 0, None)
+
+    # a second cache on the same file sees the entries
+    other = SQLiteCache(str(tmp_path / "cache.db"))
+    assert other.get(key).data == {"gamePk": 1}
+
+    now.return_value = 1011.0
+    assert statsapi.cache.prune(other) == 1
+    assert other.get(key) is None
+    assert other.get(make_key("meta", {"type": "sky"})).data == [{"code": "1"}]
+    assert other.stats()["entries"] == 1
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path, mocker):
+    now = mocker.patch("statsapi.cache.time.time", return_value=1000.0)
+    cache = SQLiteCache(str(tmp_path / "cache.db"), max_bytes=70, compress_level=0)
+    for i, k in enumerate(["a", "b", "c"]):
+        now.return_value = 1000.0 + i
+        cache.set(k, None, 0, 60, b'"xxxxxxxx"')
+
+    now.return_value = 1010.0
+    cache.get("a")
+    now.return_value = 1011.0
+    cache.set("d", None, 0, 60, b'"xxxxxxxx"')
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_sqlite_cache_batches_access_times_and_tracks_size(tmp_path, mocker):
+    now = mocker.patch("statsapi.cache.time.time", return_value=1000.0)
+    cache = SQLiteCache(str(tmp_path / "cache.db"), compress_level=0)
+    cache.set("a", None, 0, 60, b'"xxxxxxxx"')
+    cache.set("b", None, 0, 60, b'"xxxxxxxx"')
+    cache.set("a", None, 0, 60, b'"xx"')
+    cache.delete("b")
+
+    def accessed():
+        conn = sqlite3.connect(str(tmp_path / "cache.db"))
+        try:
+            return conn.execute("SELECT accessed FROM responses").fetchone()[0]
+        finally:
+            conn.close()
+
+    now.return_value = 1010.0
+    assert cache.get("a").data == "xx"
+    assert accessed() == 1000.0
+    cache.close()
+    assert accessed() == 1010.0
+    assert cache.stats()["bytes"] == len(b'"xx"')
+    conn = cache._connect()
+    assert (
+        conn.execute("SELECT bytes FROM usage").fetchone()
+        == conn.execute("SELECT SUM(stored_size) FROM responses").fetchone()
+    )
+
+
+def test_sqlite_cache_counts_uncompressed_bytes(tmp_path, mocker):
+    mocker.patch("statsapi.cache.time.time", return_value=1000.0)
+    path = str(tmp_path / "cache.db")
+    body = b'{"records":[' + b'{"team":"Mets"},' * 50 + b"{}]}"
+    blob = zlib.compress(body)
+    # A database written before stored_size, holding the compressed length in size
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE responses (key TEXT PRIMARY KEY, endpoint TEXT, body BLOB, "
+        "size INTEGER, expires REAL, accessed REAL, etag TEXT, "
+        "last_modified TEXT, discard_at REAL)"
+    )
+    conn.execute(
+        "INSERT INTO responses VALUES (?, NULL, ?, ?, 900, 900, '\"a\"', NULL, NULL)",
+        (statsapi.cache._db_key("old"), blob, len(blob)),
+    )
+    conn.commit()
+    conn.close()
+
+    cache = SQLiteCache(path, max_bytes=len(blob) * 2)
+    cache.set("new", None, 0, 60, body)
+    assert cache.stats()["bytes"] == 2 * len(body)
+    cache.revalidated("old", cache.get("old", allow_stale=True), 60)
+    assert cache.stats()["bytes_saved"] == len(body)
+    # max_bytes still limits the compressed size: both entries fit
+    assert cache.get("new") is not None and cache.stats()["evictions"] == 0
+
+
+def test_sqlite_cache_decodes_stale_entries_only_when_used(tmp_path, mocker):
+    now = mocker.patch("statsapi.cache.time.time", return_value=1000.0)
+    decoder = mocker.Mock(return_value={"records": []})
+    cache = SQLiteCache(str(tmp_path / "cache.db"), decoder=decoder)
+    cache.set("k", None, 0, 10, b'{"records":[]}', etag='"abc"')
+
+    now.return_value = 1011.0
+    entry = cache.get("k", allow_stale=True)
+    assert entry.etag == '"abc"' and not entry.is_fresh()
+    assert decoder.call_count == 0
+    assert entry.data == entry.data == {"records": []}
+    assert decoder.call_count == 1
+
+
+def test_immutable_responses_do_not_expire():
+    cache = MemoryCache(ttls={"game": 10})
+    assert cache.ttl_for("game", {"gamePk": "1"}, {}) == 10
+    assert (
+        cache.ttl_for("game", {"gamePk": "1", "timecode": "20190721_201500"}, {})
+        is None
+    )
+
+    def feed(detailedState):
+        status = {"abstractGameState": "Final", "detailedState": detailedState}
+        return {"gameData": {"status": status}}
+
+    assert cache.ttl_for("game", {"gamePk": "1"}, feed("Final")) is None
+    for unsettled in ["Game Over", "Postponed", "Suspended: Rain", None]:
+        assert cache.ttl_for("game", {"gamePk": "1"}, feed(unsettled)) == 10
+    assert MemoryCache(permanent=False).ttl_for("game", {"timecode": "1"}, {}) == 10
+
+
+def test_client_caches_timecode_requests_permanently(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.content = b"{}"
+    mock_session.get.return_value.headers = {}
+    cache = MemoryCache()
+    client = statsapi.StatsAPIClient(session=mock_session, cache=cache)
+
+    client.get("game", {"gamePk": 565997, "timecode": "20190721_201500"})
+    client.get("game", {"gamePk": 565997})
+    assert (
+        cache.get(
+            make_key("game", {"gamePk": 565997, "timecode": "20190721_201500"})
+        ).expires
+        is None
+    )
+    assert cache.get(make_key("game", {"gamePk": 565997})).expires is not None
+
+
+@responses.activate
+def test_client_revalidates_stale_entries_with_etag(mocker):
+    url = statsapi.BASE_URL + "v1/standings?leagueId=103"
+    responses.add(responses.GET, url, json={"records": []}, headers={"ETag": '"abc"'})
+    responses.add(responses.GET, url, status=304)
+    now = mocker.patch("statsapi.cache.time.time", return_value=1000.0)
+    cache = MemoryCache(ttls={"standings": 10})
+    client = statsapi.StatsAPIClient(cache=cache, pool=SessionPool())
+
+    first = client.get("standings", {"leagueId": 103})
+    now.return_value = 1011.0
+    second = client.get("standings", {"leagueId": 103})
+
+    assert second is first
+    assert responses.calls[1].request.headers["If-None-Match"] == '"abc"'
+    stats = cache.stats()
+    assert stats["not_modified"] == 1
+    assert stats["bytes_saved"] == len(b'{"records": []}')
+    # the entry is fresh again after the 304
+    client.get("standings", {"leagueId": 103})
+    assert len(responses.calls) == 2
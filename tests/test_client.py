@@ -0,0 +1,153 @@
+import asyncio
+import statsapi
+import threading
+import time
+from tests.helpers import fake_dict, response
+
+
+def test_client_uses_own_base_url_and_session(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.content = b"{}"
+    client = statsapi.StatsAPIClient(
+        base_url="http://localhost:8080/api/",
+        endpoints=fake_dict(statsapi.BASE_URL + "{ver}/foo"),
+        session=mock_session,
+        request_kwargs={"timeout": 5},
+    )
+
+    client.get("foo", {"bar": "baz"})
+    mock_session.get.assert_called_with(
+        "http://localhost:8080/api/v1/foo?bar=baz", timeout=5
+    )
+
+
+def test_request_kwargs_override_client_defaults(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.content = b"{}"
+    client = statsapi.StatsAPIClient(
+        endpoints=fake_dict(statsapi.BASE_URL + "{ver}/foo"),
+        session=mock_session,
+        request_kwargs={"timeout": 5},
+    )
+
+    client.get("foo", {"bar": "baz"}, request_kwargs={"timeout": 30})
+    mock_session.get.assert_called_with(
+        statsapi.BASE_URL + "v1/foo?bar=baz", timeout=30
+    )
+
+
+def test_module_functions_use_default_client(mocker):
+    client = mocker.Mock()
+    mocker.patch("statsapi.client._default_client", client)
+
+    statsapi.linescore(565997)
+    client.linescore.assert_called_with(565997, None, format="text")
+
+
+def test_set_default_client(mocker):
+    client = statsapi.StatsAPIClient()
+    statsapi.set_default_client(client)
+    try:
+        assert statsapi.default_client() is client
+    finally:
+        statsapi.set_default_client(None)
+    assert statsapi.default_client() is not client
+
+
+def test_get_many_isolates_errors(mocker):
+    client = statsapi.StatsAPIClient()
+
+    def fake_get(endpoint, params, force=False, request_kwargs={}):
+        if params["gamePk"] == 2:
+            raise ValueError("boom")
+        return {"gamePk": params["gamePk"]}
+
+    mocker.patch.object(client, "get", side_effect=fake_get)
+
+    results = list(
+        client.get_many("game", [{"gamePk": pk} for pk in range(5)], max_workers=2)
+    )
+    assert len(results) == 5
+    for result in results:
+        if result.params["gamePk"] == 2:
+            assert isinstance(result.error, ValueError)
+            assert result.data is None
+        else:
+            assert result.error is None
+            assert result.data == {"gamePk": result.params["gamePk"]}
+    client.close()
+
+
+def test_get_many_keeps_executor_in_use_by_another_batch(mocker):
+    client = statsapi.StatsAPIClient()
+    mocker.patch.object(
+        client, "get", side_effect=lambda endpoint, params, *a, **k: params
+    )
+    params = [{"gamePk": pk} for pk in range(6)]
+
+    first = client.get_many("game", params, max_workers=2)
+    next(first)
+    assert len(list(client.get_many("game", params, max_workers=4))) == 6
+    rest = list(first)
+    assert len(rest) == 5 and all(r.error is None for r in rest)
+    assert list(client._batch_users.values()) == []
+    client.close()
+
+
+def test_results_are_not_shared_by_default(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = lambda url, **kwargs: response({"gamePk": 1})
+    client = statsapi.StatsAPIClient(session=mock_session)
+
+    assert client.singleflight is None
+    assert statsapi.AsyncStatsAPIClient(client).singleflight is None
+    first = client.get("game", {"gamePk": 1})
+    first["gamePk"] = 2
+    assert client.get("game", {"gamePk": 1}) == {"gamePk": 1}
+
+
+def test_concurrent_identical_calls_are_coalesced(mocker):
+    release = threading.Event()
+    mock_session = mocker.Mock()
+
+    def slow_get(url, **kwargs):
+        release.wait(1)
+        return response({"url": url})
+
+    mock_session.get.side_effect = slow_get
+    client = statsapi.StatsAPIClient(session=mock_session, coalesce=True)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(client.get("game", {"gamePk": 565997}))
+        )
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    while client.singleflight.stats()["coalesced"] < 4:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert mock_session.get.call_count == 1
+    assert len(results) == 5 and all(r is results[0] for r in results)
+
+
+def test_async_identical_calls_are_coalesced(mocker):
+    client = statsapi.StatsAPIClient()
+    mock_get = mocker.patch.object(client, "get", return_value={"gamePk": 565997})
+    aclient = statsapi.AsyncStatsAPIClient(client, coalesce=True)
+
+    async def main():
+        return await asyncio.gather(
+            *(aclient.get("game", {"gamePk": 565997}) for _ in range(5))
+        )
+
+    results = asyncio.run(main())
+    assert mock_get.call_count == 1
+    assert all(r is results[0] for r in results)
+    aclient.close()
@@ -0,0 +1,38 @@
+import pytest
+import statsapi
+from statsapi import decoding
+
+BODY = b'{"allPlays": [{"about": {"inning": 1}, "result": {"event": "Single"}}]}'
+
+
+@pytest.mark.parametrize("name", decoding.available())
+def test_decoders_agree(name):
+    assert decoding.get_decoder(name)(BODY) == decoding.get_decoder("json")(BODY)
+    assert decoding.get_decoder(name, intern_keys=True)(BODY.decode()) == {
+        "allPlays": [{"about": {"inning": 1}, "result": {"event": "Single"}}]
+    }
+
+
+@pytest.mark.parametrize("name", decoding.available())
+def test_interned_keys_are_shared_across_responses(name):
+    loads = decoding.get_decoder(name, intern_keys=True)
+    # Build the bodies at runtime so the keys aren't compile-time constants
+    first, second = (loads(b'{"%s": 1}' % (b"playEv" + b"ents")) for _ in range(2))
+
+    assert list(first)[0] is list(second)[0]
+
+
+def test_unknown_decoder():
+    with pytest.raises(ValueError):
+        decoding.get_decoder("simdjson")
+
+
+def test_client_uses_decoder(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.content = BODY
+    decoder = mocker.Mock(return_value={"decoded": True})
+    client = statsapi.StatsAPIClient(session=mock_session, decoder=decoder)
+
+    assert client.get("game", {"gamePk": 565997}) == {"decoded": True}
+    decoder.assert_called_once_with(BODY)
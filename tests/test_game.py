@@ -0,0 +1,59 @@
+import statsapi
+
+
+def fake_game():
+    return {
+        "gameData": {
+            "status": {"abstractGameState": "Final"},
+            "teams": {
+                "away": {"name": "New York Mets", "teamName": "Mets"},
+                "home": {"name": "Philadelphia Phillies", "teamName": "Phillies"},
+            },
+        },
+        "liveData": {
+            "linescore": {
+                "innings": [
+                    {"num": i, "away": {"runs": 0}, "home": {"runs": i % 2}}
+                    for i in range(1, 10)
+                ],
+                "teams": {
+                    "away": {"runs": 0, "hits": 4, "errors": 1},
+                    "home": {"runs": 5, "hits": 12, "errors": 0},
+                },
+            },
+            "plays": {
+                "scoringPlays": [3, 1],
+                "allPlays": [
+                    {
+                        "atBatIndex": i,
+                        "result": {"description": "Play %d" % i},
+                        "about": {"endTime": "2019-07-21T17:%02d:00Z" % i},
+                    }
+                    for i in range(5)
+                ],
+            },
+            "decisions": {"winner": {"id": 1, "fullName": "Aaron Nola"}},
+        },
+    }
+
+
+def test_game_fetches_once_and_memoizes_views(mocker):
+    client = statsapi.StatsAPIClient()
+    get = mocker.patch.object(client, "get", return_value=fake_game())
+    game = statsapi.Game(565997, "20190721_170500", client=client)
+
+    assert game.linescore == client.linescore(565997)
+    assert game.scoring_plays == client.game_scoring_play_data(565997)
+    assert [p["atBatIndex"] for p in game.scoring_plays["plays"]] == [1, 3]
+    assert game.decisions["winner"]["fullName"] == "Aaron Nola"
+    assert game.linescore is game.linescore
+
+    game_calls = [c for c in get.call_args_list if c[0][1].get("timecode")]
+    assert len(game_calls) == 1
+    fields = game_calls[0][0][1]["fields"].split(",")
+    assert len(fields) == len(set(fields))
+    assert {"boxscore", "innings", "scoringPlays", "decisions"} <= set(fields)
+
+    game.refresh()
+    game.linescore
+    assert get.call_count == 4
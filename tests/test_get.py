@@ -1,49 +1,35 @@
 import statsapi
 import pytest
+import threading
 import requests.exceptions
 import responses
-
-
-def fake_dict():
-    return {
-        "foo": {
-            "url": "http://www.foo.com",
-            "path_params": {
-                "ver": {
-                    "type": "str",
-                    "default": "v1",
-                    "leading_slash": False,
-                    "trailing_slash": False,
-                    "required": True,
-                }
-            },
-            "query_params": ["bar"],
-            "required_params": [[]],
-        }
-    }
+from tests.helpers import fake_dict
 
 
 def test_get_returns_dictionary(mocker):
     # mock the ENDPOINTS dictionary
     mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
-    # mock the requests object
-    mock_req = mocker.patch("statsapi.requests", autospec=True)
+    # mock the pooled session
+    mock_session = mocker.Mock()
+    mocker.patch("statsapi.sessions.get_session", return_value=mock_session)
     # mock the status code to always be 200
-    mock_req.get.return_value.status_code = 200
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.content = b'{"foo": "baz"}'
 
     result = statsapi.get("foo", {"bar": "baz"})
-    # assert that result is the same as the return value from calling the json method of a response object
-    assert result == mock_req.get.return_value.json.return_value
+    # assert that result is the decoded body of the response
+    assert result == {"foo": "baz"}
 
 
 def test_get_calls_correct_url(mocker):
     # mock the ENDPOINTS dictionary
     mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
-    # mock the requests object
-    mock_req = mocker.patch("statsapi.requests", autospec=True)
+    # mock the pooled session
+    mock_session = mocker.Mock()
+    mocker.patch("statsapi.sessions.get_session", return_value=mock_session)
 
     statsapi.get("foo", {"bar": "baz"})
-    mock_req.get.assert_called_with("http://www.foo.com?bar=baz")
+    mock_session.get.assert_called_with("http://www.foo.com?bar=baz")
 
 
 @responses.activate
@@ -59,11 +45,69 @@ def test_get_server_error(mocker):
 def test_get_invalid_endpoint(mocker):
     # mock the ENDPOINTS dictionary
     mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
-    # mock the requests object
-    mock_req = mocker.patch("statsapi.requests", autospec=True)
+    # mock the pooled session
+    mocker.patch("statsapi.sessions.get_session")
     # invalid endpoint
     with pytest.raises(ValueError):
         statsapi.get("bar", {"foo": "baz"})
 
-    # TODO: add test for path requirement not met
-    # TODO: add test for required params
+
+def test_get_path_requirement_not_met(mocker):
+    mocker.patch("statsapi.sessions.get_session")
+    with pytest.raises(ValueError):
+        statsapi.get("game", {"fields": "gamePk"})
+
+
+def test_get_required_params(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.content = b"{}"
+    mocker.patch("statsapi.sessions.get_session", return_value=mock_session)
+    with pytest.raises(ValueError):
+        statsapi.get("attendance", {"season": 2019})
+
+    # any one of the required parameter sets is enough
+    statsapi.get("attendance", {"leagueId": 103, "season": 2019})
+    mock_session.get.assert_called_with(
+        "https://statsapi.mlb.com/api/v1/attendance?leagueId=103&season=2019"
+    )
+
+
+def test_get_path_params_and_defaults(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.return_value.status_code = 200
+    mock_session.get.return_value.content = b"{}"
+    mocker.patch("statsapi.sessions.get_session", return_value=mock_session)
+
+    statsapi.get("game", {"gamePk": 565997, "timecode": "20190301_180000"})
+    mock_session.get.assert_called_with(
+        "https://statsapi.mlb.com/api/v1.1/game/565997/feed/live?timecode=20190301_180000"
+    )
+
+    statsapi.get("awards", {"awardId": "MLBHOF", "recipients": "false"})
+    mock_session.get.assert_called_with("https://statsapi.mlb.com/api/v1/awards/MLBHOF")
+    statsapi.get("awards", {"awardId": "MLBHOF", "recipients": True})
+    mock_session.get.assert_called_with(
+        "https://statsapi.mlb.com/api/v1/awards/MLBHOF/recipients"
+    )
+
+
+def test_session_pool_reuses_session_per_thread():
+    pool = statsapi.sessions.SessionPool(pool_size=2)
+    s = pool.get_session()
+    assert pool.get_session() is s
+
+    sessions = []
+    t = threading.Thread(target=lambda: sessions.append(pool.get_session()))
+    t.start()
+    t.join()
+    assert sessions[0] is not s
+    pool.close()
+
+
+def test_session_pool_injected_session(mocker):
+    mock_session = mocker.Mock()
+    pool = statsapi.sessions.SessionPool(session=mock_session)
+    assert pool.get_session() is mock_session
+    pool.close()
+    mock_session.close.assert_not_called()
@@ -0,0 +1,126 @@
+from urllib.parse import parse_qs, urlsplit
+
+import statsapi
+from statsapi.history import GameHistory
+from tests.helpers import response
+
+TIMECODES = ["20190721_1705%02d" % i for i in range(10)]
+
+
+def feed(n):
+    return {
+        "metaData": {"timeStamp": TIMECODES[n]},
+        "liveData": {"plays": list(range(n))},
+    }
+
+
+def patch(n):
+    return {
+        "diff": [
+            {"op": "replace", "path": "/metaData/timeStamp", "value": TIMECODES[n]},
+            {"op": "add", "path": "/liveData/plays/-", "value": n - 1},
+        ]
+    }
+
+
+def fake_get(url, **kwargs):
+    parts = urlsplit(url)
+    query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+    if parts.path.endswith("/timestamps"):
+        body = list(reversed(TIMECODES))
+    elif parts.path.endswith("/diffPatch"):
+        start = TIMECODES.index(query["startTimecode"])
+        end = TIMECODES.index(query["endTimecode"])
+        # Too many changes for one diff: the StatsAPI sends a full feed
+        body = (
+            feed(end)
+            if end - start > 3
+            else [patch(n) for n in range(start + 1, end + 1)]
+        )
+    else:
+        body = feed(TIMECODES.index(query["timecode"]))
+
+    return response(body)
+
+
+def test_history_replays_states_without_network(mocker, tmp_path):
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = fake_get
+    client = statsapi.StatsAPIClient(session=mock_session)
+    history = GameHistory(565997, client, keyframe_interval=4).load()
+    requests = mock_session.get.call_count
+
+    assert history.state_at("20190721_170459") is None
+    assert history.state_at("20190721_170503") == feed(3)
+    assert history.state_at("20190721_170506") == feed(6)
+    assert history.state_at("20190721_170599") == feed(9)
+    assert [
+        list(doc["liveData"]["plays"]) for _, doc in history.iter_states(TIMECODES[::3])
+    ] == [list(range(n)) for n in range(0, 10, 3)]
+    assert mock_session.get.call_count == requests
+    assert history.stats()["keyframes"] == 3
+
+    path = str(tmp_path / "565997.history.gz")
+    history.save(path)
+    assert GameHistory.open(path, client).state_at(TIMECODES[7]) == feed(7)
+
+
+def test_history_falls_back_to_step_diffs(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = fake_get
+    history = GameHistory(
+        565997, statsapi.StatsAPIClient(session=mock_session), keyframe_interval=10
+    )
+
+    # Loaded lazily; the 9-step diff comes back as a full feed, so the
+    # steps are requested one at a time
+    assert history.state_at(TIMECODES[5]) == feed(5)
+    assert history.stats()["requests"] == 3 + 9
+    assert history.state_at(TIMECODES[9]) == feed(9)
+
+
+def test_history_states_do_not_share_patch_values(mocker):
+    timecodes = TIMECODES[:3]
+    operations = [
+        {"op": "add", "path": "/liveData/currentPlay", "value": {"desc": "pitch 1"}},
+        {"op": "replace", "path": "/liveData/currentPlay/desc", "value": "single"},
+    ]
+
+    def get(url, **kwargs):
+        parts = urlsplit(url)
+        if parts.path.endswith("/timestamps"):
+            return response(timecodes)
+        elif parts.path.endswith("/diffPatch"):
+            return response(
+                [
+                    {
+                        "diff": [
+                            {
+                                "op": "replace",
+                                "path": "/metaData/timeStamp",
+                                "value": t,
+                            },
+                            op,
+                        ]
+                    }
+                    for t, op in zip(timecodes[1:], operations)
+                ]
+            )
+
+        return response({"metaData": {"timeStamp": timecodes[0]}, "liveData": {}})
+
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = get
+    history = GameHistory(565997, statsapi.StatsAPIClient(session=mock_session)).load()
+
+    # Out of order: the later state must not change the patch the earlier one uses
+    assert history.state_at(timecodes[2])["liveData"]["currentPlay"] == {
+        "desc": "single"
+    }
+    first = history.state_at(timecodes[1])
+    assert first["liveData"]["currentPlay"] == {"desc": "pitch 1"}
+    first["liveData"]["currentPlay"]["desc"] = "changed"
+    assert history.state_at(timecodes[1])["liveData"]["currentPlay"] == {
+        "desc": "pitch 1"
+    }
+    assert history.stats()["operations"] == 4
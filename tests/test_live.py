@@ -0,0 +1,161 @@
+import pytest
+import statsapi
+from statsapi.live import GameFollower, PatchError, apply_patch
+from tests.helpers import response
+
+
+def feed(timecode, plays, state="Live"):
+    return {
+        "metaData": {"timeStamp": timecode, "wait": 10},
+        "gameData": {"status": {"abstractGameState": state}},
+        "liveData": {"plays": {"allPlays": plays}},
+    }
+
+
+def test_apply_patch():
+    doc = {"a": {"b~c": 1, "list": [1, 2]}, "x": "y"}
+    doc = apply_patch(
+        doc,
+        [
+            {"op": "replace", "path": "/a/b~0c", "value": 2},
+            {"op": "add", "path": "/a/list/-", "value": 3},
+            {"op": "add", "path": "/a/list/0", "value": 0},
+            {"op": "remove", "path": "/x"},
+            {"op": "copy", "from": "/a/list", "path": "/copy"},
+            {"op": "move", "from": "/copy", "path": "/moved"},
+            {"op": "test", "path": "/moved/3", "value": 3},
+        ],
+    )
+
+    assert doc == {"a": {"b~c": 2, "list": [0, 1, 2, 3]}, "moved": [0, 1, 2, 3]}
+    apply_patch(
+        doc,
+        [
+            {"op": "copy", "from": "/a", "path": "/b"},
+            {"op": "add", "path": "/b/list/-", "value": 4},
+            {"op": "replace", "path": "/a/b~0c", "value": 3},
+        ],
+    )
+    assert doc["a"] == {"b~c": 3, "list": [0, 1, 2, 3]}
+    assert doc["b"] == {"b~c": 2, "list": [0, 1, 2, 3, 4]}
+    del doc["b"]
+    with pytest.raises(PatchError):
+        apply_patch(doc, [{"op": "replace", "path": "/missing", "value": 1}])
+    with pytest.raises(PatchError):
+        apply_patch(doc, [{"op": "add", "path": "/a/list/9", "value": 1}])
+
+
+def test_follower_applies_patches_and_falls_back_to_full_feed(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = [
+        response(feed("1", [{"n": 1}])),
+        response(
+            [
+                {
+                    "diff": [
+                        {"op": "replace", "path": "/metaData/timeStamp", "value": "2"},
+                        {
+                            "op": "add",
+                            "path": "/liveData/plays/allPlays/-",
+                            "value": {"n": 2},
+                        },
+                    ]
+                }
+            ],
+        ),
+        response([]),
+        response([{"diff": [{"op": "remove", "path": "/nothing"}]}]),
+        response(feed("4", [{"n": 1}, {"n": 2}, {"n": 3}], "Final")),
+    ]
+    client = statsapi.StatsAPIClient(session=mock_session)
+    follower = GameFollower(565997, client=client)
+
+    assert follower.poll().full
+    update = follower.poll()
+    assert (update.timecode, len(update.operations), update.full) == ("2", 2, False)
+    assert follower.data["liveData"]["plays"]["allPlays"] == [{"n": 1}, {"n": 2}]
+    assert mock_session.get.call_args[0][0].endswith(
+        "/game/565997/feed/live/diffPatch?startTimecode=1"
+    )
+    assert follower.poll().operations == []
+    assert follower.poll().full
+    assert follower.is_final
+    assert follower.stats() == {
+        "polls": 4,
+        "full_refreshes": 2,
+        "patches": 2,
+        "failures": 1,
+    }
+
+
+def play(index, inning, half, pitches, complete=False, scoring=False):
+    events = [{"isPitch": True, "index": i} for i in range(pitches)]
+    return {
+        "about": {
+            "atBatIndex": index,
+            "inning": inning,
+            "halfInning": half,
+            "isComplete": complete,
+            "isScoringPlay": scoring,
+        },
+        "result": {"event": "Home Run" if scoring else "Single"},
+        "playEvents": events,
+    }
+
+
+def test_event_stream_derives_events_from_patches(mocker):
+    follower = GameFollower(565997, client=mocker.Mock())
+    follower.data = feed("1", [play(0, 1, "top", 3, complete=True)])
+    stream = statsapi.live.GameEventStream(follower)
+    scoring = []
+    stream.add_callback(scoring.append, kinds=["scoring_play"])
+
+    assert stream.process(statsapi.live.Update("1", [], True)) == []
+
+    operations = [
+        {"op": "add", "path": "/gameData/status/detailedState", "value": "Delay"},
+        {
+            "op": "add",
+            "path": "/liveData/plays/allPlays/-",
+            "value": play(1, 1, "bottom", 1),
+        },
+        {
+            "op": "add",
+            "path": "/liveData/plays/allPlays/1/playEvents/-",
+            "value": {"details": {"eventType": "pitching_substitution"}},
+        },
+    ]
+    apply_patch(follower.data, operations)
+    events = stream.process(statsapi.live.Update("2", operations, False))
+    assert [e.kind for e in events] == [
+        "status_change",
+        "inning_change",
+        "pitch",
+        "pitching_change",
+    ]
+    assert events[1].detail == {"inning": 1, "halfInning": "bottom"}
+
+    operations = [
+        {
+            "op": "add",
+            "path": "/liveData/plays/allPlays/1/playEvents/-",
+            "value": {"isPitch": True},
+        },
+        {
+            "op": "replace",
+            "path": "/liveData/plays/allPlays/1/about/isComplete",
+            "value": True,
+        },
+        {
+            "op": "replace",
+            "path": "/liveData/plays/allPlays/1/about/isScoringPlay",
+            "value": True,
+        },
+    ]
+    apply_patch(follower.data, operations)
+    events = stream.process(statsapi.live.Update("3", operations, False))
+    assert [e.kind for e in events] == ["pitch", "plate_appearance", "scoring_play"]
+    assert [e.play["about"]["atBatIndex"] for e in scoring] == [1]
+
+    # A full reload repeats nothing already seen
+    assert stream.process(statsapi.live.Update("3", [], True)) == []
@@ -0,0 +1,68 @@
+import statsapi
+from statsapi.cache import MemoryCache
+from statsapi.metrics import Histogram, Metrics, prometheus_text
+from tests.helpers import response
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram([0.1, 1])
+    for value in [0.05, 0.1, 0.5, 3]:
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(0.1, 2), (1, 3), (float("inf"), 4)]
+    assert histogram.sum == 3.65
+
+
+def test_client_records_requests_retries_and_cache(mocker):
+    mocker.patch("statsapi.client.time.sleep")
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = [
+        response({"gamePk": 565997}, 503),
+        response({"gamePk": 565997}),
+    ]
+    metrics = Metrics()
+    events = []
+    metrics.add_callback(events.append)
+    client = statsapi.StatsAPIClient(
+        session=mock_session, cache=MemoryCache(), metrics=metrics
+    )
+
+    client.get("game", {"gamePk": 565997})
+    client.get("game", {"gamePk": 565997})
+    game = metrics.snapshot()["game"]
+
+    assert game["requests"] == 2
+    assert game["statuses"] == {503: 1, 200: 1}
+    assert game["retries"] == 1
+    assert game["bytes"] == 18
+    assert game["decoded"] == 1
+    assert game["latency"]["count"] == 2
+    assert (game["cache_hits"], game["cache_misses"]) == (1, 1)
+    assert [e.kind for e in events] == [
+        "cache",
+        "request",
+        "retry",
+        "request",
+        "response",
+        "decode",
+        "cache",
+    ]
+
+
+def test_prometheus_text():
+    metrics = Metrics(buckets=[0.5])
+    metrics.request("game", 0.25, 200)
+    metrics.request("game", 1.0, None)
+    text = prometheus_text(metrics)
+
+    assert "# TYPE statsapi_request_duration_seconds histogram" in text
+    assert 'statsapi_requests_total{endpoint="game",status="200"} 1' in text
+    assert 'statsapi_requests_total{endpoint="game",status="error"} 1' in text
+    assert (
+        'statsapi_request_duration_seconds_bucket{endpoint="game",le="0.5"} 1' in text
+    )
+    assert (
+        'statsapi_request_duration_seconds_bucket{endpoint="game",le="+Inf"} 2' in text
+    )
+    assert 'statsapi_request_duration_seconds_sum{endpoint="game"} 1.25' in text
+    assert 'statsapi_cache_lookups_total{endpoint="game",result="miss"} 0' in text
@@ -0,0 +1,104 @@
+import asyncio
+import requests
+import statsapi
+from statsapi.ratelimit import RateLimiter, RetryPolicy, TokenBucket, parse_retry_after
+from tests.helpers import response
+
+
+def test_token_bucket_allows_burst_then_waits():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.09 < bucket.reserve() <= 0.1
+    assert 0.19 < bucket.reserve() <= 0.2
+
+
+def test_endpoint_rate_applies_on_top_of_global_rate():
+    limiter = RateLimiter(rate=100, endpoint_rates={"game": 1})
+
+    assert limiter.reserve("game") == 0
+    assert limiter.reserve("schedule") == 0
+    assert limiter.reserve("game") > 0.9
+    assert limiter.stats()["delayed"] == 1
+
+
+def test_limiter_adapts_to_throttling_and_recovers():
+    limiter = RateLimiter(rate=10, decrease=0.5, increase=0.25)
+    limiter.record("game", 429)
+    limiter.record("game", 503)
+
+    assert limiter.rate == 2.5
+    assert limiter.stats()["throttled"] == 1
+    assert limiter.stats()["server_errors"] == 1
+
+    for _ in range(5):
+        limiter.record("game", 200)
+
+    assert limiter.rate == 10
+
+
+def test_async_acquire():
+    limiter = RateLimiter(rate=1000, burst=1)
+
+    async def run():
+        await asyncio.gather(*(limiter.acquire_async("game") for _ in range(3)))
+
+    asyncio.run(run())
+    assert limiter.stats()["requests"] == 3
+
+
+def test_retry_honors_retry_after(mocker):
+    sleep = mocker.patch("statsapi.client.time.sleep")
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = [
+        response({"status": 429}, 429, {"Retry-After": "2"}),
+        response({"status": 200}),
+    ]
+    limiter = RateLimiter(rate=1000)
+    client = statsapi.StatsAPIClient(session=mock_session, rate_limiter=limiter)
+
+    assert client.get("game", {"gamePk": 565997}) == {"status": 200}
+    sleep.assert_called_once_with(2.0)
+    assert client.retry.stats()["retries"] == 1
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_retry_backs_off_on_connection_errors(mocker):
+    sleep = mocker.patch("statsapi.client.time.sleep")
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = requests.ConnectionError("reset")
+    client = statsapi.StatsAPIClient(
+        session=mock_session, retry=RetryPolicy(max_retries=3, backoff=1, jitter=False)
+    )
+
+    try:
+        client.get("game", {"gamePk": 565997})
+        assert False, "ConnectionError not raised"
+    except requests.ConnectionError:
+        pass
+
+    assert mock_session.get.call_count == 4
+    assert [c.args[0] for c in sleep.call_args_list] == [1, 2, 4]
+
+
+def test_retry_can_be_disabled(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.return_value = response({"status": 503}, 503)
+    mock_session.get.return_value.raise_for_status.side_effect = requests.HTTPError
+    client = statsapi.StatsAPIClient(session=mock_session, retry=False)
+
+    try:
+        client.get("game", {"gamePk": 565997})
+        assert False, "HTTPError not raised"
+    except requests.HTTPError:
+        pass
+
+    assert mock_session.get.call_count == 1
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("5") == 5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,107 @@
+import copy
+import json
+import pytest
+import statsapi
+from statsapi import parsers, render
+from tests.test_aio import fake_linescore
+from tests.test_boxscore import fake_game
+
+
+def boxscore_data(compact=False):
+    game = fake_game()
+    teams = game["liveData"]["boxscore"]["teams"]
+    teams["away"]["info"] = [
+        {"title": "BATTING", "fieldList": [{"label": "2B", "value": "P1 <2>."}]}
+    ]
+    teams["home"]["info"] = []
+    game["liveData"]["boxscore"]["info"] = [
+        {"label": "Umpires", "value": "HP: " + "Joe West, " * 20},
+        {"label": "July 21, 2019"},
+    ]
+    return parsers.parse_boxscore_data(game, compact)
+
+
+def test_text_linescore_is_unchanged():
+    r = fake_linescore()
+    r["liveData"]["linescore"]["innings"] = r["liveData"]["linescore"]["innings"][:5]
+
+    assert render.linescore(r) == (
+        "Final    1 2 3 4 5 6 7 8 9  R   H   E  \n"
+        "Mets     0 0 0 0 0          0   4   1  \n"
+        "Phillies 1 1 1 1 1          9   12  0  "
+    )
+    assert parsers.parse_linescore(r) == render.linescore(r)
+
+
+def test_text_boxscore_leaves_data_untouched():
+    boxData = boxscore_data()
+    before = copy.deepcopy(boxData)
+    text = render.boxscore(boxData)
+
+    assert boxData == before
+    assert render.boxscore(boxData) == text
+    assert render.boxscore(boxscore_data(compact=True)) == text
+    lines = text.splitlines()
+    assert lines[1].startswith("Mets Batters")
+    assert "P1 <2>." in text
+    assert lines[-3].startswith("    West, Joe West,")
+    assert len(lines[-2]) == render.FULL_ROW_LEN
+
+
+def test_table_formats():
+    boxData = boxscore_data()
+
+    markdown = render.boxscore(boxData, "markdown", gameInfo=False)
+    assert markdown.startswith("**Mets Batters**\n\n|  | AB | R | H |")
+    assert "| 1 P1  SS | 1 | 1 | 1 |" in markdown
+
+    html = render.boxscore(boxData, "html")
+    assert "<caption>Mets Pitchers</caption>" in html
+    assert "P1 &lt;2&gt;." in html
+
+    tables = json.loads(render.boxscore(boxData, "json", pitchingBox=False))
+    assert [t["title"] for t in tables] == [
+        "Mets Batters",
+        "Mets",
+        "Phillies Batters",
+        "Game Info",
+    ]
+    assert tables[0]["rows"][-1]["AB"] == "3"
+    assert tables[0]["notes"] == ["a-Singled for Smith in the 8th."]
+
+    with pytest.raises(ValueError):
+        render.roster([], "csv")
+
+
+def test_client_renders_in_requested_format(mocker):
+    client = statsapi.StatsAPIClient()
+    mocker.patch.object(
+        client,
+        "get",
+        return_value={
+            "roster": [
+                {
+                    "jerseyNumber": "20",
+                    "position": {"abbreviation": "1B"},
+                    "person": {"fullName": "Pete Alonso"},
+                }
+            ]
+        },
+    )
+
+    assert client.roster(121) == "#20  1B  Pete Alonso\n"
+    assert client.roster(121, format="markdown") == (
+        "| # | Pos | Name |\n|---|---|---|\n| 20 | 1B | Pete Alonso |\n"
+    )
+
+
+def test_module_functions_pass_format(mocker):
+    client = mocker.Mock()
+    mocker.patch("statsapi.client._default_client", client)
+
+    statsapi.linescore(565997, format="html")
+    client.linescore.assert_called_with(565997, None, format="html")
+    statsapi.roster(121, format="json")
+    assert client.roster.call_args.kwargs == {"format": "json"}
+    statsapi.standings()
+    assert client.standings.call_args.kwargs == {"format": "text"}
@@ -0,0 +1,55 @@
+from statsapi.scheduler import PollScheduler, game_state
+
+
+def feed(timecode, abstract="Live", detailed="In Progress", inning_state="Top"):
+    return {
+        "metaData": {"timeStamp": timecode},
+        "gameData": {
+            "status": {"abstractGameState": abstract, "detailedState": detailed}
+        },
+        "liveData": {"linescore": {"inningState": inning_state}},
+    }
+
+
+def test_game_state():
+    assert game_state(feed("1", "Preview", "Scheduled")) == "scheduled"
+    assert game_state(feed("1", "Preview", "Warmup")) == "pregame"
+    assert game_state(feed("1")) == "live"
+    assert game_state(feed("1", inning_state="Middle")) == "break"
+    assert game_state(feed("1", detailed="Delayed: Rain")) == "delayed"
+    assert game_state(feed("1", "Preview", "Postponed")) == "final"
+    assert game_state(feed("1", "Final", "Final")) == "final"
+
+
+def test_scheduler_adapts_intervals_to_state_and_change_rate(mocker):
+    now = [0.0]
+    feeds = {
+        1: iter(
+            [feed("a")] * 5
+            + [feed("b", inning_state="End"), feed("c", "Final", "Final")]
+        ),
+        2: iter([feed("x", detailed="Delayed: Rain")] * 2 + [feed("y")] * 10),
+    }
+    updates = []
+    scheduler = PollScheduler(
+        client=mocker.Mock(),
+        poll=lambda gamePk: next(feeds[gamePk]),
+        on_update=lambda gamePk, data: updates.append((now[0], gamePk)),
+        clock=lambda: now[0],
+        sleep=lambda seconds: now.__setitem__(0, now[0] + seconds),
+    )
+    scheduler.add(1)
+    scheduler.add(2)
+
+    assert scheduler.run_pending() == [1, 2]
+    assert scheduler.games[1].interval == 10
+    assert scheduler.games[2].interval == 300
+
+    scheduler.run(until=1000)
+    # Game 1 slowed down while unchanged (polled at 10, 20, 30, 45 and 67.5
+    # seconds), then went from a break to final and stopped being polled
+    assert [t for t, gamePk in updates if gamePk == 1] == [0, 67.5, 97.5]
+    assert 1 not in scheduler.games
+    assert scheduler.games[2].state == "live"
+    stats = scheduler.stats()
+    assert (stats["finished"], stats["games"], stats["states"]) == (1, 1, {"live": 1})
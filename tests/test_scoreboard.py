@@ -0,0 +1,54 @@
+import statsapi
+from statsapi.cache import MemoryCache
+from statsapi.scoreboard import Scoreboard
+from tests.helpers import response
+
+
+def fake_get(changes):
+    def get(url, **kwargs):
+        if "/game/changes" in url:
+            body = {"dates": [{"games": [{"gamePk": pk} for pk in changes.pop(0)]}]}
+        else:
+            gamePk = int(url.split("/game/")[1].split("/")[0])
+            if gamePk == 3:
+                raise statsapi.client.requests.ConnectionError("reset")
+            body = {"gamePk": gamePk, "version": len(changes)}
+
+        return response(body)
+
+    return get
+
+
+def test_scoreboard_refreshes_only_changed_games(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = fake_get([[2, 99], []])
+    client = statsapi.StatsAPIClient(
+        session=mock_session, cache=MemoryCache(), retry=False
+    )
+    board = Scoreboard([1, 2, 3], client=client)
+
+    first = board.poll()
+    assert sorted(first.refreshed) == [1, 2]
+    assert list(first.errors) == [3]
+    assert board.games[2]["version"] == 2
+
+    second = board.poll()
+    urls = [c[0][0] for c in mock_session.get.call_args_list]
+    assert [u for u in urls if "/game/changes" in u][0].count("updatedSince=") == 1
+    # Game 2 changed; game 3 failed last cycle; game 99 is not tracked
+    assert second.changed == 2
+    assert second.refreshed == [2]
+    assert board.games[2]["version"] == 1
+
+    third = board.poll()
+    assert (third.changed, third.refreshed) == (1, [])
+    assert board.stats()["cycles"] == 3
+
+
+def test_scoreboard_tracking_every_game(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = fake_get([[5, 6]])
+    board = Scoreboard(client=statsapi.StatsAPIClient(session=mock_session))
+
+    assert sorted(board.poll().refreshed) == [5, 6]
+    assert board.tracked == {5, 6}
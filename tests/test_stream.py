@@ -0,0 +1,81 @@
+import json
+import pytest
+import requests
+import responses
+import statsapi
+from statsapi.sessions import SessionPool
+from statsapi.stream import PLAYS_PATH, iter_array
+
+FEED = {
+    "gamePk": 565997,
+    "gameData": {"teams": {"away": {"name": 'The "}]{[" Club \\'}}, "flags": [1, []]},
+    "liveData": {
+        "plays": {
+            "allPlays": [
+                {
+                    "about": {"atBatIndex": 0, "inning": 1},
+                    "result": {"description": 'Ohtani é \\" singles [to right].'},
+                    "playEvents": [
+                        {"isPitch": True, "pitchNumber": 1},
+                        {"isPitch": False, "details": {"event": "Mound Visit"}},
+                        {"isPitch": True, "pitchNumber": 2},
+                    ],
+                    "atBatIndex": 0,
+                },
+                {"about": {"atBatIndex": 1}, "playEvents": [], "atBatIndex": 1},
+            ],
+            "currentPlay": None,
+        },
+        "boxscore": {"teams": {}, "info": [-1.5e3, True, False, None, "x"]},
+    },
+}
+
+
+def chunked(body, size):
+    return (body[i : i + size] for i in range(0, len(body), size))
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_iter_array_matches_full_decode(size):
+    body = json.dumps(FEED, indent=1, ensure_ascii=False).encode()
+
+    plays = list(iter_array(chunked(body, size), PLAYS_PATH))
+
+    assert plays == FEED["liveData"]["plays"]["allPlays"]
+
+
+def test_iter_array_missing_or_truncated():
+    body = json.dumps(FEED).encode()
+
+    assert list(iter_array([body], ("liveData", "missing"))) == []
+    assert list(iter_array([body], ("gamePk", "plays"))) == []
+    with pytest.raises(ValueError):
+        list(iter_array([body[: len(body) // 2]], PLAYS_PATH))
+
+
+@responses.activate
+def test_client_iter_plays_and_pitches():
+    url = statsapi.BASE_URL + "v1.1/game/565997/feed/live"
+    responses.add(responses.GET, url, body=json.dumps(FEED))
+    client = statsapi.StatsAPIClient(pool=SessionPool())
+
+    plays = list(client.iter_plays(565997, chunk_size=16))
+    pitches = list(client.iter_pitches(565997))
+
+    assert [p["atBatIndex"] for p in plays] == [0, 1]
+    assert [(p["atBatIndex"], p["pitchNumber"]) for p in pitches] == [(0, 1), (0, 2)]
+
+
+@responses.activate
+def test_client_iter_plays_raises_unless_ok():
+    url = statsapi.BASE_URL + "v1.1/game/565997/feed/live"
+    responses.add(responses.GET, url, status=204)
+    responses.add(responses.GET, url, status=500)
+    client = statsapi.StatsAPIClient(
+        pool=SessionPool(), request_kwargs={"stream": False}, retry=False
+    )
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            list(client.iter_plays(565997))
+    assert [c.response.status_code for c in responses.calls] == [204, 500]
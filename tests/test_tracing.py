@@ -0,0 +1,93 @@
+import asyncio
+import pytest
+import statsapi
+from statsapi.ratelimit import RateLimiter
+from statsapi.tracing import CallTree, Tracer, current_span
+from tests.helpers import response
+
+
+def test_call_tree_shows_nested_calls_and_phases(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.side_effect = [
+        response(b'{"seasons": [{"seasonId": "2023"}]}'),
+        response(b'{"people": [{"id": 1, "fullName": "Juan Soto"}]}'),
+    ]
+    tree = CallTree()
+    client = statsapi.StatsAPIClient(session=mock_session, tracer=tree)
+
+    assert client.lookup_player("soto") == [{"id": 1, "fullName": "Juan Soto"}]
+    assert tree.format().split("\n")[1].startswith("  call latest_season ")
+    outline = [
+        (span["depth"], span["phase"], span["name"]) for span in _walk(tree.roots[0])
+    ]
+    assert outline == [
+        (0, "call", "lookup_player"),
+        (1, "call", "latest_season"),
+        (2, "call", "get"),
+        (3, "network", "season"),
+        (3, "decode", "season"),
+        (2, "transform", "latest_season"),
+        (1, "call", "get"),
+        (2, "network", "sports_players"),
+        (2, "decode", "sports_players"),
+        (1, "transform", "lookup_player"),
+    ]
+    assert tree.roots[0]["attributes"]["args"] == ("soto",)
+    assert sum(tree.totals().values()) == pytest.approx(tree.roots[0]["duration"])
+    assert current_span() is None
+
+
+def test_tracer_callbacks_record_errors(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.return_value = response(b'{"sports": []}')
+    started, ended = [], []
+    client = statsapi.StatsAPIClient(
+        session=mock_session, tracer=Tracer(started.append, ended.append)
+    )
+
+    with pytest.raises(ValueError):
+        client.game_pace_data(2023)
+
+    assert [s["phase"] for s in started] == ["call", "call", "network", "decode"]
+    assert isinstance(ended[-1]["error"], ValueError)
+    assert ended[-1]["name"] == "game_pace_data"
+
+
+def test_spans_follow_requests_into_worker_threads(mocker):
+    mock_session = mocker.Mock()
+    mock_session.get.return_value = response(b"{}")
+    tree = CallTree()
+    client = statsapi.StatsAPIClient(
+        session=mock_session, tracer=tree, rate_limiter=RateLimiter(rate=1000)
+    )
+
+    with tree.span("batch", "call"):
+        assert len(list(client.get_many("game", [{"gamePk": 1}, {"gamePk": 2}]))) == 2
+    assert [
+        [s["phase"] for s in _walk(child)] for child in tree.roots[0]["children"]
+    ] == [["call", "network", "decode"]] * 2
+
+    async def main():
+        async with statsapi.AsyncStatsAPIClient(client) as aclient:
+            return await aclient.game_scoring_play_data(565997)
+
+    mock_session.get.return_value = response(
+        b'{"gameData": {"teams": {"home": {}, "away": {}}}, '
+        b'"liveData": {"plays": {"allPlays": [], "scoringPlays": []}}}',
+    )
+    asyncio.run(main())
+    outline = [(s["depth"], s["phase"], s["name"]) for s in _walk(tree.roots[1])]
+    assert outline == [
+        (0, "call", "game_scoring_play_data"),
+        (1, "call", "get"),
+        (2, "network", "game"),
+        (2, "decode", "game"),
+        (1, "transform", "game_scoring_play_data"),
+    ]
+    client.close()
+
+
+def _walk(span):
+    yield span
+    for child in span["children"]:
+        yield from _walk(child)
@@ -0,0 +1,58 @@
+import json
+import pytest
+import responses
+import statsapi
+from statsapi.sessions import SessionPool
+from statsapi.transport import LatencyTransport, RecordingTransport, ReplayTransport
+from tests.test_aio import fake_linescore
+
+URL = statsapi.BASE_URL + "v1.1/game/565997/feed/live"
+
+
+@responses.activate
+def test_record_then_replay(tmp_path):
+    archive = str(tmp_path / "games.jsonl.gz")
+    responses.add(responses.GET, URL, json=fake_linescore())
+    recorder = RecordingTransport(archive, statsapi.transport.RequestsTransport())
+    with statsapi.StatsAPIClient(pool=SessionPool(), transport=recorder) as client:
+        live = client.linescore(565997)
+        client.get("game", {"gamePk": 565997, "fields": "gamePk"})
+
+    responses.reset()
+    replay = ReplayTransport(archive)
+    offline = statsapi.StatsAPIClient(transport=replay)
+
+    assert len(replay) == 2
+    assert offline.linescore(565997) == live
+    # Query parameter order does not matter
+    assert offline.transport.get(URL + "?fields=gamePk") is not None
+    with pytest.raises(LookupError):
+        offline.get("game", {"gamePk": 1})
+
+
+def test_replay_serves_repeated_urls_in_order(tmp_path):
+    archive = str(tmp_path / "games.jsonl.gz")
+    fake = statsapi.transport.Transport()
+    bodies = iter([{"n": 1}, {"n": 2}])
+    fake.get = lambda url, **kwargs: statsapi.transport._response(
+        url, {"status": 200, "headers": {}, "text": json.dumps(next(bodies))}
+    )
+    recorder = RecordingTransport(archive, fake)
+    recorder.get(URL)
+    recorder.get(URL)
+    recorder.close()
+
+    replay = ReplayTransport(archive)
+    assert [replay.get(URL).json()["n"] for _ in range(3)] == [1, 2, 2]
+    replay.rewind()
+    assert replay.get(URL).json()["n"] == 1
+
+
+def test_latency_transport(mocker):
+    sleep = mocker.patch("statsapi.transport.time.sleep")
+    inner = mocker.Mock()
+    inner.get.return_value.content = b"x" * 1000
+    transport = LatencyTransport(inner, latency=0.5, bandwidth=1000)
+
+    assert transport.get(URL) is inner.get.return_value
+    assert 1.4 < sleep.call_args[0][0] <= 1.5